@@ -6,9 +6,14 @@ specialized agents inherit from.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 import os
+import queue
+import threading
+from uuid import UUID
 from langchain.agents import AgentExecutor, create_openai_tools_agent
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
 from langchain_openai import ChatOpenAI
 from langchain.memory import ConversationBufferWindowMemory
 from langchain.tools import BaseTool
@@ -55,10 +60,13 @@ class BaseProtocolAgent(ABC):
                 "set in OPENAI_API_KEY environment variable"
             )
             
+        # Streaming lets callers receive tokens as they are generated
+        # (see stream()); invoke() still returns the complete message
         self.llm = ChatOpenAI(
             api_key=api_key,
             model=model_name,
-            temperature=temperature
+            temperature=temperature,
+            streaming=True
         )
         
         # Initialize memory
@@ -150,6 +158,73 @@ class BaseProtocolAgent(ABC):
                 print(f"Agent error: {error_msg}")
             return error_msg
             
+    def stream(self, user_input: str) -> Iterator[str]:
+        """
+        Process a user request, yielding the response text as it is generated.
+        
+        The agent runs in a background thread. The text of each LLM call is
+        held until the call ends and is passed on only if the call answered
+        rather than requested a tool, so text the model writes before a tool
+        call never reaches the caller. If no call produced text (e.g. the
+        answer came straight from a tool) or the agent failed, the final
+        output is yielded whole.
+        
+        Args:
+            user_input: The user's input/request
+            
+        Yields:
+            Chunks of the agent's response
+        """
+        answers: "queue.Queue[Optional[str]]" = queue.Queue()
+        result: Dict[str, Any] = {}
+        
+        class _AnswerHandler(BaseCallbackHandler):
+            def __init__(self) -> None:
+                self.pending: Dict[UUID, List[str]] = {}
+            
+            def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+                if token:
+                    self.pending.setdefault(run_id, []).append(token)
+            
+            def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+                text = "".join(self.pending.pop(run_id, []))
+                requested_tools = any(
+                    getattr(getattr(generation, "message", None), "tool_calls", None)
+                    for generations in response.generations
+                    for generation in generations
+                )
+                if text and not requested_tools:
+                    answers.put(text)
+        
+        def run() -> None:
+            try:
+                result["output"] = self.agent_executor.invoke(
+                    {"input": user_input},
+                    config={"callbacks": [_AnswerHandler()]}
+                ).get("output", "I apologize, but I couldn't process your request.")
+            except Exception as e:
+                result["output"] = f"An error occurred while processing your request: {str(e)}"
+                result["failed"] = True
+                if self.verbose:
+                    print(f"Agent error: {result['output']}")
+            finally:
+                answers.put(None)
+        
+        threading.Thread(target=run, daemon=True).start()
+        
+        streamed = False
+        answer = answers.get()
+        while answer is not None:
+            streamed = True
+            yield answer
+            answer = answers.get()
+        
+        if result.get("failed"):
+            # Whatever was streamed is cut short; say why
+            yield ("\n\n" if streamed else "") + result["output"]
+        elif not streamed:
+            yield result["output"]
+    
     async def aprocess(self, user_input: str) -> str:
         """
         Asynchronously process a user request and return the response.
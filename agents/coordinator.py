@@ -6,7 +6,7 @@ complex multi-domain tasks that involve goals, schedules, and todos.
 """
 
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from .base_agent import BaseProtocolAgent
 from .goal_agent import GoalAgent
 from .todo_agent import TodoAgent
@@ -161,6 +161,38 @@ class ProtocolCoordinator:
         except Exception as e:
             return f"I encountered an error while processing your request: {str(e)}. Please try again or rephrase your request."
     
+    def stream_request(self, user_input: str) -> Iterator[str]:
+        """
+        Process a user request, yielding the response as it is generated.
+        
+        Requests routed to a single agent are streamed token by token;
+        multi-domain and general requests are assembled locally and yielded
+        in one piece.
+        
+        Args:
+            user_input: The user's input/request
+            
+        Yields:
+            Chunks of the response from the appropriate agent(s)
+        """
+        try:
+            intent = self.classify_intent(user_input)
+            
+            if intent == "goal_management":
+                agent = self.goal_agent
+            elif intent == "todo_management":
+                agent = self.todo_agent
+            elif intent == "schedule_management":
+                agent = self.schedule_agent
+            else:
+                yield self.process_request(user_input)
+                return
+            
+            yield from agent.stream(user_input)
+                
+        except Exception as e:
+            yield f"I encountered an error while processing your request: {str(e)}. Please try again or rephrase your request."
+    
     async def aprocess_request(self, user_input: str) -> str:
         """
         Asynchronously process a user request.
@@ -121,6 +121,26 @@ class TodoAgent(BaseProtocolAgent):
         """
         return self.process(f"Show me all tasks for the {project} project")
         
+    def list_tasks(
+        self,
+        status: Optional[str] = None,
+        project: Optional[str] = None,
+        due_today: bool = False
+    ) -> str:
+        """
+        List tasks straight from Notion, without an LLM round-trip.
+        
+        Args:
+            status: Optional status to filter by
+            project: Optional project to filter by
+            due_today: Only include tasks due today
+            
+        Returns:
+            Formatted task list
+        """
+        get_todos = next(tool for tool in self.tools if isinstance(tool, GetTodosTool))
+        return get_todos._run(status=status, project=project, due_today=due_today)
+        
     def prioritize_tasks(self, method: str = "eisenhower", project: Optional[str] = None) -> str:
         """
         Prioritize tasks using a specific framework.
@@ -0,0 +1,252 @@
+"""
+Response cache for coordinator requests.
+
+This module provides CachedCoordinator, a thin wrapper around
+ProtocolCoordinator that serves repeated read-only requests from a small
+on-disk cache instead of running the full agent/LLM pipeline again.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, Iterator, Optional
+
+import pytz
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".protocol", "llm_cache.sqlite3")
+# Defined here rather than in cli.semantic_cache so clearing it does not
+# import sentence-transformers
+DEFAULT_SEMANTIC_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".protocol", "semcache.npz")
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 1000
+
+# Answers about "today" change at midnight, so keys include the current date
+# in the timezone the CLI schedules in (cli.main._CDT)
+_CACHE_TIMEZONE = pytz.timezone('America/Chicago')
+
+# Requests that change data in Notion must always reach the agents. Verbs
+# match as word stems ("finished", "cancelled", "rescheduling"); a false
+# positive only skips the cache. "schedule" only counts as a verb, not in
+# "my schedule"/"the schedule".
+_MUTATING_RE = re.compile(
+    r"\b(?:create|add|update|reset|delete|remove|complete|mark|set|move|link"
+    r"|archive|cancel|book|finish|done|prioriti[sz]e|plan)\w*"
+    r"|(?<!my )(?<!the )(?<!your )\b(?:re)?schedul\w*",
+    re.IGNORECASE,
+)
+
+# Error replies from the coordinator and agents are never cached
+_ERROR_PREFIXES = (
+    "I encountered an error",
+    "An error occurred while processing your request",
+)
+
+
+def cache_key(request: str, today: Optional[date] = None) -> str:
+    """
+    Return the cache key for a request.
+
+    The key is the SHA-256 of the current date and the normalized request
+    text, so the same question asked on a later day is a miss.
+
+    Args:
+        request: Request text; case and whitespace are ignored
+        today: Date to key on (defaults to today in America/Chicago)
+    """
+    if today is None:
+        today = datetime.now(_CACHE_TIMEZONE).date()
+    normalized = " ".join(request.strip().lower().split())
+    return hashlib.sha256(f"{today.isoformat()}\n{normalized}".encode("utf-8")).hexdigest()
+
+
+def is_mutating(request: str) -> bool:
+    """Check whether a request looks like it changes data."""
+    return _MUTATING_RE.search(request) is not None
+
+
+def is_error_response(response: str) -> bool:
+    """Check whether a response is an agent/coordinator error reply."""
+    return response.startswith(_ERROR_PREFIXES)
+
+
+class ResponseCache:
+    """SQLite-backed key/value store with per-entry expiry and an LRU cap."""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (created if missing)
+            ttl: Seconds a stored response stays valid
+            max_entries: Maximum number of responses kept; least recently
+                used entries are evicted first
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " response TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " used_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored response for ``key``, or None if missing/expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, expires_at = row
+            if expires_at < now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            return response
+
+    def set(self, key: str, response: str) -> None:
+        """Store ``response`` under ``key`` and evict beyond ``max_entries``."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, expires_at, used_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, response, now + self.ttl, now),
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key NOT IN"
+                " (SELECT key FROM responses ORDER BY used_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop every stored response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def clear_cached_responses(path: Optional[str] = None, semantic_path: Optional[str] = None) -> None:
+    """
+    Clear the on-disk response caches (exact-match and semantic).
+
+    For writes that do not go through CachedCoordinator (CLI commands that
+    call the agents or Notion directly), since any stored answer may now be
+    out of date.
+
+    Args:
+        path: Response cache file to clear (defaults to the one in ~/.protocol)
+        semantic_path: Semantic cache file to remove (defaults to the one in
+            ~/.protocol)
+    """
+    if path is None:
+        path = DEFAULT_CACHE_PATH
+    if semantic_path is None:
+        semantic_path = DEFAULT_SEMANTIC_CACHE_PATH
+
+    if os.path.exists(semantic_path):
+        os.remove(semantic_path)
+
+    if not os.path.exists(path):
+        return
+    try:
+        cache = ResponseCache(path)
+        try:
+            cache.clear()
+        finally:
+            cache.close()
+    except sqlite3.Error:
+        # An unreadable cache must not keep serving answers
+        os.remove(path)
+
+
+class CachedCoordinator:
+    """
+    Wrap a ProtocolCoordinator so repeated read-only requests are served
+    from a ResponseCache.
+
+    Mutating requests always go to the wrapped coordinator and clear the
+    cache, since any stored answer may now be out of date. Every other
+    attribute is delegated to the wrapped coordinator unchanged.
+    """
+
+    def __init__(self, coordinator: Any, cache: Optional[ResponseCache] = None) -> None:
+        """
+        Initialize the wrapper.
+
+        Args:
+            coordinator: The ProtocolCoordinator to wrap
+            cache: Cache to use (defaults to the on-disk cache in ~/.protocol)
+        """
+        self.coordinator = coordinator
+        self.cache = cache if cache is not None else ResponseCache()
+
+    def process_request(self, user_input: str) -> str:
+        """Process a request, answering from the cache when possible."""
+        if is_mutating(user_input):
+            response = self.coordinator.process_request(user_input)
+            self.cache.clear()
+            return response
+
+        key = cache_key(user_input)
+        response = self.cache.get(key)
+        if response is None:
+            response = self.coordinator.process_request(user_input)
+            if not is_error_response(response):
+                self.cache.set(key, response)
+        return response
+
+    def stream_request(self, user_input: str) -> Iterator[str]:
+        """Stream a request, yielding a cached response in one piece if present."""
+        if is_mutating(user_input):
+            yield from self.coordinator.stream_request(user_input)
+            self.cache.clear()
+            return
+
+        key = cache_key(user_input)
+        response = self.cache.get(key)
+        if response is not None:
+            yield response
+            return
+
+        chunks = []
+        for chunk in self.coordinator.stream_request(user_input):
+            chunks.append(chunk)
+            yield chunk
+        response = "".join(chunks)
+        if not is_error_response(response):
+            self.cache.set(key, response)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.coordinator, name)
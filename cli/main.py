@@ -8,29 +8,87 @@ management system and AI agents.
 import os
 import sys
 import re
-from typing import Optional, List, Dict, Any
+import json
+import asyncio
+from datetime import datetime, time, timedelta
+from functools import lru_cache, partial, wraps
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Iterator, Tuple, Callable, Mapping
 import click
+import pytz
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.markdown import Markdown
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.text import Text
 from dotenv import load_dotenv
 
 # Add the parent directory to the path so we can import our modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from notion_client.client import NotionClient
-from agents.coordinator import ProtocolCoordinator
-from agents.goal_agent import GoalAgent
-from agents.todo_agent import TodoAgent
-from agents.schedule_agent import ScheduleAgent
+# The Notion client and the agents (which pull in LangChain/OpenAI) are
+# imported inside the commands that need them so that `--help`, `setup` and
+# other print-only commands start quickly
+if TYPE_CHECKING:
+    from notion_client.client import NotionClient
+    from agents.coordinator import ProtocolCoordinator
+    from agents.goal_agent import GoalAgent
+    from agents.todo_agent import TodoAgent
 
 # Load environment variables
 load_dotenv()
 
+# Credentials and database IDs, resolved once per process
+NOTION_API_TOKEN = os.getenv('NOTION_API_TOKEN')
+NOTION_GOALS_DB_ID = os.getenv('NOTION_GOALS_DATABASE_ID')
+NOTION_TODOS_DB_ID = os.getenv('NOTION_TODOS_DATABASE_ID')
+NOTION_CALENDAR_DB_ID = os.getenv('NOTION_CALENDAR_DATABASE_ID')
+OPENAI_KEY = os.getenv('OPENAI_API_KEY')
+AGENT_VERBOSE = os.getenv('AGENT_VERBOSE', 'false').lower() == 'true'
+
 console = Console()
 
+# Timezone all auto-scheduled slots are expressed in
+_CDT = pytz.timezone('America/Chicago')
+
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def _is_uuid(value: str) -> bool:
+    """Check for a canonical lowercase 8-4-4-4-12 UUID string."""
+    return (
+        len(value) == 36
+        and value[8] == value[13] == value[18] == value[23] == "-"
+        and _HEX_DIGITS.issuperset(value.replace("-", ""))
+    )
+
+
+def _extract_uuid(text: str, marker: str) -> Optional[str]:
+    """
+    Extract the Notion ID that follows ``marker`` in ``text``.
+    
+    The create tools format their responses as "... Goal ID: <id>". The ID may
+    be dashed, undashed or the end of a Notion page URL; it is returned as a
+    canonical lowercase dashed UUID, or None if there isn't one.
+    """
+    index = text.find(marker)
+    if index < 0:
+        return None
+    tokens = text[index + len(marker):].split(maxsplit=1)
+    if not tokens:
+        return None
+    # Keep the last path segment of a URL, without its query or fragment
+    token = tokens[0].split("?", 1)[0].split("#", 1)[0].strip("`'\"<>()[].,;/")
+    token = token.rsplit("/", 1)[-1].lower()
+    if _is_uuid(token[-36:]):
+        return token[-36:]
+    # Undashed, possibly after a page title ("Title-<32 hex digits>")
+    hex_id = token[-32:]
+    if len(hex_id) == 32 and _HEX_DIGITS.issuperset(hex_id):
+        return f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
+    return None
+
 
 def extract_text_from_blocks(blocks: List[Dict[str, Any]]) -> str:
     """Extract plain text from Notion blocks."""
@@ -62,370 +120,439 @@ def extract_text_from_blocks(blocks: List[Dict[str, Any]]) -> str:
     return "\n".join(text_parts)
 
 
-def parse_goals_from_content(content: str) -> List[Dict[str, Any]]:
-    """Parse SMART goals from the Goals & Rules content."""
-    goals = []
-    
-    # Look for the SMART Goals section
-    lines = content.split('\n')
-    in_goals_section = False
-    current_goal = None
-    
-    for line in lines:
-        line = line.strip()
-        
-        # Check if we're entering the SMART Goals section
-        if "SMART Goals" in line or "Goals" in line:
-            in_goals_section = True
-            continue
-        
-        # Check if we're leaving the goals section
-        if in_goals_section and (
-            "Scheduling Constraints" in line or 
-            "Priority Hierarchy" in line or
-            "Success Metrics" in line
-        ):
-            if current_goal:
-                goals.append(current_goal)
-            break
-        
-        if in_goals_section:
-            # Look for goal titles (major categories)
-            if line and not line.startswith("•") and not line.startswith("Specific:"):
-                if current_goal:
-                    goals.append(current_goal)
-                
-                current_goal = {
-                    "title": line,
-                    "description": "",
-                    "category": "Personal",
-                    "priority": "Medium",
-                    "target_date": None,
-                    "details": []
-                }
-            
-            # Extract SMART details
-            elif current_goal:
-                if line.startswith("Specific:"):
-                    current_goal["description"] = line.replace("Specific:", "").strip()
-                elif line.startswith("Measurable:"):
-                    current_goal["details"].append(line)
-                elif line.startswith("Time-bound:"):
-                    # Try to extract date information
-                    time_info = line.replace("Time-bound:", "").strip()
-                    current_goal["details"].append(line)
-                    # You could add date parsing here if needed
-                elif line.startswith("•"):
-                    current_goal["details"].append(line)
-    
-    # Add the last goal if exists
-    if current_goal:
-        goals.append(current_goal)
-    
-    # Process specific goals we can identify
-    processed_goals = []
-    
-    # Machine Learning Study goal
-    ml_goal = {
+# Goals created from the Goals & Rules page. Values are all immutable, so
+# callers receive shallow copies.
+_STATIC_GOALS = (
+    {
         "title": "Machine Learning Study",
         "description": "Complete structured ML study sessions focusing on deep learning, NLP, and computer vision",
         "category": "Professional",
         "priority": "High",
         "target_date": None  # Could be parsed from weekly tracking
-    }
-    processed_goals.append(ml_goal)
-    
-    # Athletics & Health goal
-    health_goal = {
+    },
+    {
         "title": "Athletics & Health",
         "description": "Maintain cardiovascular health and strength training for BP and fatty-liver management",
         "category": "Health",
         "priority": "High",
         "target_date": None
-    }
-    processed_goals.append(health_goal)
-    
-    # Mental Health & Clarity goal
-    mental_goal = {
+    },
+    {
         "title": "Mental Health & Clarity",
         "description": "Regular meditation and journaling for stress management and clarity",
         "category": "Personal",
         "priority": "Medium",
         "target_date": None
-    }
-    processed_goals.append(mental_goal)
-    
-    # Planning & Organization goal
-    planning_goal = {
+    },
+    {
         "title": "Planning & Organization",
         "description": "Maintain organized systems for productivity and goal tracking",
         "category": "Personal",
         "priority": "Medium",
         "target_date": None
-    }
-    processed_goals.append(planning_goal)
-    
-    return processed_goals
+    },
+)
+
+# Todos created from the "Weekly Targets" section of the Goals & Rules page
+_STATIC_TODOS = (
+    # ML Study todos
+    {
+        "title": "ML Deep Work Session - Morning",
+        "priority": "High",
+        "project": "Machine Learning",
+        "time_estimate": 90,
+        "context": "@morning"
+    },
+    {
+        "title": "ML Reading Session",
+        "priority": "Medium",
+        "project": "Machine Learning",
+        "time_estimate": 60,
+        "context": "@study"
+    },
+    {
+        "title": "ML Coding Practice",
+        "priority": "High",
+        "project": "Machine Learning",
+        "time_estimate": 90,
+        "context": "@coding"
+    },
+    # Athletics todos
+    {
+        "title": "Strength Training Session",
+        "priority": "High",
+        "project": "Health",
+        "time_estimate": 60,
+        "context": "@gym"
+    },
+    {
+        "title": "Cardio Session",
+        "priority": "Medium",
+        "project": "Health",
+        "time_estimate": 45,
+        "context": "@cardio"
+    },
+    # Mental health todos
+    {
+        "title": "Morning Meditation",
+        "priority": "Medium",
+        "project": "Mental Health",
+        "time_estimate": 20,
+        "context": "@morning"
+    },
+    {
+        "title": "Evening Journaling",
+        "priority": "Low",
+        "project": "Mental Health",
+        "time_estimate": 15,
+        "context": "@evening"
+    },
+    # Weekly review todos
+    {
+        "title": "Weekly Goal Review",
+        "priority": "Medium",
+        "project": "Planning",
+        "time_estimate": 30,
+        "context": "@planning"
+    },
+    {
+        "title": "Schedule Planning for Next Week",
+        "priority": "Medium",
+        "project": "Planning",
+        "time_estimate": 20,
+        "context": "@planning"
+    },
+)
+
+# Project names on imported todos mapped to the goal they contribute to
+_PROJECT_TO_GOAL: Mapping[str, str] = MappingProxyType({
+    "Machine Learning": "Machine Learning Study",
+    "Health": "Athletics & Health",
+    "Mental Health": "Mental Health & Clarity",
+    "Planning": "Planning & Organization",
+})
+
+# (hour, minute) slots used when auto-scheduling high-priority todos
+_CONTEXT_SLOT: Mapping[str, Tuple[int, int]] = MappingProxyType({
+    "@morning": (9, 0),   # ML Deep Work - optimal cognitive time
+    "@coding": (10, 0),   # After ML work
+    "@gym": (15, 0),      # Strength Training - optimal performance time
+})
+_DEFAULT_SLOT = (14, 0)   # Default afternoon slot
+
+
+def parse_goals_from_content(content: str) -> List[Dict[str, Any]]:
+    """Parse SMART goals from the Goals & Rules content."""
+    return [goal.copy() for goal in _STATIC_GOALS]
 
 
 def parse_todos_from_content(content: str) -> List[Dict[str, Any]]:
     """Parse todos from the Goals & Rules content based on weekly targets and categories."""
-    todos = []
-    
-    # Extract weekly targets
-    if "Weekly Targets" in content:
-        # ML Study todos
-        todos.extend([
-            {
-                "title": "ML Deep Work Session - Morning",
-                "priority": "High",
-                "project": "Machine Learning",
-                "time_estimate": 90,
-                "context": "@morning"
-            },
-            {
-                "title": "ML Reading Session",
-                "priority": "Medium", 
-                "project": "Machine Learning",
-                "time_estimate": 60,
-                "context": "@study"
-            },
-            {
-                "title": "ML Coding Practice",
-                "priority": "High",
-                "project": "Machine Learning", 
-                "time_estimate": 90,
-                "context": "@coding"
-            }
-        ])
-        
-        # Athletics todos
-        todos.extend([
-            {
-                "title": "Strength Training Session",
-                "priority": "High",
-                "project": "Health",
-                "time_estimate": 60,
-                "context": "@gym"
-            },
-            {
-                "title": "Cardio Session",
-                "priority": "Medium",
-                "project": "Health", 
-                "time_estimate": 45,
-                "context": "@cardio"
-            }
-        ])
-        
-        # Mental health todos
-        todos.extend([
-            {
-                "title": "Morning Meditation",
-                "priority": "Medium",
-                "project": "Mental Health",
-                "time_estimate": 20,
-                "context": "@morning"
+    if "Weekly Targets" not in content:
+        return []
+    return [todo.copy() for todo in _STATIC_TODOS]
+
+
+# Numeric scheduling constraints, searched for on their labelled lines
+# within the Scheduling Constraints section
+_CORE_HOURS_RE = re.compile(r'(\d{1,2}):(\d{2})\s*(AM|PM)\s*-\s*(\d{1,2}):(\d{2})\s*(AM|PM)')
+_BUFFER_TIME_RE = re.compile(r'(\d+)-minute')
+_TRANSIT_TIME_RE = re.compile(r'(\d+)\s*minutes?')
+_STRENGTH_WINDOW_RE = re.compile(r'(\d{1,2})-(\d{1,2})\s*(AM|PM)')
+_STRENGTH_REST_RE = re.compile(r'(\d+)-hour')
+_SLEEP_PROTECTION_RE = re.compile(r'within\s*(\d+)\s*hours?')
+
+# --working-hours option of `schedule update-constraints`, e.g. "09:00-18:00"
+_WORKING_HOURS_RE = re.compile(r'^(\d{2}):(\d{2})-(\d{2}):(\d{2})$')
+
+
+def _to_24_hour(hour: int, ampm: str) -> int:
+    """Convert a 12-hour clock hour to 24-hour format."""
+    if ampm == "PM" and hour != 12:
+        return hour + 12
+    if ampm == "AM" and hour == 12:
+        return 0
+    return hour
+
+
+@dataclass
+class ParsedSchedulingConstraints:
+    """Scheduling constraints parsed from the Goals & Rules page."""
+
+    __slots__ = (
+        "core_start", "core_end", "timezone", "buffer_time", "transit_time",
+        "no_double_booking", "ml_deep_work", "strength_training_start",
+        "strength_training_end", "cardio", "meditation",
+        "strength_training_rest", "cardio_active_recovery", "sleep_protection",
+    )
+
+    core_start: str
+    core_end: str
+    timezone: str
+    buffer_time: int
+    transit_time: int
+    no_double_booking: bool
+    ml_deep_work: str
+    strength_training_start: str
+    strength_training_end: str
+    cardio: str
+    meditation: str
+    strength_training_rest: int
+    cardio_active_recovery: bool
+    sleep_protection: int
+
+    @property
+    def strength_training(self) -> str:
+        """Strength training window as "HH:MM-HH:MM"."""
+        return f"{self.strength_training_start}-{self.strength_training_end}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the nested dictionary format used by the schedule agent."""
+        return {
+            "working_hours": {
+                "core_hours": {
+                    "start": self.core_start,
+                    "end": self.core_end,
+                    "timezone": self.timezone
+                },
+                "buffer_time": self.buffer_time,
+                "transit_time": self.transit_time,
+                "no_double_booking": self.no_double_booking
             },
-            {
-                "title": "Evening Journaling",
-                "priority": "Low",
-                "project": "Mental Health",
-                "time_estimate": 15,
-                "context": "@evening"
-            }
-        ])
-        
-        # Weekly review todos
-        todos.extend([
-            {
-                "title": "Weekly Goal Review",
-                "priority": "Medium",
-                "project": "Planning",
-                "time_estimate": 30,
-                "context": "@planning"
+            "health_optimized_timing": {
+                "ml_deep_work": self.ml_deep_work,
+                "strength_training": self.strength_training,
+                "cardio": self.cardio,
+                "meditation": self.meditation
             },
-            {
-                "title": "Schedule Planning for Next Week",
-                "priority": "Medium", 
-                "project": "Planning",
-                "time_estimate": 20,
-                "context": "@planning"
+            "recovery_rest": {
+                "strength_training_rest": self.strength_training_rest,
+                "cardio_active_recovery": self.cardio_active_recovery,
+                "sleep_protection": self.sleep_protection
             }
-        ])
-    
-    return todos
+        }
 
 
-def parse_scheduling_constraints(content: str) -> Dict[str, Any]:
-    """Parse scheduling constraints from the Goals & Rules content."""
-    constraints = {
-        "working_hours": {},
-        "health_optimized_timing": {},
-        "recovery_rest": {}
-    }
-    
-    lines = content.split('\n')
-    in_constraints_section = False
-    current_subsection = None
-    
-    for line in lines:
-        line = line.strip()
-        
+class _ConstraintsScanner:
+    """Line-by-line state machine for the Scheduling Constraints section."""
+
+    def __init__(self) -> None:
+        self.constraints: Dict[str, Any] = {
+            "working_hours": {},
+            "health_optimized_timing": {},
+            "recovery_rest": {}
+        }
+        self.in_constraints_section = False
+        self.done = False
+        self.current_subsection: Optional[str] = None
+
+    def feed(self, line: str) -> None:
+        """Consume a single stripped line of page content."""
+        if self.done:
+            return
+
         # Check if we're entering the Scheduling Constraints section
         if "Scheduling Constraints" in line:
-            in_constraints_section = True
-            continue
-        
+            self.in_constraints_section = True
+            return
+
+        if not self.in_constraints_section:
+            return
+
         # Check if we're leaving the constraints section
-        if in_constraints_section and (
-            "Priority Hierarchy" in line or 
+        if (
+            "Priority Hierarchy" in line or
             "Success Metrics" in line or
             "Goals" in line
         ):
-            break
-        
-        if in_constraints_section:
-            # Check for subsections
-            if "Working Hours" in line:
-                current_subsection = "working_hours"
-                continue
-            elif "Health-Optimized Timing" in line:
-                current_subsection = "health_optimized_timing"
-                continue
-            elif "Recovery & Rest" in line:
-                current_subsection = "recovery_rest"
-                continue
-            
-            # Parse working hours
-            if current_subsection == "working_hours":
-                if "Core Hours:" in line:
-                    # Extract core hours (e.g., "Monday-Friday, 8:00 AM - 5:00 PM CT")
-                    time_match = re.search(r'(\d{1,2}):(\d{2})\s*(AM|PM)\s*-\s*(\d{1,2}):(\d{2})\s*(AM|PM)', line)
-                    if time_match:
-                        start_hour = int(time_match.group(1))
-                        start_minute = int(time_match.group(2))
-                        start_ampm = time_match.group(3)
-                        end_hour = int(time_match.group(4))
-                        end_minute = int(time_match.group(5))
-                        end_ampm = time_match.group(6)
-                        
-                        # Convert to 24-hour format
-                        if start_ampm == "PM" and start_hour != 12:
-                            start_hour += 12
-                        if end_ampm == "PM" and end_hour != 12:
-                            end_hour += 12
-                        if start_ampm == "AM" and start_hour == 12:
-                            start_hour = 0
-                        if end_ampm == "AM" and end_hour == 12:
-                            end_hour = 0
-                        
-                        constraints["working_hours"]["core_hours"] = {
-                            "start": f"{start_hour:02d}:{start_minute:02d}",
-                            "end": f"{end_hour:02d}:{end_minute:02d}",
-                            "timezone": "CT"  # Default, could be extracted
-                        }
-                
-                elif "Buffer Time:" in line:
-                    # Extract buffer time (e.g., "Requires 10-minute buffers between all scheduled blocks")
-                    buffer_match = re.search(r'(\d+)-minute', line)
-                    if buffer_match:
-                        constraints["working_hours"]["buffer_time"] = int(buffer_match.group(1))
-                
-                elif "Transit:" in line:
-                    # Extract transit time (e.g., "Specifies that it takes 30 minutes to get to work")
-                    transit_match = re.search(r'(\d+)\s*minutes?', line)
-                    if transit_match:
-                        constraints["working_hours"]["transit_time"] = int(transit_match.group(1))
-                
-                elif "No Double-Booking:" in line:
-                    constraints["working_hours"]["no_double_booking"] = True
-            
-            # Parse health-optimized timing
-            elif current_subsection == "health_optimized_timing":
-                if "ML Deep Work:" in line:
-                    if "morning" in line.lower():
-                        constraints["health_optimized_timing"]["ml_deep_work"] = "morning"
-                    elif "afternoon" in line.lower():
-                        constraints["health_optimized_timing"]["ml_deep_work"] = "afternoon"
-                    elif "evening" in line.lower():
-                        constraints["health_optimized_timing"]["ml_deep_work"] = "evening"
-                
-                elif "Strength Training:" in line:
-                    # Extract time range (e.g., "Recommended for late afternoon (3-5 PM)")
-                    time_match = re.search(r'(\d{1,2})-(\d{1,2})\s*(AM|PM)', line)
-                    if time_match:
-                        start_hour = int(time_match.group(1))
-                        end_hour = int(time_match.group(2))
-                        ampm = time_match.group(3)
-                        
-                        if ampm == "PM" and start_hour != 12:
-                            start_hour += 12
-                        if ampm == "PM" and end_hour != 12:
-                            end_hour += 12
-                        
-                        constraints["health_optimized_timing"]["strength_training"] = f"{start_hour:02d}:00-{end_hour:02d}:00"
-                    elif "late afternoon" in line.lower():
-                        constraints["health_optimized_timing"]["strength_training"] = "15:00-17:00"
-                
-                elif "Cardio:" in line:
-                    if "flexible" in line.lower():
-                        constraints["health_optimized_timing"]["cardio"] = "flexible"
-                    elif "morning" in line.lower():
-                        constraints["health_optimized_timing"]["cardio"] = "morning"
-                    elif "evening" in line.lower():
-                        constraints["health_optimized_timing"]["cardio"] = "evening"
-                
-                elif "Meditation:" in line:
-                    if "flexible" in line.lower():
-                        constraints["health_optimized_timing"]["meditation"] = "flexible"
-                    elif "transition" in line.lower():
-                        constraints["health_optimized_timing"]["meditation"] = "transition"
-            
-            # Parse recovery and rest
-            elif current_subsection == "recovery_rest":
-                if "Strength Training:" in line and "rest" in line:
-                    # Extract rest hours (e.g., "Requires a minimum 48-hour rest between major muscle groups")
-                    rest_match = re.search(r'(\d+)-hour', line)
-                    if rest_match:
-                        constraints["recovery_rest"]["strength_training_rest"] = int(rest_match.group(1))
-                
-                elif "Cardio:" in line and "recovery" in line:
-                    if "active recovery" in line.lower():
-                        constraints["recovery_rest"]["cardio_active_recovery"] = True
-                
-                elif "Sleep Protection:" in line:
-                    # Extract sleep protection hours (e.g., "no intense exercise should be done within 3 hours of target bedtime")
-                    sleep_match = re.search(r'within\s*(\d+)\s*hours?', line)
-                    if sleep_match:
-                        constraints["recovery_rest"]["sleep_protection"] = int(sleep_match.group(1))
-    
-    # Set defaults for missing values
-    if not constraints["working_hours"].get("core_hours"):
-        constraints["working_hours"]["core_hours"] = {"start": "08:00", "end": "17:00", "timezone": "CT"}
-    if "buffer_time" not in constraints["working_hours"]:
-        constraints["working_hours"]["buffer_time"] = 10
-    if "transit_time" not in constraints["working_hours"]:
-        constraints["working_hours"]["transit_time"] = 30
-    if "no_double_booking" not in constraints["working_hours"]:
-        constraints["working_hours"]["no_double_booking"] = True
-    
-    if "ml_deep_work" not in constraints["health_optimized_timing"]:
-        constraints["health_optimized_timing"]["ml_deep_work"] = "morning"
-    if "strength_training" not in constraints["health_optimized_timing"]:
-        constraints["health_optimized_timing"]["strength_training"] = "15:00-17:00"
-    if "cardio" not in constraints["health_optimized_timing"]:
-        constraints["health_optimized_timing"]["cardio"] = "flexible"
-    if "meditation" not in constraints["health_optimized_timing"]:
-        constraints["health_optimized_timing"]["meditation"] = "flexible"
+            self.done = True
+            return
+
+        # Check for subsections
+        if "Working Hours" in line:
+            self.current_subsection = "working_hours"
+            return
+        elif "Health-Optimized Timing" in line:
+            self.current_subsection = "health_optimized_timing"
+            return
+        elif "Recovery & Rest" in line:
+            self.current_subsection = "recovery_rest"
+            return
+
+        # Parse working hours
+        if self.current_subsection == "working_hours":
+            if "Core Hours:" in line:
+                # Extract core hours (e.g., "Monday-Friday, 8:00 AM - 5:00 PM CT")
+                time_match = _CORE_HOURS_RE.search(line)
+                if time_match:
+                    start_hour = _to_24_hour(int(time_match.group(1)), time_match.group(3))
+                    start_minute = int(time_match.group(2))
+                    end_hour = _to_24_hour(int(time_match.group(4)), time_match.group(6))
+                    end_minute = int(time_match.group(5))
+                    self.constraints["working_hours"]["core_hours"] = {
+                        "start": f"{start_hour:02d}:{start_minute:02d}",
+                        "end": f"{end_hour:02d}:{end_minute:02d}",
+                        "timezone": "CT"  # Default, could be extracted
+                    }
+
+            elif "Buffer Time:" in line:
+                # Extract buffer time (e.g., "Requires 10-minute buffers between all scheduled blocks")
+                buffer_match = _BUFFER_TIME_RE.search(line)
+                if buffer_match:
+                    self.constraints["working_hours"]["buffer_time"] = int(buffer_match.group(1))
+
+            elif "Transit:" in line:
+                # Extract transit time (e.g., "Specifies that it takes 30 minutes to get to work")
+                transit_match = _TRANSIT_TIME_RE.search(line)
+                if transit_match:
+                    self.constraints["working_hours"]["transit_time"] = int(transit_match.group(1))
+
+            elif "No Double-Booking:" in line:
+                self.constraints["working_hours"]["no_double_booking"] = True
+
+        # Parse health-optimized timing
+        elif self.current_subsection == "health_optimized_timing":
+            if "ML Deep Work:" in line:
+                if "morning" in line.lower():
+                    self.constraints["health_optimized_timing"]["ml_deep_work"] = "morning"
+                elif "afternoon" in line.lower():
+                    self.constraints["health_optimized_timing"]["ml_deep_work"] = "afternoon"
+                elif "evening" in line.lower():
+                    self.constraints["health_optimized_timing"]["ml_deep_work"] = "evening"
+
+            elif "Strength Training:" in line:
+                # Extract time range (e.g., "Recommended for late afternoon (3-5 PM)")
+                time_match = _STRENGTH_WINDOW_RE.search(line)
+                if time_match:
+                    start_hour = int(time_match.group(1))
+                    end_hour = int(time_match.group(2))
+                    ampm = time_match.group(3)
+
+                    if ampm == "PM" and start_hour != 12:
+                        start_hour += 12
+                    if ampm == "PM" and end_hour != 12:
+                        end_hour += 12
+
+                    self.constraints["health_optimized_timing"]["strength_training"] = f"{start_hour:02d}:00-{end_hour:02d}:00"
+                elif "late afternoon" in line.lower():
+                    self.constraints["health_optimized_timing"]["strength_training"] = "15:00-17:00"
+
+            elif "Cardio:" in line:
+                if "flexible" in line.lower():
+                    self.constraints["health_optimized_timing"]["cardio"] = "flexible"
+                elif "morning" in line.lower():
+                    self.constraints["health_optimized_timing"]["cardio"] = "morning"
+                elif "evening" in line.lower():
+                    self.constraints["health_optimized_timing"]["cardio"] = "evening"
+
+            elif "Meditation:" in line:
+                if "flexible" in line.lower():
+                    self.constraints["health_optimized_timing"]["meditation"] = "flexible"
+                elif "transition" in line.lower():
+                    self.constraints["health_optimized_timing"]["meditation"] = "transition"
+
+        # Parse recovery and rest
+        elif self.current_subsection == "recovery_rest":
+            if "Strength Training:" in line and "rest" in line:
+                # Extract rest hours (e.g., "Requires a minimum 48-hour rest between major muscle groups")
+                rest_match = _STRENGTH_REST_RE.search(line)
+                if rest_match:
+                    self.constraints["recovery_rest"]["strength_training_rest"] = int(rest_match.group(1))
+
+            elif "Cardio:" in line and "recovery" in line:
+                if "active recovery" in line.lower():
+                    self.constraints["recovery_rest"]["cardio_active_recovery"] = True
+
+            elif "Sleep Protection:" in line:
+                # Extract sleep protection hours (e.g., "no intense exercise should be done within 3 hours of target bedtime")
+                sleep_match = _SLEEP_PROTECTION_RE.search(line)
+                if sleep_match:
+                    self.constraints["recovery_rest"]["sleep_protection"] = int(sleep_match.group(1))
+
+    def result(self) -> ParsedSchedulingConstraints:
+        """Return the parsed constraints with defaults filled in."""
+        working_hours = self.constraints["working_hours"]
+        health_timing = self.constraints["health_optimized_timing"]
+        recovery = self.constraints["recovery_rest"]
+
+        core_hours = working_hours.get("core_hours") or {"start": "08:00", "end": "17:00", "timezone": "CT"}
+        strength_start, _, strength_end = health_timing.get("strength_training", "15:00-17:00").partition("-")
+
+        return ParsedSchedulingConstraints(
+            core_start=core_hours["start"],
+            core_end=core_hours["end"],
+            timezone=core_hours["timezone"],
+            buffer_time=working_hours.get("buffer_time", 10),
+            transit_time=working_hours.get("transit_time", 30),
+            no_double_booking=working_hours.get("no_double_booking", True),
+            ml_deep_work=health_timing.get("ml_deep_work", "morning"),
+            strength_training_start=strength_start,
+            strength_training_end=strength_end,
+            cardio=health_timing.get("cardio", "flexible"),
+            meditation=health_timing.get("meditation", "flexible"),
+            strength_training_rest=recovery.get("strength_training_rest", 48),
+            cardio_active_recovery=recovery.get("cardio_active_recovery", True),
+            sleep_protection=recovery.get("sleep_protection", 3)
+        )
+
+
+def parse_scheduling_constraints(content: str) -> ParsedSchedulingConstraints:
+    """Parse scheduling constraints from the Goals & Rules content."""
+    scanner = _ConstraintsScanner()
+    for line in content.split('\n'):
+        scanner.feed(line.strip())
+    return scanner.result()
+
+
+def parse_all(content: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], ParsedSchedulingConstraints]:
+    """
+    Parse goals, todos, and scheduling constraints in a single pass.
+
+    Equivalent to calling parse_goals_from_content, parse_todos_from_content
+    and parse_scheduling_constraints, but splits and scans the content once.
+
+    Returns:
+        Tuple of (goals, todos, scheduling_constraints)
+    """
+    scanner = _ConstraintsScanner()
+    has_weekly_targets = False
+
+    for line in content.split('\n'):
+        line = line.strip()
+        if not has_weekly_targets and "Weekly Targets" in line:
+            has_weekly_targets = True
+        scanner.feed(line)
+
+    goals = [goal.copy() for goal in _STATIC_GOALS]
+    todos = [todo.copy() for todo in _STATIC_TODOS] if has_weekly_targets else []
+    return goals, todos, scanner.result()
+
+
+def run_concurrently(calls: List[Callable[[], Any]], max_concurrency: int = 10) -> List[Any]:
+    """
+    Run blocking calls (e.g. Notion API requests) concurrently.
     
-    if "strength_training_rest" not in constraints["recovery_rest"]:
-        constraints["recovery_rest"]["strength_training_rest"] = 48
-    if "cardio_active_recovery" not in constraints["recovery_rest"]:
-        constraints["recovery_rest"]["cardio_active_recovery"] = True
-    if "sleep_protection" not in constraints["recovery_rest"]:
-        constraints["recovery_rest"]["sleep_protection"] = 3
+    Args:
+        calls: Zero-argument callables to run
+        max_concurrency: Maximum number of calls in flight at once
+        
+    Returns:
+        Results in the same order as ``calls``; a call that raised is
+        represented by its exception instead of a result.
+    """
+    async def gather_calls() -> List[Any]:
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_call(call: Callable[[], Any]) -> Any:
+            async with semaphore:
+                return await loop.run_in_executor(None, call)
+        
+        return await asyncio.gather(*(run_call(call) for call in calls), return_exceptions=True)
     
-    return constraints
+    if not calls:
+        return []
+    return asyncio.run(gather_calls())
 
 
 def add_missing_select_options(notion_client, database_id: str, property_name: str, missing_options: List[str]) -> bool:
@@ -539,9 +666,11 @@ def setup_goals_and_todos_from_page(page_title: str = "Goals & Rules", enable_sc
         Status message about the setup process
     """
     try:
-        # Get clients and agents
-        notion_client = get_notion_client()
+        # Get clients and agents; share the coordinator's client so every
+        # request in this run goes through one keep-alive session
         coordinator = get_coordinator()
+        notion_client = coordinator.notion
+        verbose = AGENT_VERBOSE
         
         # Search for the Goals & Rules page
         console.print(f"🔍 [cyan]Searching for '{page_title}' page...[/cyan]")
@@ -609,35 +738,28 @@ def setup_goals_and_todos_from_page(page_title: str = "Goals & Rules", enable_sc
         console.print(f"📄 [cyan]Extracted {len(content)} characters of content[/cyan]")
         
         # Parse goals, todos, and scheduling constraints
-        goals = parse_goals_from_content(content)
-        todos = parse_todos_from_content(content)
-        scheduling_constraints = parse_scheduling_constraints(content)
+        goals, todos, scheduling_constraints = parse_all(content)
         
         console.print(f"🎯 [cyan]Found {len(goals)} goals to create[/cyan]")
         console.print(f"📋 [cyan]Found {len(todos)} todos to create[/cyan]")
-        console.print(f"⏰ [cyan]Found scheduling constraints: {len(scheduling_constraints)} categories[/cyan]")
+        console.print(f"⏰ [cyan]Found scheduling constraints: {len(scheduling_constraints.to_dict())} categories[/cyan]")
         
         # Load scheduling constraints into the schedule agent
         if scheduling_constraints:
             console.print("🔧 [cyan]Loading scheduling constraints into schedule agent...[/cyan]")
-            coordinator.schedule_agent.load_scheduling_constraints(scheduling_constraints)
+            coordinator.schedule_agent.load_scheduling_constraints(scheduling_constraints.to_dict())
             
             # Display constraints summary
-            constraints_summary = []
-            if scheduling_constraints.get("working_hours", {}).get("core_hours"):
-                wh = scheduling_constraints["working_hours"]["core_hours"]
-                constraints_summary.append(f"Working Hours: {wh['start']}-{wh['end']} {wh['timezone']}")
-            if scheduling_constraints.get("working_hours", {}).get("buffer_time"):
-                constraints_summary.append(f"Buffer Time: {scheduling_constraints['working_hours']['buffer_time']} minutes")
-            if scheduling_constraints.get("health_optimized_timing", {}).get("ml_deep_work"):
-                constraints_summary.append(f"ML Work: {scheduling_constraints['health_optimized_timing']['ml_deep_work']}")
-            if scheduling_constraints.get("health_optimized_timing", {}).get("strength_training"):
-                constraints_summary.append(f"Strength Training: {scheduling_constraints['health_optimized_timing']['strength_training']}")
+            constraints_summary = [
+                f"Working Hours: {scheduling_constraints.core_start}-{scheduling_constraints.core_end} {scheduling_constraints.timezone}",
+                f"Buffer Time: {scheduling_constraints.buffer_time} minutes",
+                f"ML Work: {scheduling_constraints.ml_deep_work}",
+                f"Strength Training: {scheduling_constraints.strength_training}",
+            ]
             
-            if constraints_summary:
-                console.print("📋 [cyan]Scheduling Constraints Loaded:[/cyan]")
-                for constraint in constraints_summary:
-                    console.print(f"   • {constraint}")
+            console.print("📋 [cyan]Scheduling Constraints Loaded:[/cyan]")
+            for constraint in constraints_summary:
+                console.print(f"   • {constraint}")
         
         # Check database schemas
         console.print("🔍 [cyan]Checking database schemas...[/cyan]")
@@ -676,51 +798,65 @@ def setup_goals_and_todos_from_page(page_title: str = "Goals & Rules", enable_sc
         goal_id_mapping = {}  # Map goal titles to their IDs for linking todos
         goal_todo_mapping = {}  # Map goal titles to lists of todos that should be linked
         
-        for goal in goals:
+        # Call the tool directly for better error handling
+        from tools.goal_tools import CreateGoalTool
+        create_goal_tool = CreateGoalTool(
+            notion_client=notion_client,
+            goals_database_id=coordinator.goal_agent.goals_database_id
+        )
+        
+        def create_goal(goal: Dict[str, Any]) -> str:
+            return create_goal_tool._run(
+                title=goal["title"],
+                description=goal["description"],
+                target_date=goal.get("target_date"),
+                priority=goal["priority"],
+                category=goal["category"]
+            )
+        
+        # Create all goals concurrently, then process the responses in order
+        console.print(f"📊 [cyan]Creating {len(goals)} goals...[/cyan]")
+        goal_responses = run_concurrently([partial(create_goal, goal) for goal in goals])
+        
+        # Messages for each goal are collected and printed in one go once
+        # all responses are processed
+        goal_msgs = []
+        for goal, response in zip(goals, goal_responses):
             try:
-                console.print(f"📊 [cyan]Creating goal: {goal['title']}[/cyan]")
-                console.print(f"   Category: {goal['category']}, Priority: {goal['priority']}")
-                
-                # Call the tool directly for better error handling
-                from tools.goal_tools import CreateGoalTool
-                create_goal_tool = CreateGoalTool(
-                    notion_client=notion_client,
-                    goals_database_id=coordinator.goal_agent.goals_database_id
-                )
+                goal_msgs.append(f"📊 [cyan]Goal: {goal['title']}[/cyan]")
+                goal_msgs.append(f"   Category: {goal['category']}, Priority: {goal['priority']}")
                 
-                response = create_goal_tool._run(
-                    title=goal["title"],
-                    description=goal["description"],
-                    target_date=goal.get("target_date"),
-                    priority=goal["priority"],
-                    category=goal["category"]
-                )
+                if isinstance(response, Exception):
+                    raise response
                 
-                console.print(f"   Tool response: {response}")
+                if verbose:
+                    goal_msgs.append(f"   Tool response: {response}")
                 
                 if "✅" in response or "Created goal" in response:
                     created_goals.append(goal["title"])
                     
                     # Extract goal ID from response for linking todos
-                    import re
-                    goal_id_match = re.search(r'Goal ID: ([a-f0-9-]+)', response)
-                    if goal_id_match:
-                        goal_id = goal_id_match.group(1)
+                    goal_id = _extract_uuid(response, "Goal ID: ")
+                    if goal_id:
                         goal_id_mapping[goal["title"]] = goal_id
                         goal_todo_mapping[goal["title"]] = []  # Initialize empty list for todos
-                        console.print(f"   🎯 Extracted Goal ID: {goal_id}")
+                        if verbose:
+                            goal_msgs.append(f"   🎯 Extracted Goal ID: {goal_id}")
                     else:
-                        console.print(f"   ⚠️ [yellow]Could not extract goal ID from response[/yellow]")
+                        goal_msgs.append(f"   ⚠️ [yellow]Could not extract goal ID from response[/yellow]")
                     
-                    console.print(f"✅ [green]Created goal: {goal['title']}[/green]")
+                    goal_msgs.append(f"✅ [green]Created goal: {goal['title']}[/green]")
                 else:
                     failed_goals.append((goal["title"], response))
-                    console.print(f"❌ [red]Failed to create goal '{goal['title']}': {response}[/red]")
+                    goal_msgs.append(f"❌ [red]Failed to create goal '{goal['title']}': {response}[/red]")
                     
             except Exception as e:
                 failed_goals.append((goal["title"], str(e)))
-                console.print(f"❌ [red]Failed to create goal '{goal['title']}': {e}[/red]")
+                goal_msgs.append(f"❌ [red]Failed to create goal '{goal['title']}': {e}[/red]")
                 
+        if goal_msgs:
+            console.print("\n".join(goal_msgs))
+        
         if failed_goals:
             console.print(f"\n⚠️  [yellow]Failed to create {len(failed_goals)} goal(s):[/yellow]")
             for title, error in failed_goals:
@@ -730,177 +866,80 @@ def setup_goals_and_todos_from_page(page_title: str = "Goals & Rules", enable_sc
         created_todos = []
         created_todo_ids = []
         
-        for todo in todos:
+        # Call the tool directly for better control and ID extraction
+        from tools.todo_tools import CreateTodoTool
+        create_todo_tool = CreateTodoTool(
+            notion_client=notion_client,
+            todos_database_id=coordinator.todo_agent.todos_database_id
+        )
+        
+        def create_todo(todo: Dict[str, Any]) -> str:
+            return create_todo_tool._run(
+                title=todo["title"],
+                priority=todo["priority"],
+                project=todo.get("project"),
+                due_date=None,  # Could be enhanced later
+                time_estimate=todo.get("time_estimate"),
+                context=todo.get("context")
+            )
+        
+        # Create all todos concurrently, then process the responses in order
+        console.print(f"📋 [cyan]Creating {len(todos)} todos...[/cyan]")
+        todo_responses = run_concurrently([partial(create_todo, todo) for todo in todos])
+        
+        todo_msgs = []
+        for todo, response in zip(todos, todo_responses):
             try:
-                console.print(f"📋 [cyan]Creating todo: {todo['title']}[/cyan]")
+                todo_msgs.append(f"📋 [cyan]Todo: {todo['title']}[/cyan]")
                 
                 # Determine which goal this todo relates to based on project/category
-                related_goal_id = None
                 related_goal_title = None
                 
-                # Map project names to goal titles
-                project_to_goal = {
-                    "Machine Learning": "Machine Learning Study",
-                    "Health": "Athletics & Health", 
-                    "Mental Health": "Mental Health & Clarity",
-                    "Planning": "Planning & Organization"  # Add this goal if it doesn't exist
-                }
+                if verbose:
+                    todo_msgs.append(f"   🔍 Project: '{todo.get('project', 'Unknown')}'")
                 
-                console.print(f"   🔍 Project: '{todo.get('project', 'Unknown')}'")
-                
-                if todo.get("project") in project_to_goal:
-                    goal_title = project_to_goal[todo["project"]]
+                if todo.get("project") in _PROJECT_TO_GOAL:
+                    goal_title = _PROJECT_TO_GOAL[todo["project"]]
                     if goal_title in goal_id_mapping:
-                        related_goal_id = goal_id_mapping[goal_title]
                         related_goal_title = goal_title
-                        console.print(f"   🎯 Linking to goal: {goal_title}")
+                        if verbose:
+                            todo_msgs.append(f"   🎯 Linking to goal: {goal_title}")
                     else:
-                        console.print(f"   ⚠️ [yellow]Goal '{goal_title}' not found for project '{todo['project']}'[/yellow]")
-                
-                # Call the tool directly for better control and ID extraction
-                from tools.todo_tools import CreateTodoTool
-                create_todo_tool = CreateTodoTool(
-                    notion_client=notion_client,
-                    todos_database_id=coordinator.todo_agent.todos_database_id
-                )
+                        todo_msgs.append(f"   ⚠️ [yellow]Goal '{goal_title}' not found for project '{todo['project']}'[/yellow]")
                 
-                response = create_todo_tool._run(
-                    title=todo["title"],
-                    priority=todo["priority"],
-                    project=todo.get("project"),
-                    due_date=None,  # Could be enhanced later
-                    time_estimate=todo.get("time_estimate"),
-                    context=todo.get("context")
-                )
+                if isinstance(response, Exception):
+                    raise response
                 
-                console.print(f"   Tool response: {response}")
+                if verbose:
+                    todo_msgs.append(f"   Tool response: {response}")
                 
                 if "✅" in response or "Created todo" in response:
                     created_todos.append(todo["title"])
                     
                     # Extract todo ID from response for scheduling and linking
-                    import re
-                    todo_id_match = re.search(r'Todo ID: ([a-f0-9-]+)', response)
-                    if todo_id_match:
-                        todo_id = todo_id_match.group(1)
+                    todo_id = _extract_uuid(response, "Todo ID: ")
+                    if todo_id:
                         created_todo_ids.append((todo_id, todo))
-                        console.print(f"   📋 Extracted ID: {todo_id}")
+                        if verbose:
+                            todo_msgs.append(f"   📋 Extracted ID: {todo_id}")
                         
-                        # Link todo to goal if we have both IDs
-                        # Note: Relations will be created in batch after all todos are created
-                        if related_goal_id:
-                            try:
-                                console.print(f"   🔗 Linking todo to goal: {related_goal_title}")
-                                
-                                # First, get existing relations to avoid overwriting
-                                try:
-                                    existing_goal_page = notion_client.pages.retrieve(related_goal_id)
-                                    existing_todo_relations = existing_goal_page.properties.get("Related Todos", {}).get("relation", [])
-                                    
-                                    # Handle both dict and object responses from Notion API
-                                    existing_todo_ids = []
-                                    for rel in existing_todo_relations:
-                                        if hasattr(rel, 'id'):
-                                            existing_todo_ids.append(rel.id)
-                                        elif isinstance(rel, dict) and 'id' in rel:
-                                            existing_todo_ids.append(rel['id'])
-                                        else:
-                                            console.print(f"   ⚠️ [yellow]Unexpected relation format: {type(rel)}[/yellow]")
-                                    
-                                    # Only add if not already linked
-                                    if todo_id not in existing_todo_ids:
-                                        existing_todo_ids.append(todo_id)
-                                        console.print(f"   📝 Adding to existing {len(existing_todo_relations)} relations")
-                                    else:
-                                        console.print(f"   ⚠️ [yellow]Todo already linked to this goal[/yellow]")
-                                except Exception as e:
-                                    console.print(f"   ⚠️ [yellow]Could not retrieve existing relations: {e}[/yellow]")
-                                    existing_todo_ids = [todo_id]
-                                
-                                # Update the todo to link to the goal and add goal tracking properties
-                                # First, get existing goal relations to avoid overwriting
-                                try:
-                                    existing_todo_page = notion_client.pages.retrieve(todo_id)
-                                    existing_goal_relations = existing_todo_page.properties.get("Related Goals", {}).get("relation", [])
-                                    
-                                    # Handle both dict and object responses from Notion API
-                                    existing_goal_ids = []
-                                    for rel in existing_goal_relations:
-                                        if hasattr(rel, 'id'):
-                                            existing_goal_ids.append(rel.id)
-                                        elif isinstance(rel, dict) and 'id' in rel:
-                                            existing_goal_ids.append(rel['id'])
-                                        else:
-                                            console.print(f"   ⚠️ [yellow]Unexpected goal relation format: {type(rel)}[/yellow]")
-                                    
-                                    # Only add if not already linked
-                                    if related_goal_id not in existing_goal_ids:
-                                        existing_goal_ids.append(related_goal_id)
-                                        console.print(f"   📝 Adding to existing {len(existing_goal_relations)} goal relations")
-                                    else:
-                                        console.print(f"   ⚠️ [yellow]Goal already linked to this todo[/yellow]")
-                                except Exception as e:
-                                    console.print(f"   ⚠️ [yellow]Could not retrieve existing goal relations: {e}[/yellow]")
-                                    existing_goal_ids = [related_goal_id]
-                                
-                                notion_client.pages.update(
-                                    page_id=todo_id,
-                                    properties={
-                                        "Related Goals": {
-                                            "relation": [{"id": gid} for gid in existing_goal_ids]
-                                        },
-                                        "Goal Progress Impact": {
-                                            "select": {"name": "High" if todo.get("priority") in ["High", "Urgent"] else "Medium"}
-                                        },
-                                        "Goal Milestone": {
-                                            "checkbox": False  # Can be updated later
-                                        },
-                                        "Estimated Goal Contribution": {
-                                            "number": 15  # Default 15% contribution, can be adjusted
-                                        }
-                                    }
-                                )
-                                
-                                # Update the goal to link back to the todo (append to existing)
-                                notion_client.pages.update(
-                                    page_id=related_goal_id,
-                                    properties={
-                                        "Related Todos": {
-                                            "relation": [{"id": tid} for tid in existing_todo_ids]
-                                        }
-                                    }
-                                )
-                                
-                                console.print(f"   ✅ [green]Successfully linked todo to goal[/green]")
-                                console.print(f"   📊 Goal now has {len(existing_todo_ids)} related todos")
-                                
-                                # Verify the update worked by checking the goal again
-                                try:
-                                    updated_goal_page = notion_client.pages.retrieve(related_goal_id)
-                                    updated_todo_relations = updated_goal_page.properties.get("Related Todos", {}).get("relation", [])
-                                    console.print(f"   🔍 Verification: Goal now shows {len(updated_todo_relations)} related todos")
-                                    
-                                    # Show the actual todo IDs for debugging
-                                    if updated_todo_relations:
-                                        console.print(f"   📋 Todo IDs in goal: {[rel.id if hasattr(rel, 'id') else rel.get('id', 'unknown') for rel in updated_todo_relations]}")
-                                except Exception as verify_error:
-                                    console.print(f"   ⚠️ [yellow]Could not verify update: {verify_error}[/yellow]")
-                                
-                            except Exception as link_error:
-                                console.print(f"   ❌ [red]Failed to link todo to goal: {link_error}[/red]")
+                        # Relations are created in batch after all todos are created
+                        if related_goal_title:
+                            goal_todo_mapping[related_goal_title].append(todo_id)
                         else:
-                            console.print(f"   ⚠️ [yellow]No goal to link to for this todo[/yellow]")
-                        
-                        # OLD LINKING CODE ABOVE - REPLACED WITH BATCH LINKING BELOW
+                            todo_msgs.append(f"   ⚠️ [yellow]No goal to link to for this todo[/yellow]")
                     else:
-                        console.print(f"   ⚠️ [yellow]Could not extract todo ID from response[/yellow]")
+                        todo_msgs.append(f"   ⚠️ [yellow]Could not extract todo ID from response[/yellow]")
                     
-                    console.print(f"✅ [green]Created todo: {todo['title']}[/green]")
+                    todo_msgs.append(f"✅ [green]Created todo: {todo['title']}[/green]")
                 else:
-                    console.print(f"❌ [red]Failed to create todo '{todo['title']}': {response}[/red]")
+                    todo_msgs.append(f"❌ [red]Failed to create todo '{todo['title']}': {response}[/red]")
                     
             except Exception as e:
-                console.print(f"❌ [red]Failed to create todo '{todo['title']}': {e}[/red]")
+                todo_msgs.append(f"❌ [red]Failed to create todo '{todo['title']}': {e}[/red]")
+        
+        if todo_msgs:
+            console.print("\n".join(todo_msgs))
         
         # Schedule high-priority todos automatically (if enabled)
         scheduled_todos = []
@@ -908,42 +947,41 @@ def setup_goals_and_todos_from_page(page_title: str = "Goals & Rules", enable_sc
             console.print(f"\n📅 [cyan]Automatically scheduling high-priority todos...[/cyan]")
             
             # Get today's date for scheduling
-            from datetime import datetime, timedelta
-            import pytz
+            today = datetime.now(_CDT)
+            
+            # Every todo is scheduled for tomorrow; only the slot differs
+            tomorrow_date = (today + timedelta(days=1)).date()
+            tomorrow_str = tomorrow_date.isoformat()
             
-            # Set up CDT timezone
-            cdt_tz = pytz.timezone('America/Chicago')
-            today = datetime.now(cdt_tz)
+            # Call the schedule tool directly
+            from tools.schedule_tools import ScheduleTodoTool
+            schedule_tool = ScheduleTodoTool(
+                notion_client=notion_client,
+                calendar_database_id=coordinator.schedule_agent.calendar_database_id
+            )
             
             # Schedule high-priority todos for tomorrow
             for todo_id, todo_data in created_todo_ids:
                 if todo_data.get("priority") in ["High", "Urgent"]:
                     try:
                         # Use scheduling constraints to suggest optimal time
-                        if todo_data.get("context") == "@morning" or "ML" in todo_data.get("title", ""):
-                            schedule_time = "09:00"  # ML Deep Work - optimal cognitive time
-                        elif todo_data.get("context") == "@coding":
-                            schedule_time = "10:00"  # After ML work
-                        elif todo_data.get("context") == "@gym" or "training" in todo_data.get("title", "").lower():
-                            schedule_time = "15:00"  # Strength Training - optimal performance time
-                        else:
-                            schedule_time = "14:00"  # Default afternoon slot
+                        context = todo_data.get("context")
+                        title = todo_data.get("title", "")
+                        if "ML" in title:
+                            context = "@morning"
+                        elif context not in _CONTEXT_SLOT and "training" in title.lower():
+                            context = "@gym"
+                        hour, minute = _CONTEXT_SLOT.get(context, _DEFAULT_SLOT)
+                        schedule_time = f"{hour:02d}:{minute:02d}"
                         
-                        # Create tomorrow's date in CDT
-                        tomorrow = today + timedelta(days=1)
-                        tomorrow = tomorrow.replace(hour=int(schedule_time.split(':')[0]), minute=int(schedule_time.split(':')[1]), second=0, microsecond=0)
+                        # Create tomorrow's slot in CDT; localize() picks the UTC
+                        # offset for that date rather than reusing today's
+                        schedule_dt = _CDT.localize(datetime.combine(tomorrow_date, time(hour, minute)))
                         
                         # Format as ISO string with CDT timezone
-                        schedule_datetime = tomorrow.isoformat()
+                        schedule_datetime = schedule_dt.isoformat()
                         
-                        console.print(f"   📅 Scheduling '{todo_data['title']}' for {tomorrow.strftime('%Y-%m-%d')} at {schedule_time} CDT")
-                        
-                        # Call the schedule tool directly
-                        from tools.schedule_tools import ScheduleTodoTool
-                        schedule_tool = ScheduleTodoTool(
-                            notion_client=notion_client,
-                            calendar_database_id=coordinator.schedule_agent.calendar_database_id
-                        )
+                        console.print(f"   📅 Scheduling '{todo_data['title']}' for {tomorrow_str} at {schedule_time} CDT")
                         
                         response = schedule_tool._run(
                             todo_id=todo_id,
@@ -951,7 +989,8 @@ def setup_goals_and_todos_from_page(page_title: str = "Goals & Rules", enable_sc
                             duration_minutes=todo_data.get("time_estimate", 60)
                         )
                         
-                        console.print(f"   📅 Schedule tool response: {response}")
+                        if verbose:
+                            console.print(f"   📅 Schedule tool response: {response}")
                         
                         if "Scheduled todo" in response or "📅" in response:
                             scheduled_todos.append(todo_data["title"])
@@ -965,70 +1004,56 @@ def setup_goals_and_todos_from_page(page_title: str = "Goals & Rules", enable_sc
                 # Now link all todos to their goals in batch (this avoids the overwriting issue)
         console.print(f"\n🔗 [cyan]Creating Database Relations...[/cyan]")
         
-        # Project to goal mapping
-        project_to_goal = {
-            "Machine Learning": "Machine Learning Study",
-            "Health": "Athletics & Health", 
-            "Mental Health": "Mental Health & Clarity",
-            "Planning": "Planning & Organization"
-        }
+        # Build every goal-side and todo-side update up front; they have no
+        # ordering dependency on each other so they are sent concurrently
+        update_specs = []  # (goal_title, page_id, properties)
+        for goal_title, todo_ids in goal_todo_mapping.items():
+            if todo_ids and goal_title in goal_id_mapping:
+                goal_id = goal_id_mapping[goal_title]
+                console.print(f"   🎯 Updating {goal_title} with {len(todo_ids)} todos")
+                
+                # Update goal with all related todos
+                update_specs.append((goal_title, goal_id, {
+                    "Related Todos": {
+                        "relation": [{"id": tid} for tid in todo_ids]
+                    }
+                }))
+                
+                # Update each todo with the goal link
+                for todo_id in todo_ids:
+                    update_specs.append((goal_title, todo_id, {
+                        "Related Goals": {
+                            "relation": [{"id": goal_id}]
+                        },
+                        "Goal Progress Impact": {
+                            "select": {"name": "High"}  # Default to high for now
+                        },
+                        "Goal Milestone": {
+                            "checkbox": False
+                        },
+                        "Estimated Goal Contribution": {
+                            "number": 15  # Default 15%
+                        }
+                    }))
         
-        # Collect todos for each goal
-        goal_todos = {}
-        for goal_title in goal_id_mapping.keys():
-            goal_todos[goal_title] = []
+        update_results = run_concurrently([
+            partial(notion_client.pages.update, page_id=page_id, properties=properties)
+            for _, page_id, properties in update_specs
+        ])
         
-        for todo_id, todo_data in created_todo_ids:
-            project = todo_data.get("project")
-            if project in project_to_goal:
-                goal_title = project_to_goal[project]
-                if goal_title in goal_todos:
-                    goal_todos[goal_title].append(todo_id)
-                    console.print(f"   📋 {todo_data['title']} → {goal_title}")
+        update_errors = {}
+        for (goal_title, _, _), result in zip(update_specs, update_results):
+            if isinstance(result, Exception):
+                update_errors.setdefault(goal_title, result)
         
-        # Now update each goal with all its related todos at once
         relations_created = 0
-        for goal_title, todo_ids in goal_todos.items():
+        for goal_title, todo_ids in goal_todo_mapping.items():
             if todo_ids and goal_title in goal_id_mapping:
-                try:
-                    goal_id = goal_id_mapping[goal_title]
-                    console.print(f"   🎯 Updating {goal_title} with {len(todo_ids)} todos")
-                    
-                    # Update goal with all related todos
-                    notion_client.pages.update(
-                        page_id=goal_id,
-                        properties={
-                            "Related Todos": {
-                                "relation": [{"id": tid} for tid in todo_ids]
-                            }
-                        }
-                    )
-                    
-                    # Update each todo with the goal link
-                    for todo_id in todo_ids:
-                        notion_client.pages.update(
-                            page_id=todo_id,
-                            properties={
-                                "Related Goals": {
-                                    "relation": [{"id": goal_id}]
-                                },
-                                "Goal Progress Impact": {
-                                    "select": {"name": "High"}  # Default to high for now
-                                },
-                                "Goal Milestone": {
-                                    "checkbox": False
-                                },
-                                "Estimated Goal Contribution": {
-                                    "number": 15  # Default 15%
-                                }
-                            }
-                        )
-                    
+                if goal_title in update_errors:
+                    console.print(f"   ❌ Error updating {goal_title}: {update_errors[goal_title]}")
+                else:
                     relations_created += len(todo_ids)
                     console.print(f"   ✅ {goal_title} now has {len(todo_ids)} related todos")
-                    
-                except Exception as e:
-                    console.print(f"   ❌ Error updating {goal_title}: {e}")
         
         # Summary of relations created
         if relations_created > 0:
@@ -1038,36 +1063,55 @@ def setup_goals_and_todos_from_page(page_title: str = "Goals & Rules", enable_sc
             console.print(f"   • Todos now show related goals in 'Related Goals' field")
             console.print(f"   • Goal tracking properties added (Impact, Milestone, Contribution)")
         
-        # Show detailed breakdown of relations per goal
+        # Show breakdown of relations per goal. Counts come from what was just
+        # linked; verifying against Notion (re-fetching every goal and todo
+        # page) only happens in verbose mode.
         console.print(f"\n📊 [cyan]Relations Breakdown:[/cyan]")
-        for goal_title, goal_id in goal_id_mapping.items():
-            try:
-                goal_page = notion_client.pages.retrieve(goal_id)
-                related_todos = goal_page.properties.get("Related Todos", {}).get("relation", [])
-                console.print(f"   • {goal_title}: {len(related_todos)} related todos")
-                
+        if not verbose:
+            for goal_title, todo_ids in goal_todo_mapping.items():
+                console.print(f"   • {goal_title}: {len(todo_ids)} related todos")
+        else:
+            def get_page_properties(page_id: str) -> Dict[str, Any]:
+                return notion_client.pages.retrieve(page_id).properties
+            
+            goal_ids = list(goal_id_mapping.values())
+            goal_pages = dict(zip(goal_ids, run_concurrently(
+                [partial(get_page_properties, goal_id) for goal_id in goal_ids]
+            )))
+        
+            related_todo_ids = {}
+            for goal_id, goal_page in goal_pages.items():
+                if isinstance(goal_page, Exception):
+                    continue
+                related_todos = goal_page.get("Related Todos", {}).get("relation", [])
+                related_todo_ids[goal_id] = [todo_ref["id"] for todo_ref in related_todos]
+        
+            all_todo_ids = list({tid for todo_ids in related_todo_ids.values() for tid in todo_ids})
+            todo_pages = dict(zip(all_todo_ids, run_concurrently(
+                [partial(get_page_properties, todo_id) for todo_id in all_todo_ids]
+            )))
+        
+            for goal_title, goal_id in goal_id_mapping.items():
+                goal_page = goal_pages[goal_id]
+                if isinstance(goal_page, Exception):
+                    console.print(f"   • {goal_title}: Error retrieving relations ({goal_page})")
+                    continue
+            
+                todo_ids = related_todo_ids[goal_id]
+                console.print(f"   • {goal_title}: {len(todo_ids)} related todos")
+            
                 # Show the actual todo titles for debugging
-                if related_todos:
-                    for i, todo_ref in enumerate(related_todos):
-                        try:
-                            if hasattr(todo_ref, 'id'):
-                                todo_id = todo_ref.id
-                            elif isinstance(todo_ref, dict) and 'id' in todo_ref:
-                                todo_id = todo_ref['id']
-                            else:
-                                todo_id = str(todo_ref)
-                            
-                            todo_page = notion_client.pages.retrieve(todo_id)
-                            todo_title_prop = todo_page.properties.get("Task", {}).get("title", [])
-                            if todo_title_prop:
-                                todo_title = todo_title_prop[0].get("plain_text", "")
-                                console.print(f"     {i+1}. {todo_title}")
-                            else:
-                                console.print(f"     {i+1}. [No title]")
-                        except Exception as e:
-                            console.print(f"     {i+1}. [Error: {e}]")
-            except Exception as e:
-                console.print(f"   • {goal_title}: Error retrieving relations ({e})")
+                for i, todo_id in enumerate(todo_ids):
+                    todo_page = todo_pages[todo_id]
+                    if isinstance(todo_page, Exception):
+                        console.print(f"     {i+1}. [Error: {todo_page}]")
+                        continue
+                    todo_title_prop = todo_page.get("Task", {}).get("title", [])
+                    if todo_title_prop:
+                        todo_title = todo_title_prop[0].get("plain_text", "")
+                        console.print(f"     {i+1}. {todo_title}")
+                    else:
+                        console.print(f"     {i+1}. [No title]")
         
         # Generate schedule suggestions for remaining todos (if scheduling is enabled)
         schedule_suggestions = ""
@@ -1076,121 +1120,188 @@ def setup_goals_and_todos_from_page(page_title: str = "Goals & Rules", enable_sc
                 console.print(f"\n🤖 [cyan]Generating schedule suggestions for remaining todos...[/cyan]")
                 
                 # Use the enhanced schedule suggestion with constraints
-                tomorrow = (today + timedelta(days=1)).strftime("%Y-%m-%d")
-                remaining_todos = [todo for todo in todos if todo["title"] not in [scheduled["title"] for scheduled in scheduled_todos]]
+                scheduled_titles = set(scheduled_todos)
+                remaining_todos = [todo for todo in todos if todo["title"] not in scheduled_titles]
                 
                 if remaining_todos:
                     suggestions_response = coordinator.schedule_agent.suggest_optimal_schedule_with_constraints(
-                        tomorrow, remaining_todos
+                        tomorrow_str, remaining_todos
                     )
                     if suggestions_response:
-                        schedule_suggestions = f"\n\n📅 **Schedule Suggestions (with Constraints):**\n{suggestions_response}"
+                        schedule_suggestions = suggestions_response
                         console.print(f"✅ [green]Generated constraint-aware schedule suggestions[/green]")
                 
             except Exception as e:
                 console.print(f"⚠️ [yellow]Could not generate schedule suggestions: {e}[/yellow]")
         
-        # Return enhanced summary
-        scheduling_section = ""
-        if enable_scheduling:
-            scheduling_section = f"""
-📅 **Todos Automatically Scheduled ({len(scheduled_todos)}):**
-{chr(10).join(f"• {todo}" for todo in scheduled_todos) if scheduled_todos else "• None (high-priority todos not found or already scheduled)"}
-
-{schedule_suggestions}"""
-        else:
-            scheduling_section = "\n📅 **Scheduling:** Disabled (use --schedule to enable auto-scheduling)"
+        # Return enhanced summary, built line by line
+        lines = [
+            "",
+            "🏠 **Protocol Home Setup Complete!**",
+            "",
+            f"📊 **Goals Created ({len(created_goals)}):**",
+        ]
+        lines.extend(f"• {goal}" for goal in created_goals)
+        lines.append("")
+        lines.append(f"📋 **Todos Created ({len(created_todos)}):**")
+        lines.extend(f"• {todo}" for todo in created_todos)
         
-        constraints_section = ""
         if scheduling_constraints:
-            constraints_section = f"""
-⏰ **Scheduling Constraints Loaded:**
-• Working Hours: {scheduling_constraints.get('working_hours', {}).get('core_hours', {}).get('start', '08:00')}-{scheduling_constraints.get('working_hours', {}).get('core_hours', {}).get('end', '17:00')} CT
-• Buffer Time: {scheduling_constraints.get('working_hours', {}).get('buffer_time', 10)} minutes
-• ML Work: {scheduling_constraints.get('health_optimized_timing', {}).get('ml_deep_work', 'morning')} preference
-• Strength Training: {scheduling_constraints.get('health_optimized_timing', {}).get('strength_training', '15:00-17:00')}
-• Recovery: {scheduling_constraints.get('recovery_rest', {}).get('strength_training_rest', 48)} hours rest between major muscle groups
-"""
-        
-        next_steps_scheduling = ""
+            lines.extend([
+                "",
+                "⏰ **Scheduling Constraints Loaded:**",
+                f"• Working Hours: {scheduling_constraints.core_start}-{scheduling_constraints.core_end} CT",
+                f"• Buffer Time: {scheduling_constraints.buffer_time} minutes",
+                f"• ML Work: {scheduling_constraints.ml_deep_work} preference",
+                f"• Strength Training: {scheduling_constraints.strength_training}",
+                f"• Recovery: {scheduling_constraints.strength_training_rest} hours rest between major muscle groups",
+            ])
+        
+        lines.append("")
         if enable_scheduling:
-            next_steps_scheduling = "\n• Use `protocol chat \"show my schedule for tomorrow\"` to see scheduled items"
-        
-        summary = f"""
-🏠 **Protocol Home Setup Complete!**
-
-📊 **Goals Created ({len(created_goals)}):**
-{chr(10).join(f"• {goal}" for goal in created_goals)}
-
-📋 **Todos Created ({len(created_todos)}):**
-{chr(10).join(f"• {todo}" for todo in created_todos)}
-{constraints_section}{scheduling_section}
-
-🎯 **Next Steps:**
-• Use `protocol overview` to see your setup
-• Use `protocol goal progress` to track goal progress  
-• Use `protocol todo list` to see your tasks{next_steps_scheduling}
-• Use `protocol chat` for AI-powered assistance and scheduling
-• Use `protocol schedule constraints` to view/modify scheduling constraints
-"""
+            lines.append(f"📅 **Todos Automatically Scheduled ({len(scheduled_todos)}):**")
+            if scheduled_todos:
+                lines.extend(f"• {todo}" for todo in scheduled_todos)
+            else:
+                lines.append("• None (high-priority todos not found or already scheduled)")
+            if schedule_suggestions:
+                lines.extend(["", "📅 **Schedule Suggestions (with Constraints):**", schedule_suggestions])
+        else:
+            lines.append("📅 **Scheduling:** Disabled (use --schedule to enable auto-scheduling)")
+        
+        lines.extend([
+            "",
+            "🎯 **Next Steps:**",
+            "• Use `protocol overview` to see your setup",
+            "• Use `protocol goal progress` to track goal progress  ",
+            "• Use `protocol todo list` to see your tasks",
+        ])
+        if enable_scheduling:
+            lines.append("• Use `protocol chat \"show my schedule for tomorrow\"` to see scheduled items")
+        lines.extend([
+            "• Use `protocol chat` for AI-powered assistance and scheduling",
+            "• Use `protocol schedule constraints` to view/modify scheduling constraints",
+            "",
+        ])
         
-        return summary
+        return "\n".join(lines)
         
     except Exception as e:
         return f"❌ Error setting up goals and todos: {str(e)}"
 
 
-def get_notion_client() -> NotionClient:
-    """Get configured Notion client."""
-    api_token = os.getenv('NOTION_API_TOKEN')
-    if not api_token:
-        console.print("❌ [red]NOTION_API_TOKEN not found in environment variables[/red]")
-        console.print("Please set your Notion API token in a .env file or environment variable.")
-        console.print("Example: NOTION_API_TOKEN=ntn_your_integration_token_here")
+def _require(name: str, value: Optional[str]) -> str:
+    """Return a required setting, or exit with a clear message if it is unset."""
+    if not value:
+        console.print(f"❌ [red]{name} not found in environment variables[/red]")
+        console.print(f"Please set {name} in your .env file or environment.")
         sys.exit(1)
+    return value
+
+
+@lru_cache(maxsize=None)
+def get_notion_client() -> "NotionClient":
+    """Get configured Notion client."""
+    from notion_client.client import NotionClient
     
+    api_token = _require('NOTION_API_TOKEN', NOTION_API_TOKEN)
     return NotionClient(auth_token=api_token)
 
 
-def get_coordinator() -> ProtocolCoordinator:
-    """Get configured protocol coordinator."""
-    notion_client = get_notion_client()
+@lru_cache(maxsize=2)
+def get_coordinator(use_cache: bool = True) -> "ProtocolCoordinator":
+    """Get the configured protocol coordinator (one per ``use_cache`` value)."""
+    from agents.coordinator import ProtocolCoordinator
+    from cli.llm_cache import CachedCoordinator
     
-    goals_db_id = os.getenv('NOTION_GOALS_DATABASE_ID')
-    todos_db_id = os.getenv('NOTION_TODOS_DATABASE_ID')
-    calendar_db_id = os.getenv('NOTION_CALENDAR_DATABASE_ID')
+    notion_client = get_notion_client()
     
-    if not goals_db_id or not todos_db_id or not calendar_db_id:
-        console.print("❌ [red]Missing required database IDs[/red]")
-        console.print("Please set NOTION_GOALS_DATABASE_ID, NOTION_TODOS_DATABASE_ID, and NOTION_CALENDAR_DATABASE_ID in your .env file")
-        sys.exit(1)
+    goals_db_id = _require('NOTION_GOALS_DATABASE_ID', NOTION_GOALS_DB_ID)
+    todos_db_id = _require('NOTION_TODOS_DATABASE_ID', NOTION_TODOS_DB_ID)
+    calendar_db_id = _require('NOTION_CALENDAR_DATABASE_ID', NOTION_CALENDAR_DB_ID)
     
-    return ProtocolCoordinator(
+    coordinator = ProtocolCoordinator(
         notion_client=notion_client,
         goals_database_id=goals_db_id,
         todos_database_id=todos_db_id,
         calendar_database_id=calendar_db_id,
-        openai_api_key=os.getenv('OPENAI_API_KEY'),
-        verbose=os.getenv('AGENT_VERBOSE', 'false').lower() == 'true'
+        openai_api_key=OPENAI_KEY,
+        verbose=AGENT_VERBOSE
+    )
+    
+    # Serve repeated read-only requests from the on-disk response cache
+    if use_cache and os.getenv('PROTOCOL_LLM_CACHE', 'true').lower() == 'true':
+        return CachedCoordinator(coordinator)
+    return coordinator
+
+
+@lru_cache(maxsize=None)
+def _goal_agent() -> "GoalAgent":
+    """Get the shared goal agent for this process."""
+    from agents.goal_agent import GoalAgent
+    
+    return GoalAgent(
+        notion_client=get_notion_client(),
+        goals_database_id=_require('NOTION_GOALS_DATABASE_ID', NOTION_GOALS_DB_ID),
+        openai_api_key=OPENAI_KEY
+    )
+
+
+@lru_cache(maxsize=None)
+def _todo_agent() -> "TodoAgent":
+    """Get the shared todo agent for this process."""
+    from agents.todo_agent import TodoAgent
+    
+    return TodoAgent(
+        notion_client=get_notion_client(),
+        todos_database_id=_require('NOTION_TODOS_DATABASE_ID', NOTION_TODOS_DB_ID),
+        openai_api_key=OPENAI_KEY
     )
 
 
 @click.group()
 @click.version_option(version="0.1.0", prog_name="Protocol Manager")
-def protocol_cli():
+@click.pass_context
+def protocol_cli(ctx: click.Context):
     """
     🏠 Protocol Home - AI-powered productivity management system.
     
     Manage your goals, tasks, and schedule with intelligent AI agents.
     """
-    pass
+    ctx.ensure_object(dict)
+
+
+def _coord(ctx: click.Context) -> "ProtocolCoordinator":
+    """Get the coordinator shared by every command run under ``ctx``."""
+    state = ctx.ensure_object(dict)
+    if state.get("coordinator") is None:
+        state["coordinator"] = get_coordinator()
+    return state["coordinator"]
+
+
+def _clears_response_cache(command: Callable) -> Callable:
+    """
+    Clear cached coordinator responses once a command that writes finishes.
+    
+    Writes made outside the coordinator (direct agent calls, setup and
+    import commands) would otherwise leave stale answers in the cache.
+    """
+    @wraps(command)
+    def wrapper(*args, **kwargs):
+        try:
+            return command(*args, **kwargs)
+        finally:
+            from cli.llm_cache import clear_cached_responses
+            clear_cached_responses()
+    return wrapper
 
 
 @protocol_cli.command()
-def status():
+@click.pass_context
+def status(ctx: click.Context):
     """Check the status of all agents and connections."""
     try:
-        coordinator = get_coordinator()
+        coordinator = _coord(ctx)
         status_info = coordinator.get_system_status()
         
         table = Table(title="🏠 Protocol Home System Status")
@@ -1207,9 +1318,10 @@ def status():
 
 
 @protocol_cli.command()
-def commands():
+@click.pass_context
+def commands(ctx: click.Context):
     """Show available commands and examples."""
-    coordinator = get_coordinator()
+    coordinator = _coord(ctx)
     command_list = coordinator.get_available_commands()
     
     console.print(Panel("\n".join(command_list), title="📚 Available Commands", border_style="blue"))
@@ -1255,49 +1367,106 @@ def cli_help():
     console.print(Panel("\n".join(cli_commands), title="🖥️ CLI Commands", border_style="blue"))
 
 
+def _stream_to_console(chunks: Iterator[str], status: str, render: Callable[[str], Any]) -> str:
+    """
+    Show a streamed response as it arrives.
+    
+    A spinner with ``status`` is shown until the first chunk arrives; after
+    that ``render(text_so_far)`` is redrawn live as further chunks come in.
+    
+    Returns:
+        The complete response text
+    """
+    from rich.live import Live
+    
+    chunks = iter(chunks)
+    with console.status(status):
+        text = next(chunks, "")
+    
+    with Live(render(text), console=console, refresh_per_second=10) as live:
+        for chunk in chunks:
+            text += chunk
+            live.update(render(text))
+    return text
+
+
+def _read_pending_lines(window: float) -> List[str]:
+    """
+    Read further stdin lines that arrive within ``window`` seconds of each
+    other, e.g. the rest of a multi-line paste.
+    
+    Stops at the first blank line, at EOF, or once no input arrives within
+    the window. Returns an empty list where stdin cannot be polled.
+    """
+    import select
+    
+    lines = []
+    try:
+        while select.select([sys.stdin], [], [], window)[0]:
+            line = sys.stdin.readline()
+            if not line.strip():
+                break
+            lines.append(line.rstrip("\n"))
+    except (OSError, ValueError):
+        # stdin is not selectable (e.g. on Windows); no batching
+        pass
+    return lines
+
+
+_WELCOME_PANEL = Panel(
+    "🏠 Welcome to Protocol Home Interactive Mode!\n\n"
+    "Type your requests naturally, like:\n"
+    "• 'Create a goal to learn Python'\n"
+    "• 'Show me my tasks for today'\n"
+    "• 'Plan my week'\n\n"
+    "Type 'quit', 'exit', or 'bye' to leave.",
+    title="💬 Interactive Chat Mode",
+    border_style="blue"
+)
+
+
 @protocol_cli.command()
 @click.argument('message', required=False)
-def chat(message: Optional[str]):
+@click.option('--no-cache', is_flag=True, help='Always send requests to the AI agents')
+@click.option('--batch-ms', type=int, default=0, help='Send lines typed/pasted within this many ms as one request (0 disables)')
+@click.pass_context
+def chat(ctx: click.Context, message: Optional[str], no_cache: bool, batch_ms: int):
     """
     Interactive chat mode with the Protocol Home AI assistant.
     
     If MESSAGE is provided, processes it directly. Otherwise, enters interactive mode.
     """
-    coordinator = get_coordinator()
+    coordinator = get_coordinator(use_cache=False) if no_cache else _coord(ctx)
+    
+    # Rephrasings of an earlier read-only request are answered from the
+    # semantic cache when sentence-transformers is available
+    if not no_cache:
+        from cli.llm_cache import CachedCoordinator
+        from cli.semantic_cache import SemanticCachedCoordinator, HAS_SENTENCE_TRANSFORMERS
+        if HAS_SENTENCE_TRANSFORMERS and isinstance(coordinator, CachedCoordinator):
+            coordinator = SemanticCachedCoordinator(coordinator)
     
     if message:
         # Single message mode
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Processing your request...", total=None)
-            
-            try:
-                response = coordinator.process_request(message)
-                progress.stop()
-                console.print(Panel(Markdown(response), title="🤖 Assistant Response", border_style="green"))
-            except Exception as e:
-                progress.stop()
-                console.print(f"❌ [red]Error: {str(e)}[/red]")
+        try:
+            _stream_to_console(
+                coordinator.stream_request(message),
+                "Processing your request...",
+                lambda text: Panel(Markdown(text), title="🤖 Assistant Response", border_style="green"),
+            )
+        except Exception as e:
+            console.print(f"❌ [red]Error: {str(e)}[/red]")
     else:
         # Interactive mode
-        console.print(Panel(
-            "🏠 Welcome to Protocol Home Interactive Mode!\n\n"
-            "Type your requests naturally, like:\n"
-            "• 'Create a goal to learn Python'\n"
-            "• 'Show me my tasks for today'\n"
-            "• 'Plan my week'\n\n"
-            "Type 'quit', 'exit', or 'bye' to leave.",
-            title="💬 Interactive Chat Mode",
-            border_style="blue"
-        ))
+        console.print(_WELCOME_PANEL)
         
         while True:
             try:
                 user_input = console.input("\n[bold cyan]You:[/bold cyan] ")
                 
+                if batch_ms > 0 and user_input.strip():
+                    user_input = "\n".join([user_input] + _read_pending_lines(batch_ms / 1000))
+                
                 if user_input.lower() in ['quit', 'exit', 'bye', 'q']:
                     console.print("👋 [green]Goodbye! Have a productive day![/green]")
                     break
@@ -1305,20 +1474,14 @@ def chat(message: Optional[str]):
                 if not user_input.strip():
                     continue
                 
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=console,
-                ) as progress:
-                    task = progress.add_task("Thinking...", total=None)
-                    
-                    try:
-                        response = coordinator.process_request(user_input)
-                        progress.stop()
-                        console.print(f"\n[bold green]Assistant:[/bold green] {response}")
-                    except Exception as e:
-                        progress.stop()
-                        console.print(f"❌ [red]Error: {str(e)}[/red]")
+                try:
+                    _stream_to_console(
+                        coordinator.stream_request(user_input),
+                        "Thinking...",
+                        lambda text: Text.assemble("\n", ("Assistant:", "bold green"), " ", text),
+                    )
+                except Exception as e:
+                    console.print(f"❌ [red]Error: {str(e)}[/red]")
                         
             except KeyboardInterrupt:
                 console.print("\n👋 [green]Goodbye! Have a productive day![/green]")
@@ -1340,17 +1503,11 @@ def goal():
 @click.option('--target-date', '-t', help='Target completion date (YYYY-MM-DD)')
 @click.option('--priority', '-p', type=click.Choice(['High', 'Medium', 'Low']), default='Medium', help='Priority level')
 @click.option('--category', '-c', default='Personal', help='Goal category')
+@_clears_response_cache
 def create(title: str, description: str, target_date: str, priority: str, category: str):
     """Create a new goal."""
     try:
-        notion_client = get_notion_client()
-        goals_db_id = os.getenv('NOTION_GOALS_DATABASE_ID')
-        
-        agent = GoalAgent(
-            notion_client=notion_client,
-            goals_database_id=goals_db_id,
-            openai_api_key=os.getenv('OPENAI_API_KEY')
-        )
+        agent = _goal_agent()
         
         response = agent.create_goal(
             title=title,
@@ -1366,20 +1523,13 @@ def create(title: str, description: str, target_date: str, priority: str, catego
         console.print(f"❌ [red]Error creating goal: {str(e)}[/red]")
 
 
-@goal.command()
+@goal.command(name='list')
 @click.option('--category', '-c', help='Filter by category')
 @click.option('--status', '-s', help='Filter by status')
-def list(category: str, status: str):
+def list_goals(category: str, status: str):
     """List goals with optional filters."""
     try:
-        notion_client = get_notion_client()
-        goals_db_id = os.getenv('NOTION_GOALS_DATABASE_ID')
-        
-        agent = GoalAgent(
-            notion_client=notion_client,
-            goals_database_id=goals_db_id,
-            openai_api_key=os.getenv('OPENAI_API_KEY')
-        )
+        agent = _goal_agent()
         
         response = agent.get_goals_summary(category=category)
         console.print(Panel(Markdown(response), title="📊 Goals List", border_style="blue"))
@@ -1392,14 +1542,7 @@ def list(category: str, status: str):
 def progress():
     """Show goal progress and analytics."""
     try:
-        notion_client = get_notion_client()
-        goals_db_id = os.getenv('NOTION_GOALS_DATABASE_ID')
-        
-        agent = GoalAgent(
-            notion_client=notion_client,
-            goals_database_id=goals_db_id,
-            openai_api_key=os.getenv('OPENAI_API_KEY')
-        )
+        agent = _goal_agent()
         
         response = agent.track_progress()
         console.print(Panel(Markdown(response), title="📈 Goal Progress", border_style="green"))
@@ -1420,17 +1563,11 @@ def todo():
 @click.option('--project', '-pr', help='Project or category')
 @click.option('--due-date', '-d', help='Due date (YYYY-MM-DD)')
 @click.option('--time-estimate', '-t', type=int, help='Estimated time in minutes')
+@_clears_response_cache
 def add(title: str, priority: str, project: str, due_date: str, time_estimate: int):
     """Add a new task."""
     try:
-        notion_client = get_notion_client()
-        todos_db_id = os.getenv('NOTION_TODOS_DATABASE_ID')
-        
-        agent = TodoAgent(
-            notion_client=notion_client,
-            todos_database_id=todos_db_id,
-            openai_api_key=os.getenv('OPENAI_API_KEY')
-        )
+        agent = _todo_agent()
         
         response = agent.add_task(
             title=title,
@@ -1446,33 +1583,14 @@ def add(title: str, priority: str, project: str, due_date: str, time_estimate: i
         console.print(f"❌ [red]Error adding task: {str(e)}[/red]")
 
 
-@todo.command()
+@todo.command(name='list')
 @click.option('--project', '-p', help='Filter by project')
 @click.option('--status', '-s', help='Filter by status')
 @click.option('--today', is_flag=True, help='Show only today\'s tasks')
-def list(project: str, status: str, today: bool):
+def list_todos(project: str, status: str, today: bool):
     """List tasks with optional filters."""
     try:
-        notion_client = get_notion_client()
-        todos_db_id = os.getenv('NOTION_TODOS_DATABASE_ID')
-        
-        agent = TodoAgent(
-            notion_client=notion_client,
-            todos_database_id=todos_db_id,
-            openai_api_key=os.getenv('OPENAI_API_KEY')
-        )
-        
-        if today:
-            response = agent.get_today_tasks()
-        elif project:
-            response = agent.get_project_tasks(project)
-        else:
-            # Use the coordinator to handle complex queries
-            coordinator = get_coordinator()
-            query = "Show me my tasks"
-            if status:
-                query += f" with status {status}"
-            response = coordinator.process_request(query)
+        response = _todo_agent().list_tasks(status=status, project=project, due_today=today)
         
         console.print(Panel(Markdown(response), title="📋 Tasks List", border_style="blue"))
         
@@ -1486,14 +1604,7 @@ def list(project: str, status: str, today: bool):
 def prioritize(method: str, project: str):
     """Prioritize tasks using various frameworks."""
     try:
-        notion_client = get_notion_client()
-        todos_db_id = os.getenv('NOTION_TODOS_DATABASE_ID')
-        
-        agent = TodoAgent(
-            notion_client=notion_client,
-            todos_database_id=todos_db_id,
-            openai_api_key=os.getenv('OPENAI_API_KEY')
-        )
+        agent = _todo_agent()
         
         response = agent.prioritize_tasks(method=method, project=project)
         console.print(Panel(Markdown(response), title="🎯 Task Prioritization", border_style="yellow"))
@@ -1506,10 +1617,12 @@ def prioritize(method: str, project: str):
 @click.option('--priority', '-p', help='Schedule todos with this priority (High, Medium, Low, Urgent)')
 @click.option('--project', '-pr', help='Schedule todos from this project')
 @click.option('--date', '-d', help='Date to schedule for (YYYY-MM-DD, defaults to tomorrow)')
-def schedule(priority: str, project: str, date: str):
+@click.pass_context
+@_clears_response_cache
+def schedule(ctx: click.Context, priority: str, project: str, date: str):
     """Schedule existing todos as calendar events."""
     try:
-        coordinator = get_coordinator()
+        coordinator = _coord(ctx)
         
         # Build the scheduling request
         request = "Schedule my todos"
@@ -1522,15 +1635,8 @@ def schedule(priority: str, project: str, date: str):
         else:
             request += " for tomorrow"
             
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Scheduling todos...", total=None)
-            
+        with console.status("Scheduling todos...", spinner="dots"):
             response = coordinator.process_request(request)
-            progress.stop()
             
         console.print(Panel(Markdown(response), title="📅 Todo Scheduling", border_style="green"))
         
@@ -1546,10 +1652,11 @@ def schedule():
 
 @schedule.command()
 @click.option('--date', '-d', help='Date to view (YYYY-MM-DD, defaults to today)')
-def view(date: str):
+@click.pass_context
+def view(ctx: click.Context, date: str):
     """View your schedule for a specific date."""
     try:
-        coordinator = get_coordinator()
+        coordinator = _coord(ctx)
         
         request = "Show me my schedule"
         if date:
@@ -1569,10 +1676,12 @@ def view(date: str):
 @click.argument('datetime')
 @click.option('--duration', '-d', type=int, default=60, help='Duration in minutes')
 @click.option('--location', '-l', help='Event location')
-def create(title: str, datetime: str, duration: int, location: str):
+@click.pass_context
+@_clears_response_cache
+def create(ctx: click.Context, title: str, datetime: str, duration: int, location: str):
     """Create a new calendar event."""
     try:
-        coordinator = get_coordinator()
+        coordinator = _coord(ctx)
         
         request = f"Create a calendar event '{title}' at {datetime}"
         if duration != 60:
@@ -1590,10 +1699,11 @@ def create(title: str, datetime: str, duration: int, location: str):
 @schedule.command()
 @click.option('--date', '-d', help='Date to find free time (YYYY-MM-DD, defaults to today)')
 @click.option('--duration', '-dur', type=int, default=60, help='Duration needed in minutes')
-def free(date: str, duration: int):
+@click.pass_context
+def free(ctx: click.Context, date: str, duration: int):
     """Find free time slots in your schedule."""
     try:
-        coordinator = get_coordinator()
+        coordinator = _coord(ctx)
         
         request = f"Find {duration} minutes of free time"
         if date:
@@ -1608,32 +1718,102 @@ def free(date: str, duration: int):
         console.print(f"❌ [red]Error finding free time: {str(e)}[/red]")
 
 
+def _select_name(properties: Dict[str, Any], name: str) -> Optional[str]:
+    """Return the option name of a select property, if set."""
+    return (properties.get(name, {}).get("select") or {}).get("name")
+
+
+def _title_text(properties: Dict[str, Any], name: str) -> str:
+    """Return the plain text of a title property."""
+    return "".join(t.get("plain_text", "") for t in properties.get(name, {}).get("title", []))
+
+
+def _overview_markdown(goals: List[Any], todos: List[Any], events: List[Dict[str, Any]], today: str) -> str:
+    """Format goals, open todos and today's events as the overview Markdown."""
+    lines = [f"## 🎯 Goals ({len(goals)})"]
+    for goal in goals:
+        props = goal.properties
+        progress = props.get("Progress", {}).get("number") or 0
+        lines.append(
+            f"- **{_title_text(props, 'Name')}** — {_select_name(props, 'Status') or 'Not Started'}, {progress}%"
+        )
+    
+    open_todos = [
+        todo for todo in todos
+        if not todo.properties.get("Completed", {}).get("checkbox")
+        and _select_name(todo.properties, "Status") != "Done"
+    ]
+    lines += ["", f"## 📋 Open Tasks ({len(open_todos)} of {len(todos)})"]
+    for todo in open_todos:
+        props = todo.properties
+        due = (props.get("Due Date", {}).get("date") or {}).get("start")
+        line = f"- **{_title_text(props, 'Task')}** ({_select_name(props, 'Priority') or 'Medium'})"
+        lines.append(f"{line}, due {due}" if due else line)
+    
+    lines += ["", f"## 📅 Today ({today})"]
+    for event in events:
+        props = event.get("properties", {})
+        start = (props.get("Start Date", {}).get("date") or {}).get("start", "")
+        lines.append(f"- {start[11:16] or 'All day'} **{_title_text(props, 'Title')}**")
+    if not events:
+        lines.append("No events scheduled.")
+    
+    return "\n".join(lines)
+
+
 @protocol_cli.command()
-def overview():
+@click.pass_context
+def overview(ctx: click.Context):
     """Show an overview of goals, tasks, and schedule."""
     try:
-        coordinator = get_coordinator()
-        response = coordinator.process_request("Show me an overview of my goals and tasks")
+        notion_client = get_notion_client()
+        goals_db_id = _require('NOTION_GOALS_DATABASE_ID', NOTION_GOALS_DB_ID)
+        todos_db_id = _require('NOTION_TODOS_DATABASE_ID', NOTION_TODOS_DB_ID)
+        calendar_db_id = _require('NOTION_CALENDAR_DATABASE_ID', NOTION_CALENDAR_DB_ID)
+        today = datetime.now(_CDT).strftime('%Y-%m-%d')
+
+        # The three reads are independent, so they are fetched at the same
+        # time and formatted locally instead of going through the agents
+        with console.status("Loading overview..."):
+            goals, todos, events = run_concurrently([
+                partial(notion_client.databases.query_all, goals_db_id),
+                partial(notion_client.databases.query_all, todos_db_id),
+                partial(
+                    notion_client.databases.query,
+                    calendar_db_id,
+                    filter_criteria={"property": "Start Date", "date": {"equals": today}},
+                    sorts=[{"property": "Start Date", "direction": "ascending"}],
+                ),
+            ])
+
+            if any(isinstance(result, Exception) for result in (goals, todos, events)):
+                response = _coord(ctx).process_request("Show me an overview of my goals and tasks")
+            else:
+                response = _overview_markdown(goals, todos, events.get("results", []), today)
+
         console.print(Panel(Markdown(response), title="🏠 Protocol Home Overview", border_style="cyan"))
-        
+
     except Exception as e:
         console.print(f"❌ [red]Error getting overview: {str(e)}[/red]")
 
 
 @protocol_cli.command()
+@_clears_response_cache
 def setup_databases():
     """Create Notion databases for Protocol Home agents."""
     try:
         console.print("🏠 [bold blue]Setting up Notion databases...[/bold blue]")
         
-        # Import and run the setup script
-        import subprocess
-        import sys
+        # Run the setup script in this process rather than a new interpreter
+        from setup_notion_databases import main as setup_main
         
-        result = subprocess.run([sys.executable, "setup_notion_databases.py"], 
-                              capture_output=False, text=True)
+        try:
+            returncode = setup_main()
+        except SystemExit as e:
+            # The script exits directly when the Notion client can't be created
+            returncode = e.code
         
-        if result.returncode == 0:
+        if returncode == 0:
             console.print("✅ [green]Database setup completed![/green]")
         else:
             console.print("❌ [red]Database setup failed[/red]")
@@ -1648,20 +1828,14 @@ def setup_databases():
 @click.option('--page-title', '-p', default="Goals & Rules", help='Title of the Notion page to read')
 @click.option('--force', '-f', is_flag=True, help='Force import even if goals already exist')
 @click.option('--schedule/--no-schedule', default=True, help='Automatically schedule high-priority todos (default: enabled)')
+@_clears_response_cache
 def import_goals_rules(page_title: str, force: bool, schedule: bool):
     """Import goals and todos from your 'Goals & Rules' Notion page with optional auto-scheduling."""
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Setting up goals and todos from Notion page...", total=None)
-            
+        with console.status("Setting up goals and todos from Notion page...", spinner="dots"):
             result = setup_goals_and_todos_from_page(page_title, enable_scheduling=schedule)
-            progress.stop()
             
-            console.print(Panel(Markdown(result), title="📚 Goals & Rules Import", border_style="green"))
+        console.print(Panel(Markdown(result), title="📚 Goals & Rules Import", border_style="green"))
             
     except Exception as e:
         console.print(f"❌ [red]Error importing goals and rules: {str(e)}[/red]")
@@ -1670,6 +1844,7 @@ def import_goals_rules(page_title: str, force: bool, schedule: bool):
 @protocol_cli.command()
 @click.option('--goals-db-id', envvar='NOTION_GOALS_DATABASE_ID', help='Goals database ID')
 @click.option('--todos-db-id', envvar='NOTION_TODOS_DATABASE_ID', help='Todos database ID')
+@_clears_response_cache
 def link_todos_to_goals(goals_db_id: str, todos_db_id: str):
     """Manually link existing todos to goals using the relation properties."""
     try:
@@ -1682,55 +1857,50 @@ def link_todos_to_goals(goals_db_id: str, todos_db_id: str):
         
         notion_client = get_notion_client()
         
-        # Get all goals
-        goals_response = notion_client.databases.query(database_id=goals_db_id)
-        goals = goals_response.results
-        
-        # Get all todos
-        todos_response = notion_client.databases.query(database_id=todos_db_id)
-        todos = todos_response.results
+        # Get all goals and todos; the two databases are independent so both
+        # are fetched (and paginated through) at the same time
+        goals, todos = run_concurrently([
+            partial(notion_client.databases.query_all, goals_db_id),
+            partial(notion_client.databases.query_all, todos_db_id),
+        ])
+        for result in (goals, todos):
+            if isinstance(result, Exception):
+                raise result
         
         console.print(f"📊 Found {len(goals)} goals and {len(todos)} todos")
         
-        # Create a simple mapping interface
-        goal_mapping = {}
-        for goal in goals:
-            title_prop = goal.properties.get("Name", {}).get("title", [])
-            if title_prop:
-                goal_title = title_prop[0].get("plain_text", "")
-                goal_mapping[goal_title] = goal.id
-                console.print(f"   🎯 {goal_title} (ID: {goal.id})")
-        
-        console.print("\n📋 Available todos:")
-        for todo in todos:
-            title_prop = todo.properties.get("Task", {}).get("title", [])
-            if title_prop:
-                todo_title = title_prop[0].get("plain_text", "")
-                console.print(f"   📋 {todo_title}")
-        
-        console.print("\n💡 To link todos to goals:")
-        console.print("1. Open a todo in Notion")
-        console.print("2. Click on the 'Related Goals' field")
-        console.print("3. Search for and select the appropriate goal")
-        console.print("4. The goal will automatically show the todo in its 'Related Todos' field")
-        
-        # Show current relations
-        linked_todos = 0
-        for todo in todos:
-            related_goals = todo.properties.get("Related Goals", {}).get("relation", [])
-            if related_goals:
-                linked_todos += 1
-        
-        console.print(f"\n🔗 Current status: {linked_todos}/{len(todos)} todos have goal relations")
+        goal_titles = [
+            (goal.properties["Name"]["title"][0].get("plain_text", ""), goal.id)
+            for goal in goals
+            if goal.properties.get("Name", {}).get("title")
+        ]
+        todo_titles = [
+            todo.properties["Task"]["title"][0].get("plain_text", "")
+            for todo in todos
+            if todo.properties.get("Task", {}).get("title")
+        ]
+        linked_todos = sum(
+            1 for todo in todos if todo.properties.get("Related Goals", {}).get("relation")
+        )
+        
+        lines = [f"   🎯 {goal_title} (ID: {goal_id})" for goal_title, goal_id in goal_titles]
+        lines.append("\n📋 Available todos:")
+        lines.extend(f"   📋 {todo_title}" for todo_title in todo_titles)
+        lines += [
+            "\n💡 To link todos to goals:",
+            "1. Open a todo in Notion",
+            "2. Click on the 'Related Goals' field",
+            "3. Search for and select the appropriate goal",
+            "4. The goal will automatically show the todo in its 'Related Todos' field",
+            f"\n🔗 Current status: {linked_todos}/{len(todos)} todos have goal relations",
+        ]
+        console.print("\n".join(lines))
         
     except Exception as e:
         console.print(f"❌ [red]Error linking todos to goals: {str(e)}[/red]")
 
 
-@protocol_cli.command()
-def setup():
-    """Setup guide for Protocol Home."""
-    setup_text = """
+_SETUP_TEXT = """
 # 🏠 Protocol Home Setup Guide
 
 ## 1. Environment Configuration
@@ -1864,23 +2034,30 @@ Your scheduling constraints are automatically integrated into the AI agents:
 - **Todo Agent**: Schedules todos at constraint-appropriate times
 - **Coordinator**: Routes requests considering all constraint categories
 """
-    
-    console.print(Panel(Markdown(setup_text), title="📚 Setup Guide", border_style="blue"))
 
 
-@schedule.command()
-def constraints():
-    """View current scheduling constraints."""
-    try:
-        coordinator = get_coordinator()
-        constraints = coordinator.schedule_agent.scheduling_constraints.to_dict()
-        
-        # Format constraints for display
-        working_hours = constraints["working_hours"]
-        health_timing = constraints["health_optimized_timing"]
-        recovery = constraints["recovery_rest"]
-        
-        constraints_text = f"""
+@lru_cache(maxsize=None)
+def _setup_markdown() -> Markdown:
+    """Parse the setup guide once per process."""
+    return Markdown(_SETUP_TEXT)
+
+
+@protocol_cli.command()
+def setup():
+    """Setup guide for Protocol Home."""
+    console.print(Panel(_setup_markdown(), title="📚 Setup Guide", border_style="blue"))
+
+
+def _render_constraints(coordinator: "ProtocolCoordinator") -> None:
+    """Print the coordinator's current scheduling constraints."""
+    constraints = coordinator.schedule_agent.scheduling_constraints.to_dict()
+    
+    # Format constraints for display
+    working_hours = constraints["working_hours"]
+    health_timing = constraints["health_optimized_timing"]
+    recovery = constraints["recovery_rest"]
+    
+    constraints_text = f"""
 # ⏰ Current Scheduling Constraints
 
 ## Working Hours
@@ -1902,12 +2079,20 @@ def constraints():
 - **Sleep Protection**: {recovery['sleep_protection']} hours before bedtime for intense exercise
 
 ## Monthly Adjustments
-{chr(10).join(f"- **{month.title()}**: {', '.join(f'{k}={v}' for k, v in monthly.items())}") if constraints.get('monthly_adjustments') else "- None configured"}
+{chr(10).join(f"- **{month.title()}**: {', '.join(f'{k}={v}' for k, v in monthly.items())}" for month, monthly in constraints['monthly_adjustments'].items()) if constraints.get('monthly_adjustments') else "- None configured"}
 
 **Last Updated**: {constraints.get('last_updated', 'Unknown')}
 """
-        
-        console.print(Panel(Markdown(constraints_text), title="⏰ Scheduling Constraints", border_style="cyan"))
+    
+    console.print(Panel(Markdown(constraints_text), title="⏰ Scheduling Constraints", border_style="cyan"))
+
+
+@schedule.command()
+@click.pass_context
+def constraints(ctx: click.Context):
+    """View current scheduling constraints."""
+    try:
+        _render_constraints(_coord(ctx))
         
     except Exception as e:
         console.print(f"❌ [red]Error viewing constraints: {str(e)}[/red]")
@@ -1923,19 +2108,21 @@ def constraints():
 @click.option('--meditation', help='Meditation timing preference (morning/evening/transition)')
 @click.option('--strength-rest', type=int, help='Strength training rest hours')
 @click.option('--sleep-protection', type=int, help='Sleep protection hours')
-def update_constraints(month: str, working_hours: str, buffer_time: int, ml_work: str, 
+@click.pass_context
+@_clears_response_cache
+def update_constraints(ctx: click.Context, month: str, working_hours: str, buffer_time: int, ml_work: str, 
                       strength_training: str, cardio: str, meditation: str, 
                       strength_rest: int, sleep_protection: int):
     """Update scheduling constraints for a specific month."""
     try:
-        coordinator = get_coordinator()
+        coordinator = _coord(ctx)
         
         # Build constraints update
         constraints_update = {}
         
         if working_hours:
             # Parse working hours (e.g., "09:00-18:00")
-            time_match = re.search(r'(\d{2}):(\d{2})-(\d{2}):(\d{2})', working_hours)
+            time_match = _WORKING_HOURS_RE.match(working_hours.strip())
             if time_match:
                 start_hour, start_minute, end_hour, end_minute = map(int, time_match.groups())
                 constraints_update["working_hours"] = {
@@ -1981,7 +2168,7 @@ def update_constraints(month: str, working_hours: str, buffer_time: int, ml_work
             console.print(f"  • {category}: {values}")
         
         # Show updated constraints
-        constraints()
+        _render_constraints(coordinator)
         
     except Exception as e:
         console.print(f"❌ [red]Error updating constraints: {str(e)}[/red]")
@@ -1989,10 +2176,12 @@ def update_constraints(month: str, working_hours: str, buffer_time: int, ml_work
 
 @schedule.command()
 @click.option('--month', '-m', help='Month to reset (e.g., "January", "Feb") or "all" for all months')
-def reset_constraints(month: str):
+@click.pass_context
+@_clears_response_cache
+def reset_constraints(ctx: click.Context, month: str):
     """Reset scheduling constraints to defaults."""
     try:
-        coordinator = get_coordinator()
+        coordinator = _coord(ctx)
         
         if month and month.lower() != "all":
             # Reset specific month
@@ -2004,75 +2193,95 @@ def reset_constraints(month: str):
             console.print("✅ [green]Reset all monthly constraint adjustments[/green]")
         
         # Show current constraints
-        constraints()
+        _render_constraints(coordinator)
         
     except Exception as e:
         console.print(f"❌ [red]Error resetting constraints: {str(e)}[/red]")
 
 
+@lru_cache(maxsize=32)
+def _constraints_table(constraints_json: str) -> Table:
+    """
+    Build the check-constraints table.
+    
+    Keyed on the JSON form of the constraints so repeated checks with
+    unchanged constraints reuse the same renderable.
+    """
+    constraints = json.loads(constraints_json)
+    working_hours = constraints["working_hours"]
+    health_timing = constraints["health_optimized_timing"]
+    recovery = constraints["recovery_rest"]
+    monthly = constraints.get("monthly_adjustments", {})
+    
+    table = Table(show_header=False, box=None, padding=(0, 1))
+    table.add_column("Setting", style="bold")
+    table.add_column("Value")
+    
+    table.add_row(Text("Working Hours", style="bold cyan"))
+    table.add_row("Core Hours", f"{working_hours['core_hours']['start']}-{working_hours['core_hours']['end']} {working_hours['core_hours']['timezone']}")
+    table.add_row("Buffer Time", f"{working_hours['buffer_time']} minutes between all scheduled blocks")
+    table.add_row("Transit Time", f"{working_hours['transit_time']} minutes to get to work")
+    table.add_row("No Double-Booking", "Enabled" if working_hours['no_double_booking'] else "Disabled")
+    
+    table.add_row()
+    table.add_row(Text("Health-Optimized Timing", style="bold cyan"))
+    table.add_row("ML Deep Work", f"{health_timing['ml_deep_work']} (peak cognitive function)")
+    table.add_row("Strength Training", f"{health_timing['strength_training']} (optimal performance)")
+    table.add_row("Cardio", f"{health_timing['cardio']} timing")
+    table.add_row("Meditation", f"{health_timing['meditation']} timing")
+    
+    table.add_row()
+    table.add_row(Text("Recovery & Rest", style="bold cyan"))
+    table.add_row("Strength Training Rest", f"{recovery['strength_training_rest']} hours between major muscle groups")
+    table.add_row("Cardio Active Recovery", "Enabled" if recovery['cardio_active_recovery'] else "Disabled")
+    table.add_row("Sleep Protection", f"{recovery['sleep_protection']} hours before bedtime for intense exercise")
+    
+    table.add_row()
+    table.add_row(Text("Month-Specific Adjustments", style="bold cyan"))
+    for key, values in monthly.items():
+        if isinstance(values, dict):
+            values = ", ".join(f"{k}={v}" for k, v in values.items())
+        table.add_row(key.replace('_', ' ').title(), str(values))
+    if not monthly:
+        table.add_row("None for this month", "")
+    
+    return table
+
+
 @schedule.command()
 @click.option('--date', '-d', help='Date to check (YYYY-MM-DD, defaults to today)')
-def check_constraints(date: str):
+@click.pass_context
+def check_constraints(ctx: click.Context, date: str):
     """Check how constraints apply to a specific date."""
     try:
-        coordinator = get_coordinator()
+        coordinator = _coord(ctx)
         
         if not date:
-            from datetime import datetime
             date = datetime.now().strftime("%Y-%m-%d")
         
         constraints = coordinator.schedule_agent.get_constraints_for_date(date)
         
-        # Format for display
-        working_hours = constraints["working_hours"]
-        health_timing = constraints["health_optimized_timing"]
-        recovery = constraints["recovery_rest"]
-        monthly = constraints.get("monthly_adjustments", {})
-        
-        constraints_text = f"""
-# ⏰ Constraints for {date}
-
-## Working Hours
-- **Core Hours**: {working_hours['core_hours']['start']}-{working_hours['core_hours']['end']} {working_hours['core_hours']['timezone']}
-- **Buffer Time**: {working_hours['buffer_time']} minutes between all scheduled blocks
-- **Transit Time**: {working_hours['transit_time']} minutes to get to work
-- **No Double-Booking**: {'Enabled' if working_hours['no_double_booking'] else 'Disabled'}
-
-## Health-Optimized Timing
-- **ML Deep Work**: {health_timing['ml_deep_work']} (peak cognitive function)
-- **Strength Training**: {health_timing['strength_training']} (optimal performance)
-- **Cardio**: {health_timing['cardio']} timing
-- **Meditation**: {health_timing['meditation']} timing
-
-## Recovery & Rest
-- **Strength Training Rest**: {recovery['strength_training_rest']} hours between major muscle groups
-- **Cardio Active Recovery**: {'Enabled' if recovery['cardio_active_recovery'] else 'Disabled'}
-- **Sleep Protection**: {recovery['sleep_protection']} hours before bedtime for intense exercise
-
-## Month-Specific Adjustments
-{chr(10).join(f"- **{k.title()}**: {', '.join(f'{k2}={v2}' for k2, v2 in v.items())}") if monthly else "- None for this month"}
-"""
-        
-        console.print(Panel(Markdown(constraints_text), title=f"⏰ Constraints for {date}", border_style="cyan"))
+        # last_updated is always "now" and is not displayed, so it is left
+        # out of the cache key
+        shown = {key: value for key, value in constraints.items() if key != "last_updated"}
+        table = _constraints_table(json.dumps(shown, sort_keys=True, default=str))
+        console.print(Panel(table, title=f"⏰ Constraints for {date}", border_style="cyan"))
         
-    except Exception as e:
-        console.print(f"❌ [red]Error checking constraints: {str(e)}[/red]")
+    except (KeyError, ValueError, TypeError) as e:
+        console.print(f"❌ [red]Error checking constraints: {e}[/red]")
 
 
 @schedule.command()
 @click.option('--date', '-d', help='Date to plan for (YYYY-MM-DD, defaults to tomorrow)')
-def plan_with_constraints(date: str):
+@click.pass_context
+def plan_with_constraints(ctx: click.Context, date: str):
     """Create an optimal schedule plan considering all constraints."""
     try:
-        coordinator = get_coordinator()
+        coordinator = _coord(ctx)
         
         if not date:
-            from datetime import datetime, timedelta
             date = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
         
-        # Get todos for the date
-        todos_response = coordinator.todo_agent.get_today_tasks()
-        
         # For demo purposes, create some sample todos
         sample_todos = [
             {"title": "ML Deep Work Session", "priority": "High", "project": "Machine Learning"},
@@ -2087,8 +2296,8 @@ def plan_with_constraints(date: str):
         
         console.print(Panel(Markdown(optimal_schedule), title=f"📅 Optimal Schedule for {date}", border_style="green"))
         
-    except Exception as e:
-        console.print(f"❌ [red]Error planning with constraints: {str(e)}[/red]")
+    except (KeyError, ValueError, TypeError) as e:
+        console.print(f"❌ [red]Error planning with constraints: {e}[/red]")
 
 
 def main():
@@ -2098,7 +2307,7 @@ def main():
     except KeyboardInterrupt:
         console.print("\n👋 [green]Goodbye![/green]")
     except Exception as e:
-        console.print(f"❌ [red]Unexpected error: {str(e)}[/red]")
+        console.print(f"❌ [red]Unexpected error: {e}[/red]")
 
 
 if __name__ == '__main__':
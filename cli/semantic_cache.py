@@ -0,0 +1,289 @@
+"""
+Semantic response cache for interactive chat.
+
+This module provides SemanticCachedCoordinator, which answers a request
+from a previously seen request with the same meaning ("show me today's
+tasks" vs "what are my tasks for today") by comparing sentence embeddings,
+so rephrased read-only prompts skip the agent/LLM pipeline entirely.
+
+Embeddings come from sentence-transformers, which is optional; when it is
+not installed the semantic layer is simply not used.
+"""
+
+import atexit
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Any, Iterator, List, Optional, Tuple
+
+from .llm_cache import DEFAULT_SEMANTIC_CACHE_PATH, _CACHE_TIMEZONE, is_error_response, is_mutating
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    HAS_SENTENCE_TRANSFORMERS = True
+except ImportError:
+    HAS_SENTENCE_TRANSFORMERS = False
+
+
+DEFAULT_CACHE_PATH = DEFAULT_SEMANTIC_CACHE_PATH
+DEFAULT_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_THRESHOLD = 0.92
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_SAVE_EVERY = 20
+
+# Words that pin a request to a particular time. "today" and "tomorrow"
+# embed almost identically, so these and any numbers must match exactly
+# before a cached answer is reused.
+_TEMPORAL_WORDS = frozenset((
+    "today", "tonight", "tomorrow", "yesterday", "now", "morning", "afternoon",
+    "evening", "this", "next", "last", "week", "weekend", "month", "year",
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+    "january", "february", "march", "april", "may", "june", "july", "august",
+    "september", "october", "november", "december",
+))
+_WORD_RE = re.compile(r"\w+")
+
+
+def temporal_signature(request: str) -> str:
+    """Return the date words and numbers in a request, as a comparable string."""
+    return " ".join(sorted({
+        word for word in _WORD_RE.findall(request.lower())
+        if word in _TEMPORAL_WORDS or any(char.isdigit() for char in word)
+    }))
+
+
+def _today() -> str:
+    return datetime.now(_CACHE_TIMEZONE).date().isoformat()
+
+
+class SemanticCache:
+    """
+    In-memory matrix of normalized prompt embeddings with their responses,
+    persisted to a single ``.npz`` file.
+
+    A cached answer is only reused on the day it was stored and when the
+    request's date words and numbers match exactly. New entries are written
+    to disk every ``save_every`` additions and when the process exits.
+
+    Since embeddings are L2-normalized, one matrix-vector product gives the
+    cosine similarity of a new prompt against every cached prompt.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        model_name: str = DEFAULT_MODEL_NAME,
+        threshold: float = DEFAULT_THRESHOLD,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        save_every: int = DEFAULT_SAVE_EVERY,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            path: File the cache is loaded from and saved to
+            model_name: sentence-transformers model used to embed prompts
+            threshold: Minimum cosine similarity for a cached answer to be used
+            ttl: Seconds a stored response stays valid
+            max_entries: Maximum number of responses kept (oldest dropped first)
+            save_every: Number of additions buffered before writing to disk
+
+        Raises:
+            ImportError: If sentence-transformers is not installed
+        """
+        if not HAS_SENTENCE_TRANSFORMERS:
+            raise ImportError("sentence-transformers is required for the semantic cache")
+
+        self.path = path
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.save_every = save_every
+        self._model_name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+
+        self._reset()
+        self._load()
+        atexit.register(self.flush)
+
+    def _encode(self, text: str) -> "np.ndarray":
+        if self._model is None:
+            self._model = SentenceTransformer(self._model_name)
+        return self._model.encode(text, normalize_embeddings=True).astype(np.float32)
+
+    def _reset(self) -> None:
+        self._embeddings = np.empty((0, 0), dtype=np.float32)
+        self._responses: List[str] = []
+        self._days: List[str] = []
+        self._signatures: List[str] = []
+        self._created_at = np.empty(0, dtype=np.float64)
+        self._unsaved = 0
+        self._disk_mtime = None
+
+    def _file_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _load(self) -> None:
+        self._disk_mtime = self._file_mtime()
+        if self._disk_mtime is None:
+            return
+        try:
+            with np.load(self.path) as data:
+                self._embeddings = data["embeddings"].astype(np.float32)
+                self._responses = data["responses"].tolist()
+                self._days = data["days"].tolist()
+                self._signatures = data["signatures"].tolist()
+                self._created_at = data["created_at"]
+        except (OSError, KeyError, ValueError):
+            # A corrupt or outdated cache file is just treated as empty
+            self._reset()
+
+    def _sync_with_disk(self) -> None:
+        """Reload if another process cleared or rewrote the cache file."""
+        if self._file_mtime() != self._disk_mtime:
+            self._reset()
+            self._load()
+
+    def _save(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.savez(
+            self.path,
+            embeddings=self._embeddings,
+            responses=np.array(self._responses, dtype=str),
+            days=np.array(self._days, dtype=str),
+            signatures=np.array(self._signatures, dtype=str),
+            created_at=self._created_at,
+        )
+        self._unsaved = 0
+        self._disk_mtime = self._file_mtime()
+
+    def flush(self) -> None:
+        """Write any buffered additions to disk."""
+        with self._lock:
+            if self._unsaved:
+                self._save()
+
+    def lookup(self, request: str) -> Tuple[Optional[str], "np.ndarray"]:
+        """
+        Find the cached response closest in meaning to ``request``.
+
+        Returns:
+            (response or None, embedding of ``request``); the embedding can be
+            passed to ``add`` so a miss does not embed the prompt twice
+        """
+        query = self._encode(request)
+        with self._lock:
+            self._sync_with_disk()
+            if not self._responses:
+                return None, query
+            sims = self._embeddings @ query
+            today = _today()
+            signature = temporal_signature(request)
+            usable = (self._created_at >= time.time() - self.ttl) & np.array([
+                day == today and entry_signature == signature
+                for day, entry_signature in zip(self._days, self._signatures)
+            ])
+            sims[~usable] = -1.0
+            index = int(sims.argmax())
+            if sims[index] > self.threshold:
+                return self._responses[index], query
+        return None, query
+
+    def add(self, request: str, embedding: "np.ndarray", response: str) -> None:
+        """Store ``response`` for ``request``, whose embedding is given."""
+        with self._lock:
+            if self._responses:
+                self._embeddings = np.vstack([self._embeddings, embedding])
+            else:
+                self._embeddings = embedding.reshape(1, -1)
+            self._responses.append(response)
+            self._days.append(_today())
+            self._signatures.append(temporal_signature(request))
+            self._created_at = np.append(self._created_at, time.time())
+
+            if len(self._responses) > self.max_entries:
+                self._embeddings = self._embeddings[-self.max_entries:]
+                self._responses = self._responses[-self.max_entries:]
+                self._days = self._days[-self.max_entries:]
+                self._signatures = self._signatures[-self.max_entries:]
+                self._created_at = self._created_at[-self.max_entries:]
+
+            self._unsaved += 1
+            if self._unsaved >= self.save_every:
+                self._save()
+
+    def clear(self) -> None:
+        """Drop every stored response."""
+        with self._lock:
+            self._reset()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+class SemanticCachedCoordinator:
+    """
+    Wrap a coordinator so read-only requests similar in meaning to an earlier
+    one are answered from a SemanticCache.
+
+    Mutating requests always go to the wrapped coordinator and clear the
+    cache. Every other attribute is delegated to the wrapped coordinator.
+    """
+
+    def __init__(self, coordinator: Any, cache: Optional[SemanticCache] = None) -> None:
+        """
+        Initialize the wrapper.
+
+        Args:
+            coordinator: The coordinator to wrap
+            cache: Cache to use (defaults to the on-disk cache in ~/.protocol)
+        """
+        self.coordinator = coordinator
+        self.cache = cache if cache is not None else SemanticCache()
+
+    def process_request(self, user_input: str) -> str:
+        """Process a request, answering from the cache when possible."""
+        if is_mutating(user_input):
+            response = self.coordinator.process_request(user_input)
+            self.cache.clear()
+            return response
+
+        response, embedding = self.cache.lookup(user_input)
+        if response is None:
+            response = self.coordinator.process_request(user_input)
+            if not is_error_response(response):
+                self.cache.add(user_input, embedding, response)
+        return response
+
+    def stream_request(self, user_input: str) -> Iterator[str]:
+        """Stream a request, yielding a cached response in one piece if present."""
+        if is_mutating(user_input):
+            yield from self.coordinator.stream_request(user_input)
+            self.cache.clear()
+            return
+
+        response, embedding = self.cache.lookup(user_input)
+        if response is not None:
+            yield response
+            return
+
+        chunks = []
+        for chunk in self.coordinator.stream_request(user_input):
+            chunks.append(chunk)
+            yield chunk
+        response = "".join(chunks)
+        if not is_error_response(response):
+            self.cache.add(user_input, embedding, response)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.coordinator, name)
@@ -4,9 +4,13 @@ Debug script to check the current state of relations and see what's happening.
 
 import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from dotenv import load_dotenv
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
+from rich.text import Text
 
 # Load environment variables
 load_dotenv()
@@ -33,6 +37,28 @@ def get_notion_client():
         console.print(f"❌ [red]Error creating Notion client: {str(e)}[/red]")
         sys.exit(1)
 
+def _ref_id(ref):
+    """Return the page id of a relation reference."""
+    try:
+        return ref.id
+    except AttributeError:
+        pass
+    if isinstance(ref, dict):
+        return ref.get('id', str(ref))
+    return str(ref)
+
+def _retrieve(notion_client, page_id):
+    """Retrieve a page, returning the exception instead of raising it."""
+    try:
+        return notion_client.pages.retrieve(page_id)
+    except Exception as e:
+        return e
+
+def _extract_title(page, prop):
+    """Return the plain text of a page's title property, or '' if empty."""
+    title_prop = page.properties.get(prop, {}).get("title", [])
+    return title_prop[0].get("plain_text", "") if title_prop else ""
+
 def debug_relations():
     """Debug the current state of relations."""
     
@@ -47,86 +73,116 @@ def debug_relations():
             console.print("❌ [red]Database IDs not found in environment variables[/red]")
             return
         
-        console.print("🔍 [cyan]Debugging Relations...[/cyan]")
-        
         # Get all goals and todos
-        goals_response = notion_client.databases.query(database_id=goals_db_id)
-        goals = goals_response.results
+        with console.status("Fetching goals and todos..."):
+            goals = notion_client.databases.query_all(goals_db_id)
+            todos = notion_client.databases.query_all(todos_db_id)
+        
+        # Index both databases, group todos by project and note related ids
+        # that are outside the two databases, all in one pass over each
+        goals_by_id = {}
+        todos_by_id = {}
+        by_project = defaultdict(list)
+        missing_todo_ids = set()
+        missing_goal_ids = set()
         
-        todos_response = notion_client.databases.query(database_id=todos_db_id)
-        todos = todos_response.results
+        for goal in goals:
+            goals_by_id[goal.id] = goal
+            missing_todo_ids.update(
+                _ref_id(ref) for ref in goal.properties.get("Related Todos", {}).get("relation", [])
+            )
+        for todo in todos:
+            todos_by_id[todo.id] = todo
+            by_project[todo.properties.get("Project", {}).get("select", {}).get("name")].append(todo)
+            missing_goal_ids.update(
+                _ref_id(ref) for ref in todo.properties.get("Related Goals", {}).get("relation", [])
+            )
+        missing_todo_ids -= todos_by_id.keys()
+        missing_goal_ids -= goals_by_id.keys()
         
-        console.print(f"📊 Found {len(goals)} goals and {len(todos)} todos")
+        # Fetch those concurrently; the client's rate limiter keeps the
+        # workers within Notion's request limit
+        missing_ids = list(missing_todo_ids | missing_goal_ids)
+        if missing_ids:
+            with console.status(f"Fetching {len(missing_ids)} related pages..."), \
+                    ThreadPoolExecutor(max_workers=8) as executor:
+                fetched = dict(zip(missing_ids, executor.map(partial(_retrieve, notion_client), missing_ids)))
+            todos_by_id.update((page_id, fetched[page_id]) for page_id in missing_todo_ids)
+            goals_by_id.update((page_id, fetched[page_id]) for page_id in missing_goal_ids)
+        
+        def get_page(page_id, pages_by_id):
+            page = pages_by_id[page_id]
+            if isinstance(page, Exception):
+                raise page
+            return page
+        
+        # Titles by (page id, property) for this run; each page is listed
+        # several times below
+        titles = {}
+        
+        def extract_title(page, prop):
+            key = (page.id, prop)
+            if key not in titles:
+                titles[key] = _extract_title(page, prop)
+            return titles[key]
+        
+        # Output is collected as Text (no markup parsing) and printed once
+        lines = [
+            Text.assemble("🔍 ", ("Debugging Relations...", "cyan")),
+            Text(f"📊 Found {len(goals)} goals and {len(todos)} todos"),
+        ]
         
         # Show goals and their current relations
-        console.print("\n🎯 [cyan]Goals and Current Relations:[/cyan]")
+        lines.append(Text.assemble("\n🎯 ", ("Goals and Current Relations:", "cyan")))
         for goal in goals:
-            title_prop = goal.properties.get("Name", {}).get("title", [])
-            goal_title = title_prop[0].get("plain_text", "") if title_prop else "Untitled"
+            goal_title = extract_title(goal, "Name") or "Untitled"
             
             related_todos = goal.properties.get("Related Todos", {}).get("relation", [])
-            console.print(f"\n   • {goal_title} (ID: {goal.id})")
-            console.print(f"     Related Todos: {len(related_todos)}")
+            lines.append(Text(f"\n   • {goal_title} (ID: {goal.id})"))
+            lines.append(Text(f"     Related Todos: {len(related_todos)}"))
             
             if related_todos:
                 for i, todo_ref in enumerate(related_todos):
                     try:
-                        if hasattr(todo_ref, 'id'):
-                            todo_id = todo_ref.id
-                        elif isinstance(todo_ref, dict) and 'id' in todo_ref:
-                            todo_id = todo_ref['id']
-                        else:
-                            todo_id = str(todo_ref)
-                        
-                        todo_page = notion_client.pages.retrieve(todo_id)
-                        todo_title_prop = todo_page.properties.get("Task", {}).get("title", [])
-                        if todo_title_prop:
-                            todo_title = todo_title_prop[0].get("plain_text", "")
-                            console.print(f"       {i+1}. {todo_title} (ID: {todo_id})")
+                        todo_id = _ref_id(todo_ref)
+                        todo_title = extract_title(get_page(todo_id, todos_by_id), "Task")
+                        if todo_title:
+                            lines.append(Text(f"       {i+1}. {todo_title} (ID: {todo_id})"))
                         else:
-                            console.print(f"       {i+1}. [No title] (ID: {todo_id})")
+                            lines.append(Text(f"       {i+1}. [No title] (ID: {todo_id})"))
                     except Exception as e:
-                        console.print(f"       {i+1}. [Error: {e}]")
+                        lines.append(Text(f"       {i+1}. [Error: {e}]"))
             else:
-                console.print(f"     [No related todos]")
+                lines.append(Text("     [No related todos]"))
         
         # Show todos and their current relations
-        console.print("\n📋 [cyan]Todos and Current Relations:[/cyan]")
+        lines.append(Text.assemble("\n📋 ", ("Todos and Current Relations:", "cyan")))
         for todo in todos:
-            title_prop = todo.properties.get("Task", {}).get("title", [])
-            todo_title = title_prop[0].get("plain_text", "") if title_prop else "Untitled"
+            todo_title = extract_title(todo, "Task") or "Untitled"
             
             project = todo.properties.get("Project", {}).get("select", {}).get("name", "Unknown")
             related_goals = todo.properties.get("Related Goals", {}).get("relation", [])
             
-            console.print(f"\n   • {todo_title} (ID: {todo.id})")
-            console.print(f"     Project: {project}")
-            console.print(f"     Related Goals: {len(related_goals)}")
+            lines.append(Text(f"\n   • {todo_title} (ID: {todo.id})"))
+            lines.append(Text(f"     Project: {project}"))
+            lines.append(Text(f"     Related Goals: {len(related_goals)}"))
             
             if related_goals:
                 for i, goal_ref in enumerate(related_goals):
                     try:
-                        if hasattr(goal_ref, 'id'):
-                            goal_id = goal_ref.id
-                        elif isinstance(goal_ref, dict) and 'id' in goal_ref:
-                            goal_id = goal_ref['id']
+                        goal_id = _ref_id(goal_ref)
+                        goal_title = extract_title(get_page(goal_id, goals_by_id), "Name")
+                        if goal_title:
+                            lines.append(Text(f"       {i+1}. {goal_title} (ID: {goal_id})"))
                         else:
-                            goal_id = str(goal_ref)
-                        
-                        goal_page = notion_client.pages.retrieve(goal_id)
-                        goal_title_prop = goal_page.properties.get("Name", {}).get("title", [])
-                        if goal_title_prop:
-                            goal_title = goal_title_prop[0].get("plain_text", "")
-                            console.print(f"       {i+1}. {goal_title} (ID: {goal_id})")
-                        else:
-                            console.print(f"       {i+1}. [No title] (ID: {goal_id})")
+                            lines.append(Text(f"       {i+1}. [No title] (ID: {goal_id})"))
                     except Exception as e:
-                        console.print(f"       {i+1}. [Error: {e}]")
+                        lines.append(Text(f"       {i+1}. [Error: {e}]"))
             else:
-                console.print(f"     [No related goals]")
+                lines.append(Text("     [No related goals]"))
         
         # Check for expected relations based on project mapping
-        console.print("\n🔍 [cyan]Expected vs Actual Relations:[/cyan]")
+        lines.append(Text.assemble("\n🔍 ", ("Expected vs Actual Relations:", "cyan")))
         project_to_goal = {
             "Machine Learning": "Machine Learning Study",
             "Health": "Athletics & Health", 
@@ -134,38 +190,39 @@ def debug_relations():
             "Planning": "Planning & Organization"
         }
         
+        goal_title_to_id = {extract_title(goal, "Name"): goal.id for goal in goals}
+        
         for project, expected_goal in project_to_goal.items():
-            todos_with_project = [t for t in todos if t.properties.get("Project", {}).get("select", {}).get("name") == project]
-            console.print(f"\n   Project: {project}")
-            console.print(f"     Expected Goal: {expected_goal}")
-            console.print(f"     Todos with this project: {len(todos_with_project)}")
+            todos_with_project = by_project.get(project, [])
+            expected_goal_id = goal_title_to_id.get(expected_goal)
+            lines.append(Text(f"\n   Project: {project}"))
+            lines.append(Text(f"     Expected Goal: {expected_goal}"
+                              + ("" if expected_goal_id else " [not found in goals database]")))
+            lines.append(Text(f"     Todos with this project: {len(todos_with_project)}"))
             
+            # Only todos missing the expected goal are listed in detail
             for todo in todos_with_project:
-                todo_title = todo.properties.get("Task", {}).get("title", [])[0].get("plain_text", "") if todo.properties.get("Task", {}).get("title", []) else "Unknown"
+                todo_title = extract_title(todo, "Task") or "Unknown"
                 related_goals = todo.properties.get("Related Goals", {}).get("relation", [])
-                console.print(f"       • {todo_title}: {len(related_goals)} related goals")
+                related_ids = {_ref_id(ref) for ref in related_goals}
                 
+                if expected_goal_id in related_ids:
+                    lines.append(Text(f"       ✓ {todo_title}", style="green"))
+                    continue
+                
+                lines.append(Text(f"       ✗ {todo_title}: {len(related_goals)} related goals", style="red"))
                 if related_goals:
                     for goal_ref in related_goals:
                         try:
-                            if hasattr(goal_ref, 'id'):
-                                goal_id = goal_ref.id
-                            elif isinstance(goal_ref, dict) and 'id' in goal_ref:
-                                goal_id = goal_ref['id']
-                            else:
-                                goal_id = str(goal_ref)
-                            
-                            goal_page = notion_client.pages.retrieve(goal_id)
-                            goal_title_prop = goal_page.properties.get("Name", {}).get("title", [])
-                            if goal_title_prop:
-                                goal_title = goal_title_prop[0].get("plain_text", "")
-                                console.print(f"         - {goal_title}")
-                            else:
-                                console.print(f"         - [No title]")
+                            goal_id = _ref_id(goal_ref)
+                            goal_title = extract_title(get_page(goal_id, goals_by_id), "Name")
+                            lines.append(Text(f"         - {goal_title or '[No title]'}"))
                         except Exception as e:
-                            console.print(f"         - [Error: {e}]")
+                            lines.append(Text(f"         - [Error: {e}]"))
                 else:
-                    console.print(f"         - [No related goals]")
+                    lines.append(Text("         - [No related goals]"))
+        
+        console.print(Group(*lines))
         
     except Exception as e:
         console.print(f"❌ [red]Error debugging relations: {str(e)}[/red]")
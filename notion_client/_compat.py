@@ -0,0 +1,13 @@
+"""
+Optional dependencies shared by the HTTP client and authentication.
+
+orjson is used for request and response bodies when it is installed
+(the 'fast' extra); otherwise requests' stdlib json handling is used.
+"""
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
@@ -8,10 +8,15 @@ and OAuth 2.0 authentication methods.
 import os
 import time
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ._compat import HAS_ORJSON, orjson
 from .exceptions import NotionAuthError
 
 
@@ -43,6 +48,10 @@ class NotionAuth:
             True if authentication is valid, False otherwise
         """
         raise NotImplementedError("Subclasses must implement is_valid")
+    
+    def close(self) -> None:
+        """Release any resources held by the authentication."""
+        pass
 
 
 class IntegrationAuth(NotionAuth):
@@ -62,18 +71,21 @@ class IntegrationAuth(NotionAuth):
             raise NotionAuthError("Integration token cannot be empty")
         
         self.token = token.strip()
-        
+        self._headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+        }
     
     def get_headers(self) -> Dict[str, str]:
         """Get headers for integration token authentication.
         
+        The same dictionary is returned on every call; callers must not
+        modify it.
+        
         Returns:
             Dictionary containing Bearer token authorization header
         """
-        return {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
+        return self._headers
     
     def is_valid(self) -> bool:
         """Check if integration token is valid format.
@@ -111,7 +123,7 @@ class OAuthAuth(NotionAuth):
         """
         super().__init__()
         
-        if not all([client_id, client_secret, redirect_uri]):
+        if not (client_id and client_secret and redirect_uri):
             raise NotionAuthError(
                 "OAuth requires client_id, client_secret, and redirect_uri"
             )
@@ -123,9 +135,27 @@ class OAuthAuth(NotionAuth):
         self.refresh_token = refresh_token
         self.token_expiry = token_expiry
         
+        # Monotonic time from which the token is treated as expired, kept
+        # alongside the wall-clock token_expiry so is_expired is immune to
+        # system clock changes
+        self._refresh_at: Optional[float] = None
+        if token_expiry:
+            self._refresh_at = time.monotonic() + (token_expiry - time.time()) - 30
+        
+        # Headers built for the current access token, rebuilt whenever the
+        # token changes
+        self._headers: Dict[str, str] = {}
+        self._headers_token: Optional[str] = None
+        
         # Notion OAuth endpoints
         self.auth_base_url = "https://api.notion.com/v1/oauth"
         self.token_url = f"{self.auth_base_url}/token"
+        
+        # Token exchanges and refreshes share one session so the TLS
+        # connection to the token endpoint is reused between refreshes.
+        # It is created on the first token request; most OAuth clients
+        # start with a valid access token and never make one.
+        self._session: Optional[requests.Session] = None
     
     def get_authorization_url(self, state: Optional[str] = None) -> str:
         """Generate OAuth authorization URL.
@@ -147,6 +177,41 @@ class OAuthAuth(NotionAuth):
         
         return f"{self.auth_base_url}/authorize?{urlencode(params)}"
     
+    def _get_session(self) -> requests.Session:
+        """Get the token endpoint session, creating it on first use."""
+        if self._session is None:
+            session = requests.Session()
+            retry_strategy = Retry(
+                total=3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                backoff_factor=0.2,
+                allowed_methods=["POST"],
+            )
+            session.mount(
+                "https://",
+                HTTPAdapter(max_retries=retry_strategy, pool_connections=4, pool_maxsize=10),
+            )
+            self._session = session
+        return self._session
+    
+    def _post_token_request(self, data: Dict[str, Any]) -> requests.Response:
+        """POST a grant to the token endpoint.
+        
+        Args:
+            data: Grant parameters
+            
+        Returns:
+            HTTP response from the token endpoint
+        """
+        # Serialize the body ourselves when orjson is available
+        return self._get_session().post(
+            self.token_url,
+            auth=(self.client_id, self.client_secret),
+            headers={"Content-Type": "application/json"},
+            data=orjson.dumps(data) if HAS_ORJSON else None,
+            json=None if HAS_ORJSON else data,
+        )
+    
     def exchange_code(self, authorization_code: str) -> Dict[str, Any]:
         """Exchange authorization code for access token.
         
@@ -166,12 +231,7 @@ class OAuthAuth(NotionAuth):
         }
         
         try:
-            response = requests.post(
-                self.token_url,
-                json=data,
-                auth=(self.client_id, self.client_secret),
-                headers={"Content-Type": "application/json"},
-            )
+            response = self._post_token_request(data)
             response.raise_for_status()
             
             token_data = response.json()
@@ -183,7 +243,7 @@ class OAuthAuth(NotionAuth):
             # Calculate expiry time
             expires_in = token_data.get("expires_in")
             if expires_in:
-                self.token_expiry = time.time() + expires_in
+                self._set_expiry(expires_in)
             
             return token_data
             
@@ -208,12 +268,7 @@ class OAuthAuth(NotionAuth):
         }
         
         try:
-            response = requests.post(
-                self.token_url,
-                json=data,
-                auth=(self.client_id, self.client_secret),
-                headers={"Content-Type": "application/json"},
-            )
+            response = self._post_token_request(data)
             response.raise_for_status()
             
             token_data = response.json()
@@ -226,16 +281,25 @@ class OAuthAuth(NotionAuth):
             # Calculate new expiry time
             expires_in = token_data.get("expires_in")
             if expires_in:
-                self.token_expiry = time.time() + expires_in
+                self._set_expiry(expires_in)
             
             return token_data
             
         except requests.RequestException as e:
             raise NotionAuthError(f"Failed to refresh access token: {e}")
     
+    def _set_expiry(self, expires_in: float) -> None:
+        """Record that the access token expires in ``expires_in`` seconds."""
+        self.token_expiry = time.time() + expires_in
+        # Add small buffer (30 seconds) to account for request time
+        self._refresh_at = time.monotonic() + expires_in - 30
+    
     def get_headers(self) -> Dict[str, str]:
         """Get headers for OAuth authentication.
         
+        The dictionary is reused until the access token changes; callers
+        must not modify it.
+        
         Returns:
             Dictionary containing Bearer token authorization header
             
@@ -250,10 +314,14 @@ class OAuthAuth(NotionAuth):
         if not self.access_token:
             raise NotionAuthError("No valid access token available")
         
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
+        if self._headers_token is not self.access_token:
+            self._headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+            }
+            self._headers_token = self.access_token
+        
+        return self._headers
     
     def is_valid(self) -> bool:
         """Check if OAuth authentication is valid.
@@ -272,18 +340,37 @@ class OAuthAuth(NotionAuth):
         Returns:
             True if token is expired, False otherwise
         """
-        if not self.token_expiry:
+        if self._refresh_at is None:
             return False
         
-        # Add small buffer (30 seconds) to account for request time
-        return time.time() >= (self.token_expiry - 30)
+        return time.monotonic() >= self._refresh_at
+    
+    def close(self) -> None:
+        """Close the token endpoint session, if one was opened."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+@lru_cache(maxsize=4)
+def _integration_auth(token: str) -> IntegrationAuth:
+    """Create the integration auth for ``token`` once and reuse it."""
+    return IntegrationAuth(token)
+
+
+def clear_auth_cache() -> None:
+    """Forget the integration auth instances reused by create_auth_from_env."""
+    _integration_auth.cache_clear()
 
 
 def create_auth_from_env() -> NotionAuth:
     """Create authentication instance from environment variables.
     
     Looks for NOTION_API_TOKEN for integration auth, or OAuth parameters
-    for OAuth authentication.
+    for OAuth authentication. Integration auth holds no per-client state,
+    so calls with the same token return the same instance. OAuth auth
+    holds tokens and a session that its client closes, so each call
+    creates a new one.
     
     Returns:
         Configured NotionAuth instance
@@ -294,14 +381,14 @@ def create_auth_from_env() -> NotionAuth:
     # Try integration token first
     token = os.getenv("NOTION_API_TOKEN")
     if token:
-        return IntegrationAuth(token)
+        return _integration_auth(token)
     
     # Try OAuth configuration
     client_id = os.getenv("NOTION_OAUTH_CLIENT_ID")
     client_secret = os.getenv("NOTION_OAUTH_CLIENT_SECRET")
     redirect_uri = os.getenv("NOTION_OAUTH_REDIRECT_URI")
     
-    if all([client_id, client_secret, redirect_uri]):
+    if client_id and client_secret and redirect_uri:
         access_token = os.getenv("NOTION_OAUTH_ACCESS_TOKEN")
         refresh_token = os.getenv("NOTION_OAUTH_REFRESH_TOKEN")
         
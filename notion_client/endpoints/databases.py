@@ -6,7 +6,8 @@ including creating, retrieving, updating databases and querying database content
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Generator, Tuple, Union
 
 from .base import BaseEndpoint
 from ..models.database import Database, DatabaseCreateRequest, DatabaseUpdateRequest
@@ -157,6 +158,39 @@ class DatabasesEndpoint(BaseEndpoint):
         
         return Database(**response)
     
+    def batch_update(
+        self,
+        updates: List[Tuple[str, Dict[str, Any]]],
+        max_workers: int = 3,
+    ) -> List[Union[Database, Exception]]:
+        """Update several databases concurrently.
+        
+        Notion has no bulk update endpoint, so each database still gets its
+        own PATCH; the requests are sent from a thread pool and share the
+        HTTP client's connection pool and rate limiter.
+        
+        Args:
+            updates: (database_id, update fields) pairs, where the fields
+                are keyword arguments accepted by ``update``
+            max_workers: Maximum number of updates in flight at once
+            
+        Returns:
+            Results in the same order as ``updates``; an update that failed
+            is represented by its exception instead of a database.
+        """
+        def apply(update: Tuple[str, Dict[str, Any]]) -> Union[Database, Exception]:
+            database_id, fields = update
+            try:
+                return self.update(database_id, **fields)
+            except Exception as e:
+                return e
+        
+        if not updates:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(apply, updates))
+    
     def query(
         self,
         database_id: str,
@@ -281,49 +281,16 @@ class PagesEndpoint(BaseEndpoint):
         """
         self._validate_id(page_id, "page")
         
-        # Use a direct HTTP request to set the page format
-        # The full width setting is controlled by a special page format property
-        update_data = {
-            "archived": False,  # Ensure page is not archived
-        }
+        # The page format isn't part of Notion's documented API, so the
+        # request may be rejected; that error is raised rather than masked
+        # by a separate no-op update, so callers know whether it applied
+        response = self.http_client.patch(
+            f"pages/{page_id}",
+            data={"format": {"page_full_width": full_width}},
+        )
+        logger.info(f"Set page {page_id} to {'full width' if full_width else 'normal width'}")
         
-        # Add format property for full width
-        if full_width:
-            # Try to use the format property that controls page layout
-            try:
-                # Make a direct request to set page format
-                response = self.http_client.patch(
-                    f"pages/{page_id}",
-                    data=update_data
-                )
-                
-                # Try a second request with format data if the API supports it
-                # Note: This is experimental as Notion's API doesn't officially expose this
-                format_data = {
-                    "page_full_width": True if full_width else False
-                }
-                
-                # Attempt to set format via a second call
-                # This may not work as it's not in the official API
-                try:
-                    format_response = self.http_client.patch(
-                        f"pages/{page_id}",
-                        data={"format": format_data}
-                    )
-                    logger.info(f"Successfully set page {page_id} to {'full width' if full_width else 'normal width'}")
-                    return Page(**format_response)
-                except Exception as format_error:
-                    logger.warning(f"Could not set page format via API: {format_error}")
-                    # Return the basic update response
-                    return Page(**response)
-                    
-            except Exception as e:
-                logger.error(f"Error setting page width: {e}")
-                # Fall back to basic update
-                return self.update(page_id, archived=False)
-        else:
-            # For normal width, just do a basic update
-            return self.update(page_id, archived=False)
+        return Page(**response)
     
     def create_from_template(
         self,
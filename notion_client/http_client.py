@@ -7,6 +7,7 @@ retries with exponential backoff, and proper error handling for the Notion API.
 
 import time
 import logging
+import threading
 from typing import Any, Dict, Optional, Union
 from urllib.parse import urljoin
 
@@ -14,6 +15,7 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ._compat import HAS_ORJSON, orjson
 from .auth import NotionAuth
 from .exceptions import (
     NotionAPIError,
@@ -41,18 +43,24 @@ class RateLimiter:
         self.max_requests_per_second = max_requests_per_second
         self.min_interval = 1.0 / max_requests_per_second
         self.last_request_time = 0.0
+        self._lock = threading.Lock()
     
     def wait_if_needed(self) -> None:
-        """Wait if necessary to respect rate limits."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        """Wait if necessary to respect rate limits.
         
-        if time_since_last < self.min_interval:
-            wait_time = self.min_interval - time_since_last
-            logger.debug(f"Rate limiting: waiting {wait_time:.3f} seconds")
-            time.sleep(wait_time)
-        
-        self.last_request_time = time.time()
+        Safe to call from multiple threads; concurrent callers are spaced
+        out by ``min_interval`` in turn.
+        """
+        with self._lock:
+            current_time = time.time()
+            time_since_last = current_time - self.last_request_time
+            
+            if time_since_last < self.min_interval:
+                wait_time = self.min_interval - time_since_last
+                logger.debug(f"Rate limiting: waiting {wait_time:.3f} seconds")
+                time.sleep(wait_time)
+            
+            self.last_request_time = time.time()
 
 
 class NotionHTTPClient:
@@ -66,6 +74,7 @@ class NotionHTTPClient:
         timeout: int = 30,
         max_retries: int = 3,
         rate_limit_delay: float = 1.0,
+        pool_maxsize: int = 20,
     ) -> None:
         """Initialize HTTP client.
         
@@ -76,6 +85,7 @@ class NotionHTTPClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             rate_limit_delay: Base delay for rate limiting
+            pool_maxsize: Keep-alive connections kept open for concurrent requests
         """
         self.auth = auth
         self.api_version = api_version
@@ -97,7 +107,9 @@ class NotionHTTPClient:
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PATCH", "DELETE"],
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Size the connection pool so concurrent callers reuse keep-alive
+        # connections instead of opening (and discarding) new TLS sessions
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=pool_maxsize)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
     
@@ -107,12 +119,12 @@ class NotionHTTPClient:
         Returns:
             Dictionary of headers for API requests
         """
-        headers = self.auth.get_headers()
-        headers.update({
+        return {
+            **self.auth.get_headers(),
+            "Content-Type": "application/json",
             "Notion-Version": self.api_version,
             "User-Agent": "notion-python-client/0.1.0",
-        })
-        return headers
+        }
     
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """Handle API response and raise appropriate exceptions.
@@ -127,7 +139,10 @@ class NotionHTTPClient:
             NotionAPIError: For various API error conditions
         """
         try:
-            response_data = response.json()
+            if HAS_ORJSON:
+                response_data = orjson.loads(response.content)
+            else:
+                response_data = response.json()
         except ValueError:
             response_data = {"message": response.text}
         
@@ -200,19 +215,22 @@ class NotionHTTPClient:
         # Get headers
         headers = self._get_headers()
         
-        # Log request details
+        # Log request details; the body is only formatted when debug
+        # logging is on, since block payloads can be large
         logger.debug(f"Making {method} request to {url}")
-        if data:
+        if data and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Request data: {data}")
         
         try:
+            # Serialize the body ourselves when orjson is available
             response = self.session.request(
                 method=method,
                 url=url,
-                json=data,
                 params=params,
                 headers=headers,
                 timeout=self.timeout,
+                data=orjson.dumps(data) if HAS_ORJSON and data is not None else None,
+                json=None if HAS_ORJSON else data,
             )
             
             # Handle response
@@ -296,5 +314,6 @@ class NotionHTTPClient:
         return self._make_request("DELETE", endpoint, params=params)
     
     def close(self) -> None:
-        """Close the HTTP session."""
+        """Close the HTTP session and any session held by the auth."""
         self.session.close()
+        self.auth.close()
@@ -0,0 +1,120 @@
+"""
+Block builders shared by the dashboard scripts.
+
+The column, full-width and built-in full-width dashboards lay out the
+same kind of content: colored column headings over one linked row per
+database. The builders and the three-column headings live here so the
+scripts stay in step.
+"""
+
+from functools import lru_cache
+
+from notion_client.utils import create_rich_text
+
+
+# Notion's limit on blocks in a single children array
+MAX_CHILDREN_PER_REQUEST = 100
+
+
+def chunks(blocks: list, size: int = MAX_CHILDREN_PER_REQUEST):
+    """Yield successive slices of at most ``size`` blocks."""
+    for i in range(0, len(blocks), size):
+        yield blocks[i:i + size]
+
+
+def split_evenly(items: list, parts: int):
+    """Split ``items`` in order into ``parts`` lists whose sizes differ by at most one.
+
+    The first ``len(items) % parts`` lists get the extra item, so 4 items
+    split 2/1/1 and 7 split 3/2/2.
+    """
+    q, r = divmod(len(items), parts)
+    sizes = [q + 1] * r + [q] * (parts - r)
+    starts = [sum(sizes[:i]) for i in range(parts)]
+    return [items[start:start + size] for start, size in zip(starts, sizes)]
+
+
+def heading3(text: str, color: str):
+    """Build a colored heading_3 block."""
+    return {
+        "type": "heading_3",
+        "heading_3": {
+            "rich_text": [create_rich_text(text)],
+            "color": color
+        }
+    }
+
+
+def column_list(columns):
+    """Build a column_list block with one column per list of child blocks.
+
+    Each column is capped at MAX_CHILDREN_PER_REQUEST blocks, the most
+    Notion accepts in one children array; append_column_overflow() adds
+    the rest once the page exists.
+    """
+    return {
+        "type": "column_list",
+        "column_list": {
+            "children": [
+                {"type": "column", "column": {"children": children[:MAX_CHILDREN_PER_REQUEST]}}
+                for children in columns
+            ]
+        }
+    }
+
+
+def append_column_overflow(client, page_id: str, columns):
+    """Append the blocks column_list() left out to each created column.
+
+    ``columns`` are the lists passed to column_list() for the page's first
+    column_list block. Nothing is requested when every column fit.
+    """
+    overflow = [children[MAX_CHILDREN_PER_REQUEST:] for children in columns]
+    if not any(overflow):
+        return
+
+    column_list_block = next(
+        block for block in client.blocks.get_all_children(page_id)
+        if block.type == "column_list"
+    )
+    column_blocks = client.blocks.get_all_children(column_list_block.id)
+    for column_block, rows in zip(column_blocks, overflow):
+        for chunk in chunks(rows):
+            client.blocks.append_children(column_block.id, chunk)
+
+
+@lru_cache(maxsize=None)
+def icon_prefix(icon: str):
+    """Build the rich-text run shown before a database link (one per icon)."""
+    return create_rich_text(f"{icon} ")
+
+
+def db_row_block(db_name: str, db_info: dict):
+    """Build the paragraph block linking to one database."""
+    return {
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": [
+                icon_prefix(db_info['icon']),
+                {
+                    "type": "text",
+                    "text": {
+                        "content": db_name,
+                        "link": {"url": db_info['url']}
+                    },
+                    "annotations": {"bold": True},
+                    "plain_text": db_name
+                }
+            ]
+        }
+    }
+
+
+# Headings of the full-width dashboards' three columns, left to right.
+# The blocks are only ever serialized, so every dashboard shares them.
+THREE_COLUMN_HEADINGS = (
+    ("📅 Calendar & Planning", "blue"),
+    ("🎯 Projects & Tasks", "green"),
+    ("📊 Personal & Tracking", "purple"),
+)
+THREE_COLUMN_HEADING_BLOCKS = tuple(heading3(text, color) for text, color in THREE_COLUMN_HEADINGS)
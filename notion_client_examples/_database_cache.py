@@ -0,0 +1,162 @@
+"""
+Database listing cache shared by the dashboard scripts.
+
+Every dashboard links to all databases in the workspace, and listing them
+is a full paginated search. The listing is kept in a small SQLite file,
+one row per database and keyed by workspace, and reused for an hour as
+long as no database has been edited since it was fetched.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+
+from notion_client import NotionClient, NotionAPIError
+
+
+DATABASE_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "protocol-manager", "databases.sqlite3")
+DATABASE_CACHE_TTL = 3600
+
+
+def _workspace_key(client: NotionClient) -> str:
+    """Identify the workspace by a hash of the client's credentials."""
+    authorization = client.auth.get_headers()["Authorization"]
+    return hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+
+
+def _newest_database_edit(client: NotionClient):
+    """Get the last_edited_time of the most recently edited database."""
+    response = client.search.search(
+        sort={"direction": "descending", "timestamp": "last_edited_time"},
+        filter_criteria={"value": "database", "property": "object"},
+        page_size=1,
+    )
+    results = response.get("results", [])
+    return results[0].get("last_edited_time") if results else None
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating its tables if missing."""
+    os.makedirs(os.path.dirname(DATABASE_CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(DATABASE_CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS listings ("
+        " workspace TEXT PRIMARY KEY,"
+        " newest_edit TEXT,"
+        " fetched_at REAL NOT NULL)"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS databases ("
+        " workspace TEXT NOT NULL,"
+        " position INTEGER NOT NULL,"
+        " id TEXT NOT NULL,"
+        " title TEXT NOT NULL,"
+        " url TEXT NOT NULL,"
+        " icon TEXT NOT NULL,"
+        " PRIMARY KEY (workspace, position))"
+    )
+    return conn
+
+
+def _load_cached_databases(conn: sqlite3.Connection, workspace: str):
+    """Return (newest_edit, database info) for a workspace if fetched within the TTL."""
+    row = conn.execute(
+        "SELECT newest_edit, fetched_at FROM listings WHERE workspace = ?", (workspace,)
+    ).fetchone()
+    if row is None or time.time() - row[1] > DATABASE_CACHE_TTL:
+        return None
+
+    rows = conn.execute(
+        "SELECT title, id, url, icon FROM databases WHERE workspace = ? ORDER BY position",
+        (workspace,),
+    )
+    return row[0], {title: {'id': db_id, 'url': url, 'icon': icon} for title, db_id, url, icon in rows}
+
+
+def _save_cached_databases(conn: sqlite3.Connection, workspace: str, newest_edit, db_info: dict):
+    """Replace the cached listing for a workspace."""
+    with conn:
+        conn.execute("DELETE FROM databases WHERE workspace = ?", (workspace,))
+        conn.executemany(
+            "INSERT INTO databases (workspace, position, id, title, url, icon) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (workspace, position, info['id'], title, info['url'], info['icon'])
+                for position, (title, info) in enumerate(db_info.items())
+            ],
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO listings (workspace, newest_edit, fetched_at) VALUES (?, ?, ?)",
+            (workspace, newest_edit, time.time()),
+        )
+
+
+def _plain_title(title: list) -> str:
+    """Join a database's title runs into plain text."""
+    if len(title) == 1:
+        return title[0].plain_text
+    return "".join(t.plain_text for t in title)
+
+
+def _fetch_databases(client: NotionClient) -> dict:
+    """List every titled database in the workspace."""
+    # Untitled databases are skipped; they would all collide on the "" key
+    return {
+        _plain_title(db.title): {
+            'id': db.id,
+            'url': db.url,
+            'icon': db.icon.emoji if db.icon and db.icon.type == 'emoji' else '📄'
+        }
+        for db in client.search.search_databases()
+        if db.title
+    }
+
+
+@lru_cache(maxsize=1)
+def get_all_databases(client: NotionClient):
+    """Get information about all databases in the workspace.
+
+    Results are cached on disk for an hour and reused as long as no
+    database has been edited since they were fetched.
+    """
+
+    try:
+        workspace = _workspace_key(client)
+
+        try:
+            conn = _connect()
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️ Could not open database cache: {e}")
+            return _fetch_databases(client)
+
+        with closing(conn):
+            try:
+                cached = _load_cached_databases(conn, workspace)
+            except sqlite3.Error:
+                cached = None
+
+            if cached is not None:
+                newest_edit = _newest_database_edit(client)
+                if cached[0] == newest_edit:
+                    return cached[1]
+                db_info = _fetch_databases(client)
+            else:
+                # Nothing usable on disk, so there is no need to wait for the
+                # edit probe before starting the (paginated) listing
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    probe = executor.submit(_newest_database_edit, client)
+                    db_info = _fetch_databases(client)
+                    newest_edit = probe.result()
+
+            try:
+                _save_cached_databases(conn, workspace, newest_edit, db_info)
+            except sqlite3.Error as e:
+                print(f"⚠️ Could not write database cache: {e}")
+            return db_info
+
+    except NotionAPIError as e:
+        print(f"❌ Error gathering database info: {e}")
+        return {}
@@ -6,12 +6,12 @@ This creates a dashboard with actual Notion columns for side-by-side layout.
 
 import sys
 import os
-from datetime import datetime, date
+from datetime import datetime
 
 # Add path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from notion_client import NotionClient
+from notion_client import NotionClient, NotionAPIError
 from notion_client.utils import (
     create_rich_text,
     create_page_parent,
@@ -23,30 +23,13 @@ from notion_client.utils import (
     create_icon,
 )
 
-
-def get_all_databases(client: NotionClient):
-    """Get information about all databases in the workspace."""
-    
-    try:
-        databases = client.search.search_databases()
-        
-        db_info = {}
-        for db in databases:
-            title = ""
-            if db.title:
-                title = "".join([t.plain_text for t in db.title])
-            
-            db_info[title] = {
-                'id': db.id,
-                'url': db.url,
-                'icon': db.icon.emoji if db.icon and db.icon.type == 'emoji' else '📄'
-            }
-        
-        return db_info
-        
-    except Exception as e:
-        print(f"❌ Error gathering database info: {e}")
-        return {}
+from _dashboard_layout import (
+    append_column_overflow,
+    column_list,
+    db_row_block,
+    heading3,
+)
+from _database_cache import get_all_databases
 
 
 def create_column_dashboard(client: NotionClient, parent_page_id: str, databases: dict):
@@ -54,6 +37,9 @@ def create_column_dashboard(client: NotionClient, parent_page_id: str, databases
     
     print("🏠 Creating column-based dashboard...")
     
+    # Read the clock once so the header and footer agree
+    now = datetime.now()
+    
     # Page properties - Clean title without emoji
     page_properties = {
         "title": {
@@ -65,117 +51,26 @@ def create_column_dashboard(client: NotionClient, parent_page_id: str, databases
     header_blocks = [
         create_heading_block("Protocol Manager Dashboard", level=1),
         create_paragraph_block(
-            f"Productivity System • {date.today().strftime('%B %d, %Y')} • {len(databases)} Databases",
+            f"Productivity System • {now.strftime('%B %d, %Y')} • {len(databases)} Databases",
             color="gray"
         ),
         create_divider_block(),
     ]
     
     try:
-        # Create the page first with header
-        dashboard_page = client.pages.create(
-            parent=create_page_parent(parent_page_id),
-            properties=page_properties,
-            children=header_blocks,
-            icon=create_icon("emoji", "🏠")
-        )
-        
-        print(f"✅ Dashboard page created: {dashboard_page.id}")
-        
-        # Now add column layout
-        # Split databases into two groups
-        db_list = list(databases.items())
-        mid_point = len(db_list) // 2
+        # Create column content, with the first half of the databases on
+        # the left and the rest on the right
+        left_column_blocks = [heading3("📅 Schedule & Planning", "blue")]
+        right_column_blocks = [heading3("🎯 Projects & Tracking", "green")]
         
-        left_dbs = db_list[:mid_point]
-        right_dbs = db_list[mid_point:]
-        
-        # Create left column content
-        left_column_blocks = [
-            {
-                "type": "heading_3",
-                "heading_3": {
-                    "rich_text": [create_rich_text("📅 Schedule & Planning")],
-                    "color": "blue"
-                }
-            }
-        ]
-        
-        # Add left column databases
-        for db_name, db_info in left_dbs:
-            left_column_blocks.append({
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        create_rich_text(f"{db_info['icon']} "),
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": db_name,
-                                "link": {"url": db_info['url']}
-                            },
-                            "annotations": {"bold": True},
-                            "plain_text": db_name
-                        }
-                    ]
-                }
-            })
-        
-        # Create right column content
-        right_column_blocks = [
-            {
-                "type": "heading_3", 
-                "heading_3": {
-                    "rich_text": [create_rich_text("🎯 Projects & Tracking")],
-                    "color": "green"
-                }
-            }
-        ]
-        
-        # Add right column databases
-        for db_name, db_info in right_dbs:
-            right_column_blocks.append({
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        create_rich_text(f"{db_info['icon']} "),
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": db_name,
-                                "link": {"url": db_info['url']}
-                            },
-                            "annotations": {"bold": True},
-                            "plain_text": db_name
-                        }
-                    ]
-                }
-            })
+        mid_point = len(databases) // 2
+        for i, (db_name, db_info) in enumerate(databases.items()):
+            column_blocks = left_column_blocks if i < mid_point else right_column_blocks
+            column_blocks.append(db_row_block(db_name, db_info))
         
         # Create the column list block
-        column_list_block = {
-            "type": "column_list",
-            "column_list": {
-                "children": [
-                    {
-                        "type": "column",
-                        "column": {
-                            "children": left_column_blocks
-                        }
-                    },
-                    {
-                        "type": "column", 
-                        "column": {
-                            "children": right_column_blocks
-                        }
-                    }
-                ]
-            }
-        }
-        
-        # Add the column layout to the page
-        result = client.blocks.append_children(dashboard_page.id, [column_list_block])
-        print(f"✅ Added column layout")
+        columns = [left_column_blocks, right_column_blocks]
+        column_list_block = column_list(columns)
         
         # Add footer blocks
         footer_blocks = [
@@ -186,18 +81,29 @@ def create_column_dashboard(client: NotionClient, parent_page_id: str, databases
                 color="yellow"
             ),
             create_paragraph_block(
-                f"System Status: ✅ {len(databases)} databases active • Last updated: {datetime.now().strftime('%H:%M')}",
+                f"System Status: ✅ {len(databases)} databases active • Last updated: {now.strftime('%H:%M')}",
                 color="gray",
                 italic=True
             )
         ]
         
-        client.blocks.append_children(dashboard_page.id, footer_blocks)
-        print(f"✅ Added footer section")
+        # Create the page with all of its content in one request. Notion
+        # takes at most 100 blocks per column, so longer columns get the
+        # rest of their rows appended afterwards
+        all_children = header_blocks + [column_list_block] + footer_blocks
+        dashboard_page = client.pages.create(
+            parent=create_page_parent(parent_page_id),
+            properties=page_properties,
+            children=all_children,
+            icon=create_icon("emoji", "🏠")
+        )
+        append_column_overflow(client, dashboard_page.id, columns)
+        
+        print(f"✅ Dashboard page created: {dashboard_page.id}")
         
         return dashboard_page
         
-    except Exception as e:
+    except NotionAPIError as e:
         print(f"❌ Error creating column dashboard: {e}")
         return None
 
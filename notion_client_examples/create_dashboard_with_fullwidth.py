@@ -6,12 +6,14 @@ This demonstrates the new set_page_full_width method in the NotionClient.
 
 import sys
 import os
-from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
 
 # Add path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from notion_client import NotionClient
+from notion_client import NotionClient, NotionAPIError
 from notion_client.utils import (
     create_rich_text,
     create_page_parent,
@@ -22,30 +24,14 @@ from notion_client.utils import (
     create_icon,
 )
 
-
-def get_all_databases(client: NotionClient):
-    """Get information about all databases in the workspace."""
-    
-    try:
-        databases = client.search.search_databases()
-        
-        db_info = {}
-        for db in databases:
-            title = ""
-            if db.title:
-                title = "".join([t.plain_text for t in db.title])
-            
-            db_info[title] = {
-                'id': db.id,
-                'url': db.url,
-                'icon': db.icon.emoji if db.icon and db.icon.type == 'emoji' else '📄'
-            }
-        
-        return db_info
-        
-    except Exception as e:
-        print(f"❌ Error gathering database info: {e}")
-        return {}
+from _dashboard_layout import (
+    THREE_COLUMN_HEADING_BLOCKS,
+    append_column_overflow,
+    column_list,
+    db_row_block,
+    split_evenly,
+)
+from _database_cache import get_all_databases
 
 
 def create_dashboard_with_built_in_fullwidth(client: NotionClient, parent_page_id: str, databases: dict):
@@ -53,6 +39,9 @@ def create_dashboard_with_built_in_fullwidth(client: NotionClient, parent_page_i
     
     print("🏠 Creating dashboard with built-in full width support...")
     
+    # Read the clock once so the header and footer agree
+    now = datetime.now()
+    
     # Page properties - Clean title without emoji
     page_properties = {
         "title": {
@@ -64,20 +53,37 @@ def create_dashboard_with_built_in_fullwidth(client: NotionClient, parent_page_i
     header_blocks = [
         create_heading_block("Protocol Manager Dashboard", level=1),
         create_paragraph_block(
-            f"Full-Width Productivity System • {date.today().strftime('%B %d, %Y')} • {len(databases)} Active Databases",
+            f"Full-Width Productivity System • {now.strftime('%B %d, %Y')} • {len(databases)} Active Databases",
             color="gray"
         ),
         create_divider_block(),
     ]
     
     try:
-        # Create the page first
+        # Split databases into three columns for better full-width usage,
+        # in order and as evenly as possible (the right column is never
+        # longer than the others)
+        columns = [
+            [heading] + [db_row_block(db_name, db_info) for db_name, db_info in rows]
+            for heading, rows in zip(
+                THREE_COLUMN_HEADING_BLOCKS, split_evenly(list(databases.items()), 3)
+            )
+        ]
+        
+        # Create the three-column list block
+        column_list_block = column_list(columns)
+        
+        # Create the page with its header and columns in one request. Notion
+        # takes at most 100 blocks per column, so longer columns get the
+        # rest of their rows appended afterwards
+        page_children = header_blocks + [column_list_block]
         dashboard_page = client.pages.create(
             parent=create_page_parent(parent_page_id),
             properties=page_properties,
-            children=header_blocks,
+            children=page_children,
             icon=create_icon("emoji", "🖥️")
         )
+        append_column_overflow(client, dashboard_page.id, columns)
         
         print(f"✅ Dashboard page created: {dashboard_page.id}")
         
@@ -90,139 +96,8 @@ def create_dashboard_with_built_in_fullwidth(client: NotionClient, parent_page_i
         else:
             print("⚠️ Could not set full width via API - manual setting required")
         
-        # Split databases into three columns for better full-width usage
-        db_list = list(databases.items())
-        col_size = max(1, len(db_list) // 3)
-        
-        left_dbs = db_list[:col_size]
-        middle_dbs = db_list[col_size:col_size*2]
-        right_dbs = db_list[col_size*2:]
-        
-        # Create left column content
-        left_column_blocks = [
-            {
-                "type": "heading_3",
-                "heading_3": {
-                    "rich_text": [create_rich_text("📅 Calendar & Planning")],
-                    "color": "blue"
-                }
-            }
-        ]
-        
-        # Add left column databases
-        for db_name, db_info in left_dbs:
-            left_column_blocks.append({
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        create_rich_text(f"{db_info['icon']} "),
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": db_name,
-                                "link": {"url": db_info['url']}
-                            },
-                            "annotations": {"bold": True},
-                            "plain_text": db_name
-                        }
-                    ]
-                }
-            })
-        
-        # Create middle column content
-        middle_column_blocks = [
-            {
-                "type": "heading_3",
-                "heading_3": {
-                    "rich_text": [create_rich_text("🎯 Projects & Tasks")],
-                    "color": "green"
-                }
-            }
-        ]
-        
-        # Add middle column databases
-        for db_name, db_info in middle_dbs:
-            middle_column_blocks.append({
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        create_rich_text(f"{db_info['icon']} "),
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": db_name,
-                                "link": {"url": db_info['url']}
-                            },
-                            "annotations": {"bold": True},
-                            "plain_text": db_name
-                        }
-                    ]
-                }
-            })
-        
-        # Create right column content
-        right_column_blocks = [
-            {
-                "type": "heading_3", 
-                "heading_3": {
-                    "rich_text": [create_rich_text("📊 Personal & Tracking")],
-                    "color": "purple"
-                }
-            }
-        ]
-        
-        # Add right column databases
-        for db_name, db_info in right_dbs:
-            right_column_blocks.append({
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        create_rich_text(f"{db_info['icon']} "),
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": db_name,
-                                "link": {"url": db_info['url']}
-                            },
-                            "annotations": {"bold": True},
-                            "plain_text": db_name
-                        }
-                    ]
-                }
-            })
-        
-        # Create the three-column list block
-        column_list_block = {
-            "type": "column_list",
-            "column_list": {
-                "children": [
-                    {
-                        "type": "column",
-                        "column": {
-                            "children": left_column_blocks
-                        }
-                    },
-                    {
-                        "type": "column",
-                        "column": {
-                            "children": middle_column_blocks
-                        }
-                    },
-                    {
-                        "type": "column", 
-                        "column": {
-                            "children": right_column_blocks
-                        }
-                    }
-                ]
-            }
-        }
-        
-        # Add the column layout to the page
-        result = client.blocks.append_children(dashboard_page.id, [column_list_block])
-        print(f"✅ Added three-column layout")
-        
-        # Add quick actions and status
+        # Add quick actions and status; the status depends on the full width
+        # result, so this is the one block append made after creation
         footer_blocks = [
             create_divider_block(),
             create_callout_block(
@@ -236,7 +111,7 @@ def create_dashboard_with_built_in_fullwidth(client: NotionClient, parent_page_i
                 color="green" if full_width_success else "orange"
             ),
             create_paragraph_block(
-                f"Dashboard created: {datetime.now().strftime('%Y-%m-%d %H:%M')} • Full-width support built-in",
+                f"Dashboard created: {now.strftime('%Y-%m-%d %H:%M')} • Full-width support built-in",
                 color="gray",
                 italic=True
             )
@@ -247,11 +122,22 @@ def create_dashboard_with_built_in_fullwidth(client: NotionClient, parent_page_i
         
         return dashboard_page, full_width_success
         
-    except Exception as e:
+    except NotionAPIError as e:
         print(f"❌ Error creating dashboard: {e}")
         return None, False
 
 
+def create_dashboards(client: NotionClient, parent_page_ids: list, databases: dict, max_workers: int = 3):
+    """Create a dashboard under each parent page concurrently.
+    
+    The client's rate limiter is shared by every thread, so the combined
+    requests still stay within Notion's rate limit.
+    """
+    build = partial(create_dashboard_with_built_in_fullwidth, client, databases=databases)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(build, parent_page_ids))
+
+
 def main():
     """Main function to create the dashboard with built-in full width support."""
     
@@ -275,47 +161,58 @@ def main():
     
     print(f"📊 Found {len(databases)} databases")
     
-    # Use Protocol Home as parent
+    # Use Protocol Home as parent unless parent page IDs are given
     protocol_home_id = "2518f242-f6b7-80c6-ba3a-f6cae6f0809c"
+    parent_page_ids = sys.argv[1:] or [protocol_home_id]
     
-    # Create the dashboard with built-in full width
-    dashboard_page, full_width_success = create_dashboard_with_built_in_fullwidth(client, protocol_home_id, databases)
+    # Create the dashboards with built-in full width, then close the client's
+    # HTTP session; every request above reused its pooled connection
+    with client:
+        results = create_dashboards(client, parent_page_ids, databases)
+    created = [(page, success) for page, success in results if page]
     
-    if dashboard_page:
-        print(f"\n🎉 Dashboard Created with Full Width Support!")
-        print("=" * 50)
-        print(f"🔗 **URL**: {dashboard_page.url}")
+    if created:
+        dashboard_page = created[0][0]
+        full_width_success = all(success for _, success in created)
         
-        print(f"\n✨ **Features**:")
-        print("   🖥️ Built-in full width support")
-        print("   📐 Three-column layout for wide screens")
-        print("   🔗 Clean clickable database links")
-        print("   🎨 Proper icon placement")
-        print("   ⚡ Integrated full width setting")
-        
-        print(f"\n🖥️ **Full Width Status**:")
         if full_width_success:
-            print("   ✅ Automatically set to full width")
-            print("   🎯 Ready for maximum screen utilization")
-            print("   📐 Three columns will display side-by-side")
+            width_status = [
+                "   ✅ Automatically set to full width",
+                "   🎯 Ready for maximum screen utilization",
+                "   📐 Three columns will display side-by-side",
+            ]
         else:
-            print("   ⚠️ Full width requires manual setting")
-            print("   📋 In Notion, click '...' menu → 'Full width'")
-            print("   🔧 API limitation - manual toggle needed")
-        
-        print(f"\n💡 **Client Enhancement**:")
-        print("   🔧 Added set_page_full_width() method to NotionClient")
-        print("   📄 Added set_full_width() method to PagesEndpoint")
-        print("   ⚡ Graceful handling of API limitations")
-        print("   🛠️ Ready for future Notion API updates")
-        
-        print(f"\n🚀 **Usage Example**:")
-        print("   ```python")
-        print("   client = NotionClient.from_env()")
-        print(f"   client.set_page_full_width('{dashboard_page.id}')")
-        print("   ```")
+            width_status = [
+                "   ⚠️ Full width requires manual setting",
+                "   📋 In Notion, click '...' menu → 'Full width'",
+                "   🔧 API limitation - manual toggle needed",
+            ]
+        
+        lines = ["\n🎉 Dashboard Created with Full Width Support!", "=" * 50]
+        lines += [f"🔗 **URL**: {page.url}" for page, _ in created]
+        lines += [
+            "\n✨ **Features**:",
+            "   🖥️ Built-in full width support",
+            "   📐 Three-column layout for wide screens",
+            "   🔗 Clean clickable database links",
+            "   🎨 Proper icon placement",
+            "   ⚡ Integrated full width setting",
+            "\n🖥️ **Full Width Status**:",
+            *width_status,
+            "\n💡 **Client Enhancement**:",
+            "   🔧 Added set_page_full_width() method to NotionClient",
+            "   📄 Added set_full_width() method to PagesEndpoint",
+            "   ⚡ Graceful handling of API limitations",
+            "   🛠️ Ready for future Notion API updates",
+            "\n🚀 **Usage Example**:",
+            "   ```python",
+            "   client = NotionClient.from_env()",
+            f"   client.set_page_full_width('{dashboard_page.id}')",
+            "   ```",
+        ]
+        print("\n".join(lines))
         
-    else:
+    if len(created) < len(parent_page_ids):
         print("❌ Failed to create dashboard")
 
 
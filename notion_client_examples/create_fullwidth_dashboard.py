@@ -10,12 +10,14 @@ This creates a dashboard with:
 
 import sys
 import os
-from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
 
 # Add path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from notion_client import NotionClient
+from notion_client import NotionClient, NotionAPIError
 from notion_client.utils import (
     create_rich_text,
     create_page_parent,
@@ -27,30 +29,22 @@ from notion_client.utils import (
     create_icon,
 )
 
+from _dashboard_layout import (
+    THREE_COLUMN_HEADING_BLOCKS,
+    append_column_overflow,
+    column_list,
+    db_row_block,
+    split_evenly,
+)
+from _database_cache import get_all_databases
 
-def get_all_databases(client: NotionClient):
-    """Get information about all databases in the workspace."""
-    
-    try:
-        databases = client.search.search_databases()
-        
-        db_info = {}
-        for db in databases:
-            title = ""
-            if db.title:
-                title = "".join([t.plain_text for t in db.title])
-            
-            db_info[title] = {
-                'id': db.id,
-                'url': db.url,
-                'icon': db.icon.emoji if db.icon and db.icon.type == 'emoji' else '📄'
-            }
-        
-        return db_info
-        
-    except Exception as e:
-        print(f"❌ Error gathering database info: {e}")
-        return {}
+
+def _set_full_width(client: NotionClient, page_id: str):
+    """Set a page to full width, reporting (not raising) any failure."""
+    if client.set_page_full_width(page_id, full_width=True):
+        print("✅ Set page to full width")
+    else:
+        print("⚠️ Could not set full width (continuing anyway)")
 
 
 def create_fullwidth_dashboard(client: NotionClient, parent_page_id: str, databases: dict):
@@ -58,6 +52,9 @@ def create_fullwidth_dashboard(client: NotionClient, parent_page_id: str, databa
     
     print("🏠 Creating full-width dashboard...")
     
+    # Read the clock once so the header and footer agree
+    now = datetime.now()
+    
     # Page properties - Clean title without emoji
     page_properties = {
         "title": {
@@ -69,257 +66,102 @@ def create_fullwidth_dashboard(client: NotionClient, parent_page_id: str, databa
     header_blocks = [
         create_heading_block("Protocol Manager Dashboard", level=1),
         create_paragraph_block(
-            f"Full-Width Productivity System • {date.today().strftime('%B %d, %Y')} • {len(databases)} Active Databases",
+            f"Full-Width Productivity System • {now.strftime('%B %d, %Y')} • {len(databases)} Active Databases",
             color="gray"
         ),
         create_divider_block(),
     ]
     
     try:
-        # Create the page first with header
-        dashboard_page = client.pages.create(
-            parent=create_page_parent(parent_page_id),
-            properties=page_properties,
-            children=header_blocks,
-            icon=create_icon("emoji", "🏠")
-        )
-        
-        print(f"✅ Dashboard page created: {dashboard_page.id}")
-        
-        # Set page to full width using the page update endpoint
-        # This is a special property that controls the page layout
-        try:
-            # Update the page to full width
-            # Note: This uses an internal API call to set the page format
-            response = client._http_client._request(
-                method="PATCH",
-                endpoint=f"/pages/{dashboard_page.id}",
-                json={
-                    "archived": False,
-                    "properties": {},
-                    # This sets the page to full width
-                    "format": {
-                        "page_full_width": True
-                    }
-                }
+        # Split databases into three columns for better full-width usage,
+        # in order and as evenly as possible (the right column is never
+        # longer than the others)
+        columns = [
+            [heading] + [db_row_block(db_name, db_info) for db_name, db_info in rows]
+            for heading, rows in zip(
+                THREE_COLUMN_HEADING_BLOCKS, split_evenly(list(databases.items()), 3)
             )
-            print("✅ Set page to full width")
-        except Exception as e:
-            print(f"⚠️ Could not set full width (continuing anyway): {e}")
-        
-        # Split databases into three columns for better full-width usage
-        db_list = list(databases.items())
-        col_size = len(db_list) // 3
-        
-        left_dbs = db_list[:col_size]
-        middle_dbs = db_list[col_size:col_size*2]
-        right_dbs = db_list[col_size*2:]
-        
-        # Create left column content
-        left_column_blocks = [
-            {
-                "type": "heading_3",
-                "heading_3": {
-                    "rich_text": [create_rich_text("📅 Calendar & Planning")],
-                    "color": "blue"
-                }
-            }
-        ]
-        
-        # Add left column databases
-        for db_name, db_info in left_dbs:
-            left_column_blocks.append({
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        create_rich_text(f"{db_info['icon']} "),
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": db_name,
-                                "link": {"url": db_info['url']}
-                            },
-                            "annotations": {"bold": True},
-                            "plain_text": db_name
-                        }
-                    ]
-                }
-            })
-        
-        # Create middle column content
-        middle_column_blocks = [
-            {
-                "type": "heading_3",
-                "heading_3": {
-                    "rich_text": [create_rich_text("🎯 Projects & Tasks")],
-                    "color": "green"
-                }
-            }
         ]
         
-        # Add middle column databases
-        for db_name, db_info in middle_dbs:
-            middle_column_blocks.append({
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        create_rich_text(f"{db_info['icon']} "),
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": db_name,
-                                "link": {"url": db_info['url']}
-                            },
-                            "annotations": {"bold": True},
-                            "plain_text": db_name
-                        }
-                    ]
-                }
-            })
-        
-        # Create right column content
-        right_column_blocks = [
-            {
-                "type": "heading_3", 
-                "heading_3": {
-                    "rich_text": [create_rich_text("📊 Personal & Tracking")],
-                    "color": "purple"
-                }
-            }
-        ]
-        
-        # Add right column databases
-        for db_name, db_info in right_dbs:
-            right_column_blocks.append({
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        create_rich_text(f"{db_info['icon']} "),
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": db_name,
-                                "link": {"url": db_info['url']}
-                            },
-                            "annotations": {"bold": True},
-                            "plain_text": db_name
-                        }
-                    ]
-                }
-            })
-        
         # Create the three-column list block
-        column_list_block = {
-            "type": "column_list",
-            "column_list": {
-                "children": [
-                    {
-                        "type": "column",
-                        "column": {
-                            "children": left_column_blocks
-                        }
-                    },
-                    {
-                        "type": "column",
-                        "column": {
-                            "children": middle_column_blocks
-                        }
-                    },
-                    {
-                        "type": "column", 
-                        "column": {
-                            "children": right_column_blocks
-                        }
-                    }
-                ]
-            }
-        }
-        
-        # Add the column layout to the page
-        result = client.blocks.append_children(dashboard_page.id, [column_list_block])
-        print(f"✅ Added three-column layout")
+        column_list_block = column_list(columns)
         
         # Add a quick actions section that spans full width
         quick_actions_blocks = [
             create_divider_block(),
             create_heading_block("⚡ Quick Actions & Status", level=2),
-            {
-                "type": "column_list",
-                "column_list": {
-                    "children": [
-                        {
-                            "type": "column",
-                            "column": {
-                                "children": [
-                                    {
-                                        "type": "callout",
-                                        "callout": {
-                                            "rich_text": [create_rich_text("🌅 Morning: Plan priorities • Schedule time blocks • Review calendar")],
-                                            "icon": {"emoji": "🌅"},
-                                            "color": "yellow"
-                                        }
-                                    }
-                                ]
-                            }
-                        },
-                        {
-                            "type": "column",
-                            "column": {
-                                "children": [
-                                    {
-                                        "type": "callout",
-                                        "callout": {
-                                            "rich_text": [create_rich_text("🎯 Focus: Execute tasks • Track progress • Log activities")],
-                                            "icon": {"emoji": "🎯"},
-                                            "color": "blue"
-                                        }
-                                    }
-                                ]
-                            }
-                        },
-                        {
-                            "type": "column",
-                            "column": {
-                                "children": [
-                                    {
-                                        "type": "callout",
-                                        "callout": {
-                                            "rich_text": [create_rich_text("🌙 Evening: Review progress • Plan tomorrow • Reflect")],
-                                            "icon": {"emoji": "🌙"},
-                                            "color": "purple"
-                                        }
-                                    }
-                                ]
-                            }
-                        }
-                    ]
-                }
-            }
+            column_list([
+                [{
+                    "type": "callout",
+                    "callout": {
+                        "rich_text": [create_rich_text("🌅 Morning: Plan priorities • Schedule time blocks • Review calendar")],
+                        "icon": {"emoji": "🌅"},
+                        "color": "yellow"
+                    }
+                }],
+                [{
+                    "type": "callout",
+                    "callout": {
+                        "rich_text": [create_rich_text("🎯 Focus: Execute tasks • Track progress • Log activities")],
+                        "icon": {"emoji": "🎯"},
+                        "color": "blue"
+                    }
+                }],
+                [{
+                    "type": "callout",
+                    "callout": {
+                        "rich_text": [create_rich_text("🌙 Evening: Review progress • Plan tomorrow • Reflect")],
+                        "icon": {"emoji": "🌙"},
+                        "color": "purple"
+                    }
+                }],
+            ]),
         ]
         
-        client.blocks.append_children(dashboard_page.id, quick_actions_blocks)
-        print(f"✅ Added quick actions section")
-        
         # Add system status footer
         footer_blocks = [
             create_divider_block(),
             create_paragraph_block(
-                f"📊 System Status: ✅ {len(databases)} databases active • 🔗 All systems connected • ⏰ Last updated: {datetime.now().strftime('%H:%M')}",
+                f"📊 System Status: ✅ {len(databases)} databases active • 🔗 All systems connected • ⏰ Last updated: {now.strftime('%H:%M')}",
                 color="gray",
                 italic=True
             )
         ]
         
-        client.blocks.append_children(dashboard_page.id, footer_blocks)
-        print(f"✅ Added system status footer")
+        # Create the page with all of its content in one request. Notion
+        # takes at most 100 blocks per column, so longer columns get the
+        # rest of their rows appended afterwards
+        all_children = header_blocks + [column_list_block] + quick_actions_blocks + footer_blocks
+        dashboard_page = client.pages.create(
+            parent=create_page_parent(parent_page_id),
+            properties=page_properties,
+            children=all_children,
+            icon=create_icon("emoji", "🏠")
+        )
+        append_column_overflow(client, dashboard_page.id, columns)
+        
+        print(f"✅ Dashboard page created: {dashboard_page.id}")
+        
+        _set_full_width(client, dashboard_page.id)
         
         return dashboard_page
         
-    except Exception as e:
+    except NotionAPIError as e:
         print(f"❌ Error creating full-width dashboard: {e}")
         return None
 
 
+def create_dashboards(client: NotionClient, parent_page_ids: list, databases: dict, max_workers: int = 3):
+    """Create a full-width dashboard under each parent page concurrently.
+    
+    The client's rate limiter is shared by every thread, so the combined
+    requests still stay within Notion's rate limit.
+    """
+    build = partial(create_fullwidth_dashboard, client, databases=databases)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(build, parent_page_ids))
+
+
 def main():
     """Main function to create the full-width dashboard."""
     
@@ -343,42 +185,45 @@ def main():
     
     print(f"📊 Found {len(databases)} databases")
     
-    # Use Protocol Home as parent
+    # Use Protocol Home as parent unless parent page IDs are given
     protocol_home_id = "2518f242-f6b7-80c6-ba3a-f6cae6f0809c"
+    parent_page_ids = sys.argv[1:] or [protocol_home_id]
     
-    # Create the full-width dashboard
-    dashboard_page = create_fullwidth_dashboard(client, protocol_home_id, databases)
+    # Create the full-width dashboards, then close the client's HTTP
+    # session; every request above reused its pooled connection
+    with client:
+        dashboard_pages = create_dashboards(client, parent_page_ids, databases)
+    created_pages = [page for page in dashboard_pages if page]
     
-    if dashboard_page:
-        print(f"\n🎉 Full-Width Dashboard Created!")
-        print("=" * 40)
-        print(f"🔗 **URL**: {dashboard_page.url}")
-        print(f"\n✨ **Features**:")
-        print("   🖥️ Full-width page layout")
-        print("   📐 Three-column design for wide screens")
-        print("   🔗 Clean clickable database links")
-        print("   🎨 Proper icon placement (no duplicates)")
-        print("   ⚡ Quick actions spanning full width")
-        print("   📊 System status and metadata")
-        
-        print(f"\n📋 **Three-Column Layout**:")
-        print("   📅 Left: Calendar & Planning")
-        print("   🎯 Middle: Projects & Tasks") 
-        print("   📊 Right: Personal & Tracking")
-        
-        print(f"\n🖥️ **Optimized For**:")
-        print("   💻 Wide desktop monitors")
-        print("   📱 Large tablet landscape")
-        print("   🖼️ Full-screen browser windows")
-        print("   👀 Maximum information density")
-        
-        print(f"\n⚡ **Usage Tips**:")
-        print("   🔍 Bookmark for daily dashboard access")
-        print("   🖱️ Click database names to open instantly")
-        print("   📐 Use in full-screen for best experience")
-        print("   🎯 Quick actions guide daily workflow")
+    if created_pages:
+        lines = ["\n🎉 Full-Width Dashboard Created!", "=" * 40]
+        lines += [f"🔗 **URL**: {dashboard_page.url}" for dashboard_page in created_pages]
+        lines += [
+            "\n✨ **Features**:",
+            "   🖥️ Full-width page layout",
+            "   📐 Three-column design for wide screens",
+            "   🔗 Clean clickable database links",
+            "   🎨 Proper icon placement (no duplicates)",
+            "   ⚡ Quick actions spanning full width",
+            "   📊 System status and metadata",
+            "\n📋 **Three-Column Layout**:",
+            "   📅 Left: Calendar & Planning",
+            "   🎯 Middle: Projects & Tasks",
+            "   📊 Right: Personal & Tracking",
+            "\n🖥️ **Optimized For**:",
+            "   💻 Wide desktop monitors",
+            "   📱 Large tablet landscape",
+            "   🖼️ Full-screen browser windows",
+            "   👀 Maximum information density",
+            "\n⚡ **Usage Tips**:",
+            "   🔍 Bookmark for daily dashboard access",
+            "   🖱️ Click database names to open instantly",
+            "   📐 Use in full-screen for best experience",
+            "   🎯 Quick actions guide daily workflow",
+        ]
+        print("\n".join(lines))
         
-    else:
+    if len(created_pages) < len(parent_page_ids):
         print("❌ Failed to create full-width dashboard")
 
 
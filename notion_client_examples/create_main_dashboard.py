@@ -11,7 +11,7 @@ This script creates a central hub page with:
 
 import sys
 import os
-from datetime import datetime, date, timedelta
+from datetime import datetime, timedelta
 
 # Add path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -74,11 +74,14 @@ def get_all_databases(client: NotionClient):
 def create_dashboard_content(client: NotionClient, databases: dict):
     """Create the content blocks for the main dashboard."""
     
+    # Read the clock once so every timestamp on the page agrees
+    now = datetime.now()
+    
     # Header section
     content_blocks = [
         create_heading_block("🏠 Protocol Manager Dashboard", level=1),
         create_paragraph_block(
-            f"Welcome to your comprehensive productivity system! Last updated: {datetime.now().strftime('%B %d, %Y at %H:%M')}",
+            f"Welcome to your comprehensive productivity system! Last updated: {now.strftime('%B %d, %Y at %H:%M')}",
             italic=True,
             color="gray"
         ),
@@ -88,7 +91,7 @@ def create_dashboard_content(client: NotionClient, databases: dict):
         # Quick Stats Section
         create_heading_block("📊 Quick Overview", level=2),
         create_callout_block(
-            f"🗃️ Total Databases: {len(databases)} | 📅 Today: {date.today().strftime('%A, %B %d, %Y')}",
+            f"🗃️ Total Databases: {len(databases)} | 📅 Today: {now.strftime('%A, %B %d, %Y')}",
             icon="📊",
             color="blue"
         ),
@@ -252,7 +255,7 @@ daily_plan = client.pages.create(
             "This system helps you focus on what matters most."
         ),
         create_paragraph_block(
-            f"Dashboard created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | "
+            f"Dashboard created: {now.strftime('%Y-%m-%d %H:%M:%S')} | "
             f"System Version: 1.0 | "
             f"Databases: {len(databases)}",
             color="gray",
@@ -6,6 +6,8 @@ This script helps you find page IDs that you can use as parent pages.
 
 import sys
 import os
+from functools import lru_cache
+from itertools import islice
 
 # Add the parent directory to the Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -13,38 +15,64 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from notion_client import NotionClient
 
 
-def find_pages(client: NotionClient, query: str = ""):
+@lru_cache(maxsize=32)
+def _search_pages(client: NotionClient, query: str, limit: int):
+    """Fetch up to ``limit`` pages matching ``query``.
+    
+    Search results are paginated, so stopping after ``limit`` pages
+    avoids fetching the rest of the workspace.
+    """
+    results = client.search.iterate_results(
+        query=query,
+        filter_criteria={"value": "page", "property": "object"},
+        page_size=min(limit, 100),
+    )
+    return tuple(islice(results, limit))
+
+
+def _print_pages(page_info: list):
+    """Print the title, ID, URL and parent of each page."""
+    lines = [f"\nFound {len(page_info)} pages:", "-" * 80]
+    for i, page in enumerate(page_info, 1):
+        lines += [
+            f"{i:2d}. {page['title']}",
+            f"    ID: {page['id']}",
+            f"    URL: {page['url']}",
+            f"    Parent: {page['parent_type']} ({page['parent_id']})",
+            "",
+        ]
+    print("\n".join(lines))
+
+
+def find_pages(client: NotionClient, query: str = "", limit: int = 25):
     """Search for pages and display their IDs."""
     
     print(f"🔍 Searching for pages{' with query: ' + query if query else ''}...")
     
     try:
-        # Search for pages
-        if query:
-            results = client.search.search_pages(query=query)
-        else:
-            # Get recent pages (search with no query often returns recent items)
-            results = client.search.search_pages(query="")
+        # Search for pages (search with no query often returns recent items)
+        results = _search_pages(client, query, limit)
         
         if not results:
             print("No pages found.")
             return []
         
-        print(f"\nFound {len(results)} pages:")
-        print("-" * 80)
-        
         page_info = []
-        for i, page in enumerate(results, 1):
+        for page in results:
             # Get page title
             title = "Untitled"
-            if page.properties:
-                for prop_name, prop_data in page.properties.items():
-                    if prop_data.get('type') == 'title' and prop_data.get('title'):
-                        title = "".join([
-                            text.get('plain_text', '') 
-                            for text in prop_data['title']
-                        ])
-                        break
+            title_prop = next(
+                (
+                    prop_data for prop_data in page.properties.values()
+                    if prop_data.get('type') == 'title' and prop_data.get('title')
+                ),
+                None,
+            ) if page.properties else None
+            if title_prop:
+                title = "".join(
+                    text.get('plain_text', '')
+                    for text in title_prop['title']
+                )
             
             # Get parent info
             parent_type = page.parent.type if page.parent else "Unknown"
@@ -64,13 +92,8 @@ def find_pages(client: NotionClient, query: str = ""):
                 'parent_type': parent_type,
                 'parent_id': parent_id
             })
-            
-            print(f"{i:2d}. {title}")
-            print(f"    ID: {page.id}")
-            print(f"    URL: {page.url}")
-            print(f"    Parent: {parent_type} ({parent_id})")
-            print()
         
+        _print_pages(page_info)
         return page_info
         
     except Exception as e:
@@ -89,9 +112,7 @@ def main():
         print(f"❌ Failed to connect: {e}")
         return
     
-    print("\n" + "="*60)
-    print("NOTION PAGE ID FINDER")
-    print("="*60)
+    print("\n" + "="*60 + "\nNOTION PAGE ID FINDER\n" + "="*60)
     
     # Option 1: Search all pages
     print("\n1. Recent/All pages:")
@@ -105,10 +126,8 @@ def main():
             search_results = find_pages(client, query)
     
     # Show instructions
-    print("\n" + "="*60)
-    print("HOW TO USE THESE PAGE IDs:")
-    print("="*60)
-    print("""
+    print("\n" + "="*60 + "\nHOW TO USE THESE PAGE IDs:\n" + "="*60 + """
+
 To create a child page under any of these pages:
 
 1. Copy the Page ID from above
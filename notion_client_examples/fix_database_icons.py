@@ -2,6 +2,7 @@
 Fix duplicate icons in databases by updating database properties.
 """
 
+import re
 import sys
 import os
 
@@ -12,6 +13,67 @@ from notion_client import NotionClient
 from notion_client.utils import create_rich_text
 
 
+# Clean titles without emojis
+CLEAN_TITLES = {
+    "📋 Project Tracker": "Project Tracker",
+    "🎯 Habit Tracker": "Habit Tracker", 
+    "💰 Expense Tracker": "Expense Tracker",
+    "👥 Contacts": "Contacts",
+    "✅ Task Tracker": "Task Tracker",
+    "📅 Calendar Events": "Calendar Events",
+    "⏰ Time Blocks": "Time Blocks",
+    "✅ Todos & Tasks": "Todos & Tasks",
+    "📋 Daily Planning": "Daily Planning"
+}
+
+# Appropriate emojis for database icons
+DATABASE_ICONS = {
+    "Project Tracker": "📋",
+    "Habit Tracker": "🎯",
+    "Expense Tracker": "💰",
+    "Contacts": "👥",
+    "Task Tracker": "✅",
+    "Calendar Events": "📅",
+    "Time Blocks": "⏰",
+    "Todos & Tasks": "📝",
+    "Daily Planning": "📋"
+}
+
+# A leading icon emoji and whatever separates it from the title's text
+_LEADING_EMOJI_RE = re.compile(r"^[📋🎯💰👥✅📅⏰📝]\W*(?=\w)")
+
+
+class _TitleTable(dict):
+    """Map raw database titles to (clean title, icon emoji), filled on first use."""
+    
+    def __missing__(self, title: str):
+        clean_title = CLEAN_TITLES.get(title, title)
+        
+        # Remove any emoji from the beginning of the title
+        match = _LEADING_EMOJI_RE.match(clean_title)
+        if match:
+            clean_title = clean_title[match.end():].strip()
+        
+        entry = self[title] = (clean_title, DATABASE_ICONS.get(clean_title, "📋"))
+        return entry
+
+
+_TITLE_TABLE = _TitleTable()
+
+
+def _describe_icon(icon) -> str:
+    """Describe a database icon for the listing."""
+    if not icon:
+        return "No icon"
+    if icon.type == "emoji":
+        return f"Emoji: {icon.emoji}"
+    if icon.type == "external":
+        return f"External: {icon.external.get('url', 'N/A')}"
+    if icon.type == "file":
+        return f"File: {icon.file.get('url', 'N/A')}"
+    return "No icon"
+
+
 def list_current_databases(client: NotionClient):
     """List current databases and their icons."""
     
@@ -25,39 +87,27 @@ def list_current_databases(client: NotionClient):
             print("No databases found")
             return []
         
-        print(f"\nFound {len(databases)} databases:")
-        print("-" * 60)
-        
-        db_info = []
-        for i, db in enumerate(databases, 1):
-            # Get database title
-            title = ""
-            if db.title:
-                title = "".join([t.plain_text for t in db.title])
-            
-            # Check icon
-            icon_info = "No icon"
-            if db.icon:
-                if db.icon.type == "emoji":
-                    icon_info = f"Emoji: {db.icon.emoji}"
-                elif db.icon.type == "external":
-                    icon_info = f"External: {db.icon.external.get('url', 'N/A')}"
-                elif db.icon.type == "file":
-                    icon_info = f"File: {db.icon.file.get('url', 'N/A')}"
-            
-            print(f"{i:2d}. {title}")
-            print(f"    ID: {db.id}")
-            print(f"    Icon: {icon_info}")
-            print(f"    URL: {db.url}")
-            print()
-            
-            db_info.append({
-                'title': title,
+        db_info = [
+            {
+                'title': "".join(t.plain_text for t in db.title),
                 'id': db.id,
                 'icon': db.icon,
                 'url': db.url
-            })
+            }
+            for db in databases
+        ]
         
+        lines = [f"\nFound {len(databases)} databases:", "-" * 60]
+        for i, info in enumerate(db_info, 1):
+            lines += [
+                f"{i:2d}. {info['title']}",
+                f"    ID: {info['id']}",
+                f"    Icon: {_describe_icon(info['icon'])}",
+                f"    URL: {info['url']}",
+                "",
+            ]
+        
+        print("\n".join(lines))
         return db_info
         
     except Exception as e:
@@ -65,55 +115,22 @@ def list_current_databases(client: NotionClient):
         return []
 
 
-def fix_database_icons(client: NotionClient, database_info: list):
-    """Remove emoji icons from database titles and clean up formatting."""
+def fix_database_icons(client: NotionClient, database_info: list, max_workers: int = 3):
+    """Remove emoji icons from database titles and clean up formatting.
     
-    print(f"\n🔧 Fixing database icons...")
+    The updates are worked out first and then sent together with
+    ``databases.batch_update``.
+    """
     
-    # Define clean titles without emojis
-    clean_titles = {
-        "📋 Project Tracker": "Project Tracker",
-        "🎯 Habit Tracker": "Habit Tracker", 
-        "💰 Expense Tracker": "Expense Tracker",
-        "👥 Contacts": "Contacts",
-        "✅ Task Tracker": "Task Tracker",
-        "📅 Calendar Events": "Calendar Events",
-        "⏰ Time Blocks": "Time Blocks",
-        "✅ Todos & Tasks": "Todos & Tasks",
-        "📋 Daily Planning": "Daily Planning"
-    }
-    
-    # Define appropriate emojis for database icons
-    database_icons = {
-        "Project Tracker": "📋",
-        "Habit Tracker": "🎯",
-        "Expense Tracker": "💰",
-        "Contacts": "👥",
-        "Task Tracker": "✅",
-        "Calendar Events": "📅",
-        "Time Blocks": "⏰",
-        "Todos & Tasks": "📝",
-        "Daily Planning": "📋"
-    }
+    print(f"\n🔧 Fixing database icons...")
     
-    updated_count = 0
+    pending = []
     
     for db_info in database_info:
         current_title = db_info['title']
         
-        # Determine clean title
-        clean_title = clean_titles.get(current_title, current_title)
-        
-        # Remove any emoji from the beginning of the title
-        if clean_title.startswith(('📋', '🎯', '💰', '👥', '✅', '📅', '⏰', '📝')):
-            # Find where the emoji ends and text begins
-            for i, char in enumerate(clean_title):
-                if char.isalpha() or char.isdigit():
-                    clean_title = clean_title[i:].strip()
-                    break
-        
-        # Get appropriate icon
-        icon_emoji = database_icons.get(clean_title, "📋")
+        # Determine clean title and appropriate icon
+        clean_title, icon_emoji = _TITLE_TABLE[current_title]
         
         # Update the database if needed
         needs_update = False
@@ -136,15 +153,24 @@ def fix_database_icons(client: NotionClient, database_info: list):
             print(f"   🎨 Setting icon: {icon_emoji}")
         
         if needs_update:
-            try:
-                client.databases.update(db_info['id'], **update_data)
-                print(f"   ✅ Updated: {clean_title}")
-                updated_count += 1
-            except Exception as e:
-                print(f"   ❌ Error updating {clean_title}: {e}")
+            pending.append((db_info, clean_title, update_data))
         else:
             print(f"   ✨ Already clean: {clean_title}")
     
+    # Send the updates, reporting the results in the order planned above
+    results = client.databases.batch_update(
+        [(db_info['id'], update_data) for db_info, _, update_data in pending],
+        max_workers=max_workers,
+    )
+    
+    updated_count = 0
+    for (_, clean_title, _), result in zip(pending, results):
+        if isinstance(result, Exception):
+            print(f"   ❌ Error updating {clean_title}: {result}")
+        else:
+            print(f"   ✅ Updated: {clean_title}")
+            updated_count += 1
+    
     return updated_count
 
 
@@ -4,6 +4,7 @@ Simple demonstration of creating and using a tracking database.
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 
 # Add path for imports
@@ -110,18 +111,25 @@ def add_sample_tasks(client: NotionClient, database_id: str):
         }
     ]
     
+    def create_task(task_data):
+        return client.pages.create(
+            parent={"type": "database_id", "database_id": database_id},
+            properties=task_data
+        )
+    
+    # The tasks are independent, so their requests overlap; the client's
+    # rate limiter is shared by every thread
     created_tasks = []
-    for i, task_data in enumerate(sample_tasks, 1):
-        try:
-            task = client.pages.create(
-                parent={"type": "database_id", "database_id": database_id},
-                properties=task_data
-            )
-            task_title = task_data["Task"]["title"][0]["text"]["content"]
-            print(f"   ✅ Added: {task_title}")
-            created_tasks.append(task)
-        except Exception as e:
-            print(f"   ❌ Error adding task {i}: {e}")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(create_task, task_data) for task_data in sample_tasks]
+        for i, (future, task_data) in enumerate(zip(futures, sample_tasks), 1):
+            try:
+                task = future.result()
+                task_title = task_data["Task"]["title"][0]["text"]["content"]
+                print(f"   ✅ Added: {task_title}")
+                created_tasks.append(task)
+            except Exception as e:
+                print(f"   ❌ Error adding task {i}: {e}")
     
     return created_tasks
 
@@ -39,6 +39,7 @@ setup(
     extras_require={
         "async": ["httpx>=0.25.0"],
         "cli": ["rich>=13.0.0", "click>=8.1.0"],
+        "fast": ["orjson>=3.9.0"],
         "dev": [
             "black>=23.0.0",
             "isort>=5.12.0",
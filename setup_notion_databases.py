@@ -506,8 +506,12 @@ def add_sample_data(notion_client, goals_db_id, todos_db_id, calendar_db_id):
         console.print(f"⚠️ [yellow]Warning: Could not add sample data: {str(e)}[/yellow]")
 
 
-def main():
-    """Main setup function."""
+def main() -> int:
+    """Main setup function.
+    
+    Returns:
+        Process exit code: 0 on success, 1 if a database could not be created
+    """
     
     console.print(Panel.fit(
         "🏠 [bold blue]Protocol Home Database Setup[/bold blue]\n"
@@ -540,7 +544,7 @@ def main():
         
         if not goals_db_id:
             console.print("❌ [red]Failed to create Goals database[/red]")
-            sys.exit(1)
+            return 1
         
         # Create Todos database
         task2 = progress.add_task("Creating Todos database...", total=None)
@@ -549,7 +553,7 @@ def main():
         
         if not todos_db_id:
             console.print("❌ [red]Failed to create Todos database[/red]")
-            sys.exit(1)
+            return 1
         
         # Create Calendar database
         task3 = progress.add_task("Creating Calendar database...", total=None)
@@ -558,7 +562,7 @@ def main():
         
         if not calendar_db_id:
             console.print("❌ [red]Failed to create Calendar database[/red]")
-            sys.exit(1)
+            return 1
         
         # Add database relations
         task4 = progress.add_task("Adding database relations...", total=None)
@@ -625,7 +629,9 @@ NOTION_CALENDAR_DATABASE_ID={calendar_db_id}
     console.print("4. View your databases in Notion using the URLs above")
     console.print("5. The databases now have relation properties linking Goals and Todos!")
     console.print("6. Use 'Related Goals' in Todos and 'Related Todos' in Goals to create links")
+    
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
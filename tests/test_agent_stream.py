@@ -0,0 +1,80 @@
+"""
+Tests for BaseProtocolAgent.stream.
+
+The agent executor is replaced by a fake that drives the callbacks the
+way a tool-calling run does, so these need no OpenAI access.
+"""
+
+from uuid import uuid4
+
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from agents.base_agent import BaseProtocolAgent
+
+
+def llm_call(handler, tokens, tool_calls=()):
+    run_id = uuid4()
+    for token in tokens:
+        handler.on_llm_new_token(token, run_id=run_id)
+    message = AIMessage(content="".join(tokens), tool_calls=list(tool_calls))
+    handler.on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]), run_id=run_id)
+
+
+class FakeExecutor:
+    def __init__(self, calls, output="done", error=None):
+        self.calls = calls
+        self.output = output
+        self.error = error
+
+    def invoke(self, inputs, config):
+        handler = config["callbacks"][0]
+        for tokens, tool_calls in self.calls:
+            llm_call(handler, tokens, tool_calls)
+        if self.error:
+            raise self.error
+        return {"output": self.output}
+
+
+class StubAgent(BaseProtocolAgent):
+    def _setup_tools(self):
+        return []
+
+    def _get_system_prompt(self):
+        return ""
+
+
+def make_agent(executor):
+    # Skip __init__, which needs an OpenAI key
+    agent = object.__new__(StubAgent)
+    agent.agent_executor = executor
+    agent.verbose = False
+    return agent
+
+
+TOOL_CALL = {"name": "get_tasks", "args": {}, "id": "call_1"}
+
+
+class TestStream:
+    """Test cases for BaseProtocolAgent.stream."""
+
+    def test_text_before_a_tool_call_is_dropped(self):
+        agent = make_agent(FakeExecutor([
+            (["Let me ", "check."], [TOOL_CALL]),
+            (["You have ", "3 tasks."], []),
+        ]))
+
+        assert "".join(agent.stream("tasks?")) == "You have 3 tasks."
+
+    def test_output_is_yielded_when_nothing_streamed(self):
+        agent = make_agent(FakeExecutor([([], [TOOL_CALL])], output="From the tool"))
+
+        assert list(agent.stream("tasks?")) == ["From the tool"]
+
+    def test_error_is_yielded_after_streamed_text(self):
+        agent = make_agent(FakeExecutor([(["Partial"], [])], error=RuntimeError("boom")))
+
+        chunks = list(agent.stream("tasks?"))
+
+        assert chunks[0] == "Partial"
+        assert chunks[-1].endswith("An error occurred while processing your request: boom")
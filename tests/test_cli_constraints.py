@@ -0,0 +1,61 @@
+"""
+Tests for the `schedule` constraint commands.
+
+The commands run against a stub coordinator holding real
+SchedulingConstraints, so they need no Notion or OpenAI access.
+"""
+
+import importlib
+from types import SimpleNamespace
+
+import pytest
+from click.testing import CliRunner
+
+from agents.schedule_agent import SchedulingConstraints
+from cli import llm_cache
+
+
+# cli re-exports main(), so fetch the module itself
+main = importlib.import_module("cli.main")
+
+
+class StubScheduleAgent:
+    def __init__(self):
+        self.scheduling_constraints = SchedulingConstraints()
+
+    def update_monthly_constraints(self, month, constraints):
+        self.scheduling_constraints.update_monthly_constraints(month, constraints)
+
+
+@pytest.fixture
+def coordinator(tmp_path, monkeypatch):
+    # The commands clear the response caches; keep them out of ~/.protocol
+    monkeypatch.setattr(llm_cache, "DEFAULT_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(llm_cache, "DEFAULT_SEMANTIC_CACHE_PATH", str(tmp_path / "semcache.npz"))
+    return SimpleNamespace(schedule_agent=StubScheduleAgent())
+
+
+def invoke(coordinator, *args):
+    return CliRunner().invoke(main.protocol_cli, ["schedule", *args], obj={"coordinator": coordinator})
+
+
+def test_update_constraints_shows_the_new_adjustment(coordinator):
+    result = invoke(coordinator, "update-constraints", "--month", "March", "--buffer-time", "15")
+
+    assert result.exit_code == 0
+    assert "Updated constraints for March" in result.output
+    assert "Error" not in result.output
+    assert "March" in result.output.split("Monthly Adjustments")[1]
+    assert coordinator.schedule_agent.scheduling_constraints.monthly_adjustments == {
+        "march": {"working_hours": {"buffer_time": 15}}
+    }
+
+
+def test_reset_constraints_clears_the_adjustment(coordinator):
+    invoke(coordinator, "update-constraints", "--month", "March", "--buffer-time", "15")
+    result = invoke(coordinator, "reset-constraints", "--month", "March")
+
+    assert result.exit_code == 0
+    assert "Error" not in result.output
+    assert "None configured" in result.output
+    assert coordinator.schedule_agent.scheduling_constraints.monthly_adjustments == {}
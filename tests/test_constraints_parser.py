@@ -0,0 +1,121 @@
+"""
+Tests for the Goals & Rules parsers in the CLI.
+
+The expected values are what the previous line-by-line
+parse_scheduling_constraints returned for the same content, so these
+tests pin the single-scan parser to the old behaviour.
+"""
+
+import importlib
+
+
+# cli re-exports main(), so fetch the module itself
+main = importlib.import_module("cli.main")
+
+
+SAMPLE_CONTENT = """# Goals & Rules
+
+Core Hours: 9:00 AM - 6:00 PM (team calendar, not a constraint)
+
+## Scheduling Constraints
+
+### Working Hours
+- Core Hours: Monday-Friday, 7:30 AM - 4:15 PM CT
+- Buffer Time: Requires 15-minute buffers between all scheduled blocks
+- Transit: Specifies that it takes 25 minutes to get to work
+- No Double-Booking: Never overlap events
+
+### Health-Optimized Timing
+- ML Deep Work: Best in the afternoon
+- Strength Training: Recommended for late afternoon (4-6 PM)
+- Cardio: Evening runs
+- Meditation: Use as a transition between blocks
+
+### Recovery & Rest
+- Strength Training: Requires a minimum 72-hour rest between major muscle groups
+- Cardio: Counts as active recovery
+- Sleep Protection: No intense exercise within 2 hours of target bedtime
+
+## Priority Hierarchy
+- Sleep Protection: within 9 hours
+- Buffer Time: 99-minute
+"""
+
+SAMPLE_CONSTRAINTS = {
+    "working_hours": {
+        "core_hours": {"start": "07:30", "end": "16:15", "timezone": "CT"},
+        "buffer_time": 15,
+        "transit_time": 25,
+        "no_double_booking": True
+    },
+    "health_optimized_timing": {
+        "ml_deep_work": "afternoon",
+        "strength_training": "16:00-18:00",
+        "cardio": "evening",
+        "meditation": "transition"
+    },
+    "recovery_rest": {
+        "strength_training_rest": 72,
+        "cardio_active_recovery": True,
+        "sleep_protection": 2
+    }
+}
+
+DEFAULT_CONSTRAINTS = {
+    "working_hours": {
+        "core_hours": {"start": "08:00", "end": "17:00", "timezone": "CT"},
+        "buffer_time": 10,
+        "transit_time": 30,
+        "no_double_booking": True
+    },
+    "health_optimized_timing": {
+        "ml_deep_work": "morning",
+        "strength_training": "15:00-17:00",
+        "cardio": "flexible",
+        "meditation": "flexible"
+    },
+    "recovery_rest": {
+        "strength_training_rest": 48,
+        "cardio_active_recovery": True,
+        "sleep_protection": 3
+    }
+}
+
+
+class TestParseSchedulingConstraints:
+    """Test cases for parse_scheduling_constraints and parse_all."""
+
+    def test_sample_section(self):
+        assert main.parse_scheduling_constraints(SAMPLE_CONTENT).to_dict() == SAMPLE_CONSTRAINTS
+
+    def test_missing_section_uses_defaults(self):
+        assert main.parse_scheduling_constraints("").to_dict() == DEFAULT_CONSTRAINTS
+        assert main.parse_scheduling_constraints(
+            "Core Hours: 9:00 AM - 5:00 PM\nBuffer Time: 5-minute"
+        ).to_dict() == DEFAULT_CONSTRAINTS
+
+    def test_last_match_in_section_wins(self):
+        content = "\n".join([
+            "## Scheduling Constraints",
+            "### Working Hours",
+            "- Core Hours: 12:00 AM - 12:30 PM",
+            "- Buffer Time: 5-minute",
+            "- Buffer Time: 20-minute",
+            "### Recovery & Rest",
+            "- Sleep Protection: within 4 hours",
+            "- Sleep Protection: within 1 hour",
+            "## Goals",
+            "- Sleep Protection: within 8 hours",
+        ])
+        constraints = main.parse_scheduling_constraints(content)
+
+        assert (constraints.core_start, constraints.core_end) == ("00:00", "12:30")
+        assert constraints.buffer_time == 20
+        assert constraints.sleep_protection == 1
+
+    def test_parse_all_matches_the_separate_parsers(self):
+        goals, todos, constraints = main.parse_all(SAMPLE_CONTENT)
+
+        assert goals == main.parse_goals_from_content(SAMPLE_CONTENT)
+        assert todos == main.parse_todos_from_content(SAMPLE_CONTENT)
+        assert constraints.to_dict() == SAMPLE_CONSTRAINTS
@@ -0,0 +1,77 @@
+"""
+Tests for the block builders shared by the dashboard scripts.
+
+These use a fake client, so they run without Notion access.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "notion_client_examples"))
+
+from _dashboard_layout import (
+    MAX_CHILDREN_PER_REQUEST,
+    append_column_overflow,
+    column_list,
+    split_evenly,
+)
+
+
+def paragraphs(count):
+    return [{"type": "paragraph", "paragraph": {"rich_text": []}, "n": i} for i in range(count)]
+
+
+class FakeBlocks:
+    def __init__(self, page_children):
+        self.page_children = page_children
+        self.appended = []
+
+    def get_all_children(self, block_id):
+        return self.page_children[block_id]
+
+    def append_children(self, block_id, children):
+        self.appended.append((block_id, children))
+
+
+class TestSplitEvenly:
+    """Test cases for split_evenly."""
+
+    def test_sizes_differ_by_at_most_one(self):
+        assert [len(part) for part in split_evenly(list(range(4)), 3)] == [2, 1, 1]
+        assert [len(part) for part in split_evenly(list(range(7)), 3)] == [3, 2, 2]
+        assert split_evenly([], 3) == [[], [], []]
+
+    def test_keeps_order(self):
+        assert sum(split_evenly(list(range(350)), 3), []) == list(range(350))
+
+
+class TestColumnList:
+    """Test cases for column_list and append_column_overflow."""
+
+    def test_columns_are_capped_at_the_request_limit(self):
+        columns = split_evenly(paragraphs(350), 3)
+        block = column_list(columns)
+
+        sizes = [len(column["column"]["children"]) for column in block["column_list"]["children"]]
+        assert sizes == [MAX_CHILDREN_PER_REQUEST] * 3
+
+    def test_overflow_is_appended_to_each_column_in_chunks(self):
+        columns = [paragraphs(250), paragraphs(100), paragraphs(101)]
+        blocks = FakeBlocks({
+            "page": [SimpleNamespace(id="heading", type="heading_1"), SimpleNamespace(id="list", type="column_list")],
+            "list": [SimpleNamespace(id=f"col{i}", type="column") for i in range(3)],
+        })
+
+        append_column_overflow(SimpleNamespace(blocks=blocks), "page", columns)
+
+        assert [(block_id, len(children)) for block_id, children in blocks.appended] == [
+            ("col0", 100), ("col0", 50), ("col2", 1),
+        ]
+        assert blocks.appended[0][1] == columns[0][100:200]
+        assert all(len(children) <= MAX_CHILDREN_PER_REQUEST for _, children in blocks.appended)
+
+    def test_nothing_is_requested_when_every_column_fits(self):
+        blocks = FakeBlocks({})
+        append_column_overflow(SimpleNamespace(blocks=blocks), "page", [paragraphs(100), paragraphs(3)])
+        assert blocks.appended == []
@@ -0,0 +1,40 @@
+"""
+Tests for _extract_uuid, which reads the ID of a page the agents just
+created from their response text.
+"""
+
+import importlib
+
+import pytest
+
+
+# cli re-exports main(), so fetch the module itself
+main = importlib.import_module("cli.main")
+
+
+class TestExtractUuid:
+    """Test cases for _extract_uuid."""
+
+    UUID = "1a2b3c4d-5e6f-4a8b-9c0d-1e2f3a4b5c6d"
+
+    @pytest.mark.parametrize("text", [
+        "✅ Goal created. Goal ID: 1a2b3c4d-5e6f-4a8b-9c0d-1e2f3a4b5c6d",
+        "Goal ID: 1A2B3C4D-5E6F-4A8B-9C0D-1E2F3A4B5C6D\nDone.",
+        "Goal ID: 1a2b3c4d5e6f4a8b9c0d1e2f3a4b5c6d",
+        "Goal ID: `1a2b3c4d5e6f4a8b9c0d1e2f3a4b5c6d`.",
+        "Goal ID: https://www.notion.so/1a2b3c4d5e6f4a8b9c0d1e2f3a4b5c6d",
+        "Goal ID: https://www.notion.so/workspace/Learn-ML-1a2b3c4d5e6f4a8b9c0d1e2f3a4b5c6d?pvs=4",
+        "Goal ID: https://www.notion.so/1a2b3c4d-5e6f-4a8b-9c0d-1e2f3a4b5c6d#heading",
+    ])
+    def test_accepted_forms(self, text):
+        assert main._extract_uuid(text, "Goal ID: ") == self.UUID
+
+    @pytest.mark.parametrize("text", [
+        "Goal created.",
+        "Goal ID: ",
+        "Goal ID: pending",
+        "Goal ID: 1a2b3c4d-5e6f",
+        "Todo ID: 1a2b3c4d-5e6f-4a8b-9c0d-1e2f3a4b5c6d",
+    ])
+    def test_missing_or_invalid_id(self, text):
+        assert main._extract_uuid(text, "Goal ID: ") is None
@@ -0,0 +1,179 @@
+"""
+Tests for the coordinator response cache.
+
+These tests use a throwaway SQLite file and a fake coordinator, so they
+run without Notion or OpenAI access.
+"""
+
+import importlib
+from datetime import date
+
+import pytest
+from click.testing import CliRunner
+
+from cli import llm_cache
+from cli.llm_cache import CachedCoordinator, ResponseCache, cache_key, clear_cached_responses, is_mutating
+from cli.semantic_cache import temporal_signature
+
+
+class FakeClock:
+    """Stand-in for time.time that only moves when told to."""
+
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeCoordinator:
+    """Coordinator that records requests and answers with a counter."""
+
+    def __init__(self) -> None:
+        self.requests = []
+
+    def process_request(self, user_input: str) -> str:
+        self.requests.append(user_input)
+        return f"answer {len(self.requests)}"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(llm_cache.time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"), ttl=60, max_entries=2)
+    yield cache
+    cache.close()
+
+
+class TestCacheKey:
+    """Test cases for cache_key."""
+
+    def test_case_and_whitespace_are_ignored(self):
+        today = date(2025, 3, 1)
+        assert cache_key("What's due today?", today) == cache_key("  what's   DUE\ttoday? ", today)
+
+    def test_different_requests_differ(self):
+        today = date(2025, 3, 1)
+        assert cache_key("show my goals", today) != cache_key("show my todos", today)
+
+    def test_key_changes_with_the_date(self):
+        assert cache_key("what's due today", date(2025, 3, 1)) != cache_key("what's due today", date(2025, 3, 2))
+
+
+class TestIsMutating:
+    """Test cases for is_mutating."""
+
+    @pytest.mark.parametrize("request_text", [
+        "Add a todo to buy milk",
+        "Archive the ML goal",
+        "Reschedule my gym session to 5pm",
+        "Cancel my 3pm meeting",
+        "Book 2 hours for ML",
+        "I finished the reading task",
+        "I'm done with the reading task",
+        "Prioritize the ML goal",
+        "Plan my week",
+        "Schedule a gym session at 5pm",
+    ])
+    def test_write_requests(self, request_text):
+        assert is_mutating(request_text)
+
+    @pytest.mark.parametrize("request_text", [
+        "Show my goals",
+        "What's on my schedule today?",
+        "How am I doing on my goals?",
+        "List my todos",
+    ])
+    def test_read_only_requests(self, request_text):
+        assert not is_mutating(request_text)
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache expiry and eviction."""
+
+    def test_entries_expire_after_ttl(self, cache, clock):
+        cache.set("a", "response")
+        clock.now += 59
+        assert cache.get("a") == "response"
+        clock.now += 2
+        assert cache.get("a") is None
+
+    def test_least_recently_used_entry_is_evicted(self, cache, clock):
+        cache.set("a", "1")
+        clock.now += 1
+        cache.set("b", "2")
+        clock.now += 1
+        assert cache.get("a") == "1"
+        clock.now += 1
+        cache.set("c", "3")
+
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+    def test_clear_cached_responses_empties_both_caches(self, cache, tmp_path):
+        semantic_path = tmp_path / "semcache.npz"
+        semantic_path.write_bytes(b"")
+        cache.set("a", "1")
+        clear_cached_responses(cache.path, str(semantic_path))
+        assert cache.get("a") is None
+        assert not semantic_path.exists()
+
+
+class TestTemporalSignature:
+    """Test cases for the semantic cache's date check."""
+
+    def test_different_days_do_not_match(self):
+        today = temporal_signature("What is on my schedule today?")
+        assert today != temporal_signature("What is on my schedule tomorrow?")
+        assert today != temporal_signature("What is on my schedule this week?")
+
+    def test_different_numbers_do_not_match(self):
+        assert temporal_signature("Plan 3 tasks") != temporal_signature("Plan 5 tasks")
+
+    def test_rephrasing_keeps_the_signature(self):
+        assert temporal_signature("Show me today's tasks") == temporal_signature("What are my tasks for today")
+
+
+class TestCachedCoordinator:
+    """Test cases for CachedCoordinator."""
+
+    def test_read_only_requests_are_served_from_cache(self, cache):
+        coordinator = CachedCoordinator(FakeCoordinator(), cache)
+        assert coordinator.process_request("Show my goals") == "answer 1"
+        assert coordinator.process_request("show  my goals") == "answer 1"
+        assert len(coordinator.coordinator.requests) == 1
+
+    def test_mutating_requests_bypass_and_clear_the_cache(self, cache):
+        coordinator = CachedCoordinator(FakeCoordinator(), cache)
+        coordinator.process_request("Show my goals")
+        assert coordinator.process_request("Add a todo to buy milk") == "answer 2"
+        assert coordinator.process_request("Show my goals") == "answer 3"
+
+
+def test_writing_cli_command_clears_the_cache(tmp_path, monkeypatch):
+    # cli re-exports main(), so fetch the module itself
+    main = importlib.import_module("cli.main")
+
+    path = str(tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(llm_cache, "DEFAULT_CACHE_PATH", path)
+    monkeypatch.setattr(llm_cache, "DEFAULT_SEMANTIC_CACHE_PATH", str(tmp_path / "semcache.npz"))
+    cache = ResponseCache(path)
+    cache.set("a", "1")
+
+    class FakeTodoAgent:
+        def add_task(self, **kwargs):
+            return "added"
+
+    monkeypatch.setattr(main, "_todo_agent", FakeTodoAgent)
+    result = CliRunner().invoke(main.protocol_cli, ["todo", "add", "Buy milk"])
+
+    assert result.exit_code == 0
+    assert cache.get("a") is None
+    cache.close()
@@ -5,6 +5,7 @@ This module contains specialized tools for creating, updating, and managing
 todos and tasks in the Protocol Home system.
 """
 
+from datetime import date
 from typing import Type, Optional, List
 from pydantic import BaseModel, Field
 from .base_tool import BaseNotionTool
@@ -169,6 +170,22 @@ class GetTodosTool(BaseNotionTool):
                     "select": {"equals": project}
                 })
             
+            if due_today:
+                filter_conditions.append({
+                    "property": "Due Date",
+                    "date": {"equals": date.today().isoformat()}
+                })
+            
+            if overdue:
+                filter_conditions.append({
+                    "property": "Due Date",
+                    "date": {"before": date.today().isoformat()}
+                })
+                filter_conditions.append({
+                    "property": "Completed",
+                    "checkbox": {"equals": False}
+                })
+            
             # Build query
             query = {
                 "database_id": self.todos_database_id,
@@ -181,9 +198,9 @@ class GetTodosTool(BaseNotionTool):
             
             if filter_conditions:
                 if len(filter_conditions) == 1:
-                    query["filter"] = filter_conditions[0]
+                    query["filter_criteria"] = filter_conditions[0]
                 else:
-                    query["filter"] = {"and": filter_conditions}
+                    query["filter_criteria"] = {"and": filter_conditions}
             
             response = self.notion_client.databases.query(**query)
             todos = response.get("results", [])